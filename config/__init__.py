@@ -4,11 +4,63 @@ Site configuration loader.
 
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
+try:
+    from jsonschema import Draft202012Validator
+except ImportError:
+    Draft202012Validator = None  # Validation is skipped without jsonschema
+
 logger = logging.getLogger(__name__)
 
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+# Schema for config/sites.json; unknown keys are allowed so new scraper
+# options don't need a schema change first
+SITES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "sites": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "scraper"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "scraper": {"type": "string"},
+                    "enabled": {"type": "boolean"},
+                    "min_delay": {"type": "number", "minimum": 0},
+                    "max_delay": {"type": "number", "minimum": 0},
+                    "max_listings": {"type": "integer", "minimum": 0},
+                    "max_search_results": {"type": "integer", "minimum": 0},
+                    "scrape_url": {"anyOf": [{"type": "string"}, _STRING_LIST]},
+                    "allowed_states": _STRING_LIST,
+                    "landing_urls": _STRING_LIST,
+                    "landing_search_queries": _STRING_LIST,
+                    "landing_allowlist": _STRING_LIST,
+                    "landing_blacklist": _STRING_LIST,
+                    "landing_allowed_states": _STRING_LIST,
+                },
+            },
+        },
+        "thanks_io": {"type": "object"},
+        "export": {"type": "object"},
+    },
+}
+
+# Compiled once and reused for every load
+_VALIDATOR = Draft202012Validator(SITES_SCHEMA) if Draft202012Validator else None
+
+# Parsed configs keyed by resolved path, tagged with (mtime_ns, size) so an
+# edited file is re-read
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict]] = {}
+
 
 class SiteConfig:
     """Manages configuration for scraper sites."""
@@ -21,16 +73,45 @@ class SiteConfig:
             config_file: Path to sites.json configuration file
         """
         self.config_file = Path(config_file)
-        self.sites = self._load_config()
+        self._sites = None
+        self._by_scraper = None
+
+    @property
+    def sites(self) -> Dict:
+        """Site configuration, loaded from disk on first access."""
+        if self._sites is None:
+            self._sites = self._load_config()
+        return self._sites
+
+    def _site_index(self) -> Dict[str, Dict]:
+        """Map scraper name to site entry, keeping the first entry per scraper."""
+        if self._by_scraper is None:
+            index = {}
+            for site in self.sites.get('sites', []):
+                index.setdefault(site.get('scraper'), site)
+            self._by_scraper = index
+        return self._by_scraper
 
     def _load_config(self) -> Dict:
         """Load configuration from JSON file."""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    logger.info(f"Loaded configuration from {self.config_file}")
-                    return config
+                cache_key = self.config_file.resolve()
+                stat = cache_key.stat()
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                cached = _CONFIG_CACHE.get(cache_key)
+                if cached and cached[0] == stamp:
+                    logger.debug(f"Using cached configuration for {self.config_file}")
+                    return cached[1]
+
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                config = orjson.loads(data) if orjson else json.loads(data)
+                if _VALIDATOR is not None:
+                    _VALIDATOR.validate(config)
+                _CONFIG_CACHE[cache_key] = (stamp, config)
+                logger.info(f"Loaded configuration from {self.config_file}")
+                return config
             except Exception as e:
                 logger.error(f"Error loading config file {self.config_file}: {e}")
                 return self._get_default_config()
@@ -83,21 +164,24 @@ class SiteConfig:
 
     def get_site(self, scraper_name: str) -> Optional[Dict]:
         """Get configuration for a specific scraper."""
-        for site in self.sites.get('sites', []):
-            if site.get('scraper') == scraper_name:
-                return site
-        return None
+        return self._site_index().get(scraper_name)
 
     def is_site_enabled(self, scraper_name: str) -> bool:
         """Check if a scraper is enabled."""
         site = self.get_site(scraper_name)
-        return site.get('enabled', False) if site else False
+        return bool(site and site.get('enabled', False))
 
     def save_config(self) -> None:
         """Save current configuration to file."""
+        # Resolve the lazily loaded config before the file is truncated
+        sites = self.sites
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_file, 'w') as f:
-            json.dump(self.sites, f, indent=2)
+        if orjson:
+            with open(self.config_file, 'wb') as f:
+                f.write(orjson.dumps(sites, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.config_file, 'w') as f:
+                json.dump(sites, f, indent=2)
         logger.info(f"Configuration saved to {self.config_file}")
 
 
@@ -26,6 +26,9 @@ RETRY_BACKOFF = float(os.environ.get('RETRY_BACKOFF', '2.0'))
 # Rate limiting
 MAX_REQUESTS_PER_MINUTE = int(os.environ.get('MAX_REQUESTS_PER_MINUTE', '60'))
 
+# Number of scrapers run concurrently by the scrape command
+SCRAPER_WORKERS = int(os.environ.get('SCRAPER_WORKERS', '4'))
+
 # Playwright (for JS-rendered pages)
 HEADLESS = os.environ.get('HEADLESS', 'true').lower() == 'true'
 PLAYWRIGHT_TIMEOUT = int(os.environ.get('PLAYWRIGHT_TIMEOUT', '30000'))
@@ -6,6 +6,9 @@ Provides commands to scrape FSBO listings, export to CSV, and manage data.
 
 import click
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -13,7 +16,7 @@ from typing import Optional
 from utils.logger import setup_logging
 from config.settings import (
     DATABASE_PATH, EXPORT_DIR, LOG_LEVEL, LOG_FILE,
-    MIN_REQUEST_DELAY, MAX_REQUEST_DELAY
+    MIN_REQUEST_DELAY, MAX_REQUEST_DELAY, SCRAPER_WORKERS
 )
 from config import SiteConfig
 from storage import FSBODatabase
@@ -22,13 +25,16 @@ from scrapers import FSBOComScraper, ByOwnerComScraper, RealtyLessComScraper, Be
 # Setup logging
 logger = setup_logging(log_level=LOG_LEVEL, log_file=LOG_FILE)
 
+# Normalized listings always carry these keys (see BaseScraper._normalize_listing)
+_address_fields = itemgetter('street', 'city', 'state', 'zip_code')
+
 
 class ScraperContext:
     """Context object for CLI commands."""
 
     def __init__(self):
         """Initialize context."""
-        self.db = FSBODatabase(db_path=DATABASE_PATH)
+        self._db = None
         self.site_config = SiteConfig()
         self.scrapers = {
             'fsbo_com': FSBOComScraper,
@@ -40,6 +46,70 @@ class ScraperContext:
             'fsbo_landing': FSBOLandingPageScraper,
         }
 
+    @property
+    def db(self) -> FSBODatabase:
+        """Database connection, opened on first use."""
+        if self._db is None:
+            self._db = FSBODatabase(db_path=DATABASE_PATH)
+        return self._db
+
+
+def _build_scraper(scraper_name: str, scraper_class, site_config: dict):
+    """Create a scraper, passing config parameters for scrapers that support them."""
+    if scraper_name == 'fsbo_com':
+        kwargs = {}
+        if 'max_listings' in site_config:
+            kwargs['max_listings'] = site_config['max_listings']
+            click.echo(f"   Max listings: {site_config['max_listings']}")
+        if 'scrape_url' in site_config:
+            kwargs['scrape_url'] = site_config['scrape_url']
+            click.echo(f"   Scrape URL: {site_config['scrape_url']}")
+        if 'allowed_states' in site_config:
+            kwargs['allowed_states'] = site_config['allowed_states']
+            click.echo(f"   Allowed states: {site_config['allowed_states']}")
+        return scraper_class(**kwargs) if kwargs else scraper_class()
+    elif scraper_name == 'fsbo_landing':
+        kwargs = {}
+        if 'max_listings' in site_config:
+            kwargs['max_listings'] = site_config['max_listings']
+            click.echo(f"   Max listings: {site_config['max_listings']}")
+        if 'landing_urls' in site_config:
+            kwargs['landing_urls'] = site_config['landing_urls']
+            click.echo(f"   Landing URLs: {site_config['landing_urls']}")
+        if 'landing_search_queries' in site_config:
+            kwargs['search_queries'] = site_config['landing_search_queries']
+            click.echo(f"   Search queries: {site_config['landing_search_queries']}")
+        if 'max_search_results' in site_config:
+            kwargs['max_search_results'] = site_config['max_search_results']
+            click.echo(f"   Max search results: {site_config['max_search_results']}")
+        if 'landing_allowlist' in site_config:
+            kwargs['allowlist_domains'] = site_config['landing_allowlist']
+            click.echo(f"   Allowlist: {site_config['landing_allowlist']}")
+        if 'landing_allowed_states' in site_config:
+            kwargs['allowed_states'] = site_config['landing_allowed_states']
+            click.echo(f"   Allowed states: {site_config['landing_allowed_states']}")
+        if 'landing_blacklist' in site_config:
+            kwargs['blacklist_domains'] = site_config['landing_blacklist']
+            click.echo(f"   Blacklist: {site_config['landing_blacklist']}")
+        return scraper_class(**kwargs) if kwargs else scraper_class()
+    return scraper_class()
+
+
+def _record_scrape_failure(context: 'ScraperContext', scraper_name: str, error: Exception) -> None:
+    """Report a failed scraper and record the failed session."""
+    logger.error(f"Error scraping {scraper_name}: {error}")
+    click.echo(click.style(f"   ❌ Error: {str(error)}", fg='red'))
+
+    context.db.record_scrape_session(
+        source_website=scraper_name,
+        listings_found=0,
+        listings_new=0,
+        listings_duplicates=0,
+        errors=1,
+        error_message=str(error),
+        status='failed'
+    )
+
 
 @click.group()
 @click.pass_context
@@ -56,8 +126,9 @@ def cli(ctx):
 @cli.command()
 @click.option('--site', type=str, default=None, help='Scrape only a specific site (fsbo_com, zillow_fsbo, craigslist_housing, fsbo_landing)')
 @click.option('--output', type=str, default=None, help='Output CSV file path')
+@click.option('--workers', type=int, default=SCRAPER_WORKERS, show_default=True, help='Number of scrapers to run concurrently')
 @click.pass_context
-def scrape(ctx, site: Optional[str], output: Optional[str]):
+def scrape(ctx, site: Optional[str], output: Optional[str], workers: int):
     """Scrape FSBO listings from configured sources."""
     context = ctx.obj['context']
     
@@ -73,8 +144,11 @@ def scrape(ctx, site: Optional[str], output: Optional[str]):
     total_new = 0
     total_duplicates = 0
     total_errors = 0
-    all_addresses = []
+    total_found = 0
 
+    # Set up every enabled scraper first, then run them concurrently. Results
+    # are stored from this thread so database writes stay serialized.
+    jobs = []
     for scraper_name in scrapers_to_run:
         if not context.site_config.is_site_enabled(scraper_name):
             click.echo(click.style(f"⏭️  Skipping disabled scraper: {scraper_name}", fg='yellow'))
@@ -84,96 +158,59 @@ def scrape(ctx, site: Optional[str], output: Optional[str]):
         click.echo(click.style(f"\n📍 Scraping: {site_config['name']}", fg='cyan', bold=True))
 
         try:
-            scraper_class = context.scrapers[scraper_name]
-            
-            # Pass config parameters for scrapers that support them
-            if scraper_name == 'fsbo_com':
-                kwargs = {}
-                if 'max_listings' in site_config:
-                    kwargs['max_listings'] = site_config['max_listings']
-                    click.echo(f"   Max listings: {site_config['max_listings']}")
-                if 'scrape_url' in site_config:
-                    kwargs['scrape_url'] = site_config['scrape_url']
-                    click.echo(f"   Scrape URL: {site_config['scrape_url']}")
-                if 'allowed_states' in site_config:
-                    kwargs['allowed_states'] = site_config['allowed_states']
-                    click.echo(f"   Allowed states: {site_config['allowed_states']}")
-                scraper = scraper_class(**kwargs) if kwargs else scraper_class()
-            elif scraper_name == 'fsbo_landing':
-                kwargs = {}
-                if 'max_listings' in site_config:
-                    kwargs['max_listings'] = site_config['max_listings']
-                    click.echo(f"   Max listings: {site_config['max_listings']}")
-                if 'landing_urls' in site_config:
-                    kwargs['landing_urls'] = site_config['landing_urls']
-                    click.echo(f"   Landing URLs: {site_config['landing_urls']}")
-                if 'landing_search_queries' in site_config:
-                    kwargs['search_queries'] = site_config['landing_search_queries']
-                    click.echo(f"   Search queries: {site_config['landing_search_queries']}")
-                if 'max_search_results' in site_config:
-                    kwargs['max_search_results'] = site_config['max_search_results']
-                    click.echo(f"   Max search results: {site_config['max_search_results']}")
-                if 'landing_allowlist' in site_config:
-                    kwargs['allowlist_domains'] = site_config['landing_allowlist']
-                    click.echo(f"   Allowlist: {site_config['landing_allowlist']}")
-                if 'landing_allowed_states' in site_config:
-                    kwargs['allowed_states'] = site_config['landing_allowed_states']
-                    click.echo(f"   Allowed states: {site_config['landing_allowed_states']}")
-                if 'landing_blacklist' in site_config:
-                    kwargs['blacklist_domains'] = site_config['landing_blacklist']
-                    click.echo(f"   Blacklist: {site_config['landing_blacklist']}")
-                scraper = scraper_class(**kwargs) if kwargs else scraper_class()
-            else:
-                scraper = scraper_class()
-
+            scraper = _build_scraper(scraper_name, context.scrapers[scraper_name], site_config)
             click.echo(f"   Rate limiting: {scraper.rate_limiter.min_delay}s - {scraper.rate_limiter.max_delay}s")
-
-            with click.progressbar(
-                length=100,
-                label='   Progress',
-                show_eta=True
-            ) as pbar:
-                listings = scraper.scrape()
-                pbar.update(100)
-
-            # Add to database
-            new_count, dup_count = context.db.bulk_add_listings(listings)
-            total_new += new_count
-            total_duplicates += dup_count
-            
-            # Collect addresses
-            for listing in listings:
-                address = f"{listing.get('street', '')}, {listing.get('city', '')}, {listing.get('state', '')} {listing.get('zip_code', '')}"
-                all_addresses.append(address)
-
-            # Record scrape session
-            context.db.record_scrape_session(
-                source_website=scraper.source_name,
-                listings_found=len(listings),
-                listings_new=new_count,
-                listings_duplicates=dup_count,
-                errors=0,
-                status='completed'
-            )
-
-            scraper.close()
-
-            click.echo(click.style(f"   ✅ Complete: {new_count} new, {dup_count} duplicates", fg='green'))
-
+            jobs.append((scraper_name, scraper))
         except Exception as e:
-            logger.error(f"Error scraping {scraper_name}: {e}")
             total_errors += 1
-            click.echo(click.style(f"   ❌ Error: {str(e)}", fg='red'))
-            
-            context.db.record_scrape_session(
-                source_website=scraper_name,
-                listings_found=0,
-                listings_new=0,
-                listings_duplicates=0,
-                errors=1,
-                error_message=str(e),
-                status='failed'
-            )
+            _record_scrape_failure(context, scraper_name, e)
+
+    if jobs:
+        worker_count = max(1, min(workers, len(jobs)))
+        click.echo(f"\n⏳ Running {len(jobs)} scraper(s) with {worker_count} worker(s)...")
+
+        with ThreadPoolExecutor(max_workers=worker_count) as pool:
+            futures = {pool.submit(scraper.scrape): (scraper_name, scraper) for scraper_name, scraper in jobs}
+
+            for future in as_completed(futures):
+                scraper_name, scraper = futures[future]
+                click.echo(click.style(f"\n📍 Results: {scraper.source_name}", fg='cyan', bold=True))
+
+                try:
+                    listings = future.result()
+
+                    # Add to database
+                    new_count, dup_count = context.db.bulk_add_listings(listings)
+                    total_new += new_count
+                    total_duplicates += dup_count
+                    total_found += len(listings)
+
+                    # Record scrape session
+                    context.db.record_scrape_session(
+                        source_website=scraper.source_name,
+                        listings_found=len(listings),
+                        listings_new=new_count,
+                        listings_duplicates=dup_count,
+                        errors=0,
+                        status='completed'
+                    )
+
+                    click.echo(click.style(f"   ✅ Complete: {new_count} new, {dup_count} duplicates", fg='green'))
+
+                    # Print this source's addresses now rather than holding every run's list
+                    if listings:
+                        click.echo(click.style("   📍 Scraped Addresses", fg='cyan'))
+                        click.echo("\n".join(
+                            "      {}, {}, {} {}".format(*_address_fields(listing))
+                            for listing in listings
+                        ))
+
+                except Exception as e:
+                    total_errors += 1
+                    _record_scrape_failure(context, scraper_name, e)
+
+                finally:
+                    scraper.close()
 
     # Summary
     click.echo(click.style("\n📊 Summary", fg='cyan', bold=True))
@@ -181,12 +218,7 @@ def scrape(ctx, site: Optional[str], output: Optional[str]):
     click.echo(f"   Total duplicates: {total_duplicates}")
     click.echo(f"   Errors: {total_errors}")
 
-    # Print all addresses
-    if all_addresses:
-        click.echo(click.style("\n📍 Scraped Addresses", fg='cyan', bold=True))
-        for address in all_addresses:
-            click.echo(f"   {address}")
-    else:
+    if not total_found:
         click.echo(click.style("\n📍 No addresses scraped", fg='yellow'))
 
     # Auto-export if requested
@@ -209,29 +241,30 @@ def export(ctx, site: Optional[str], output: str, export_only: bool):
     click.echo(click.style("📤 Exporting listings to CSV...", fg='cyan', bold=True))
 
     try:
-        context.db.export_to_csv(
+        row_count = context.db.export_to_csv(
             output_path=output,
             source=site,
             exported_only=export_only
         )
 
-        # Read and show sample
-        from pathlib import Path
-        csv_file = Path(output)
-        if csv_file.exists():
-            with open(csv_file, 'r') as f:
-                lines = f.readlines()
-                
-            click.echo(click.style("✅ Export successful!", fg='green'))
-            click.echo(f"   File: {output}")
-            click.echo(f"   Rows: {len(lines) - 1}")  # Subtract header
-            
-            if len(lines) <= 5:
-                click.echo("\n📋 Preview:")
-                click.echo(''.join(lines))
-            else:
-                click.echo("\n📋 Preview (first 3 rows):")
-                click.echo(''.join(lines[:4]))
+        if not row_count:
+            click.echo(click.style("⚠️  No listings to export", fg='yellow'))
+            return
+
+        # Read back only the lines needed for the preview
+        with open(output, 'r') as f:
+            head = list(islice(f, 5))
+
+        click.echo(click.style("✅ Export successful!", fg='green'))
+        click.echo(f"   File: {output}")
+        click.echo(f"   Rows: {row_count}")
+
+        if row_count <= 4:
+            click.echo("\n📋 Preview:")
+            click.echo(''.join(head))
+        else:
+            click.echo("\n📋 Preview (first 3 rows):")
+            click.echo(''.join(head[:4]))
 
     except Exception as e:
         click.echo(click.style(f"❌ Export failed: {e}", fg='red'))
@@ -258,13 +291,15 @@ def listings(ctx, limit: int, site: Optional[str]):
     # Display listings in table format
     click.echo(f"\nShowing {len(listings)} of {total} listings:\n")
     
+    lines = []
     for i, listing in enumerate(listings, 1):
-        click.echo(f"{i}. {listing['street']}")
-        click.echo(f"   {listing['city']}, {listing['state']} {listing['zip_code']}")
-        click.echo(f"   Source: {listing['source_website']}")
+        lines.append(f"{i}. {listing['street']}")
+        lines.append(f"   {listing['city']}, {listing['state']} {listing['zip_code']}")
+        lines.append(f"   Source: {listing['source_website']}")
         if listing['listing_url']:
-            click.echo(f"   URL: {listing['listing_url']}")
-        click.echo()
+            lines.append(f"   URL: {listing['listing_url']}")
+        lines.append("")
+    click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -2,17 +2,207 @@
 HTML parser utilities for extracting listing data.
 """
 
-from typing import Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
+from functools import lru_cache
 from bs4 import BeautifulSoup
+import lxml.html
+import soupsieve
+from lxml import etree
 import re
+import json
 import logging
+import threading
+
+from utils.address_normalizer import AddressNormalizer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None  # Fall back to BeautifulSoup selectors
 
 logger = logging.getLogger(__name__)
 
+# Per-thread lxml parser, see _lxml_parser()
+_lxml_state = threading.local()
+
+# Precompiled patterns for address parsing
+_ZIP_RE = re.compile(r'\b(\d{5})(?:-(\d{4}))?\b')
+_ZIP5_RE = re.compile(r'\b\d{5}\b')
+_ZIP_FIELD_RE = re.compile(r'\d{5}(?:-\d{4})?')
+# Unanchored "Street, City, ST 12345" (or "Street | City, ST 12345") for
+# scanning whole blocks of page text
+_ADDRESS_IN_TEXT_RE = re.compile(
+    r'(?P<street>[^,|\n]+?)\s*[,|]\s*(?P<city>[^,\n]+?)\s*,\s*(?P<state>[A-Z]{2})\s+(?P<zip_code>\d{5})'
+)
+
+_JSON_LD_XPATH = etree.XPath('//script[@type="application/ld+json"]/text()')
+# Text nodes BeautifulSoup's get_text() would include (no script/style/template)
+_VISIBLE_TEXT_XPATH = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style or ancestor::template)]'
+)
+
+_US_STATES = AddressNormalizer.STATE_CODES
+
+# Fold all address delimiters into commas so a plain str.split suffices
+_DELIM_TRANS = str.maketrans({'/': ',', '\n': ','})
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a caller-supplied regex once and reuse it."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=64)
+def _compile_selectors(selectors: tuple) -> tuple:
+    """Compile a selector list into (combined, per-selector) soupsieve patterns."""
+    return soupsieve.compile(', '.join(selectors)), tuple(soupsieve.compile(s) for s in selectors)
+
+
+@lru_cache(maxsize=16)
+def _parse_html(html: str) -> BeautifulSoup:
+    """Parse HTML once and reuse the tree for repeated extractions on the same page."""
+    return BeautifulSoup(html, 'lxml')
+
+
+@lru_cache(maxsize=16)
+def _parse_lexbor(html: str):
+    """Parse HTML with selectolax's lexbor backend for fast CSS selection."""
+    return LexborHTMLParser(html)
+
+
+def _select_first_text(html: str, selector: str) -> Optional[str]:
+    """Text of the first element matching selector, or None."""
+    if LexborHTMLParser is not None:
+        node = _parse_lexbor(html).css_first(selector)
+        return node.text(strip=True) if node is not None else None
+    element = _parse_html(html).select_one(selector)
+    return element.get_text(strip=True) if element else None
+
+
+def _select_all_texts(html: str, selector: str) -> List[str]:
+    """Text of every element matching selector."""
+    if LexborHTMLParser is not None:
+        return [node.text(strip=True) for node in _parse_lexbor(html).css(selector)]
+    return [elem.get_text(strip=True) for elem in _parse_html(html).select(selector)]
+
+
+def _select_first_attribute(html: str, selector: str, attribute: str) -> Optional[str]:
+    """Attribute of the first element matching selector, or None."""
+    if LexborHTMLParser is not None:
+        node = _parse_lexbor(html).css_first(selector)
+        return node.attributes.get(attribute) if node is not None else None
+    element = _parse_html(html).select_one(selector)
+    return element.get(attribute) if element else None
+
+
+def _lxml_parser() -> lxml.html.HTMLParser:
+    """
+    Get this thread's reusable lxml parser.
+    
+    lxml parsers must not be shared between threads, so each thread
+    builds one on first use instead of fromstring() making one per call.
+    Nothing here looks elements up by id, so the id table is skipped.
+    """
+    parser = getattr(_lxml_state, 'parser', None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(collect_ids=False)
+        _lxml_state.parser = parser
+    return parser
+
+
+def _build_lxml(html: str):
+    """Parse HTML into a raw lxml tree for XPath lookups."""
+    parser = _lxml_parser()
+    try:
+        return lxml.html.fromstring(html, parser=parser)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration
+        return lxml.html.fromstring(html.encode('utf-8'), parser=parser)
+
+
+@lru_cache(maxsize=16)
+def _parse_lxml(html: str):
+    """Memoized _build_lxml() for trees shared between lookups."""
+    return _build_lxml(html)
+
+
+def _loads_json(text: str):
+    """Decode JSON with orjson when available."""
+    return orjson.loads(text) if orjson else json.loads(text)
+
 
 class HTMLParser:
     """Utilities for parsing HTML listing pages."""
 
+    @staticmethod
+    def get_soup(html: str) -> BeautifulSoup:
+        """
+        Get a parsed tree for HTML content.
+        
+        Parses are cached, so calling several extract_* methods on the
+        same page only parses it once. Treat the result as read-only.
+        
+        Args:
+            html: HTML content
+            
+        Returns:
+            BeautifulSoup tree
+        """
+        return _parse_html(html)
+
+    @staticmethod
+    def parse_tree(html: str):
+        """
+        Parse a private, uncached lxml tree.
+        
+        The caller owns the result and may modify it,
+        e.g. clear() it once done so a large page is freed straight away.
+        
+        Args:
+            html: HTML content
+            
+        Returns:
+            lxml root element, or None if the document is empty
+        """
+        try:
+            return _build_lxml(html)
+        except etree.ParserError:
+            return None
+
+    @staticmethod
+    def get_element_text(element, limit: Optional[int] = None, separator: str = '') -> str:
+        """
+        Get an lxml element's text the way BeautifulSoup's get_text(strip=True) does.
+        
+        Each text node is stripped and the pieces are joined with separator;
+        script, style and template content is skipped.
+        
+        Args:
+            element: lxml element
+            limit: Stop once this many characters are collected
+            separator: String placed between text nodes
+            
+        Returns:
+            Concatenated text (at most limit characters)
+        """
+        parts = []
+        length = 0
+        for text in _VISIBLE_TEXT_XPATH(element):
+            text = text.strip()
+            if text:
+                parts.append(text)
+                length += len(text) + len(separator)
+                if limit is not None and length >= limit:
+                    break
+        text = separator.join(parts)
+        return text[:limit] if limit is not None else text
+
     @staticmethod
     def extract_text_by_css(html: str, selector: str) -> Optional[str]:
         """
@@ -26,9 +216,7 @@ class HTMLParser:
             Extracted text or None
         """
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            element = soup.select_one(selector)
-            return element.get_text(strip=True) if element else None
+            return _select_first_text(html, selector)
         except Exception as e:
             logger.debug(f"Error extracting with selector {selector}: {e}")
             return None
@@ -46,13 +234,62 @@ class HTMLParser:
             List of extracted texts
         """
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            elements = soup.select(selector)
-            return [elem.get_text(strip=True) for elem in elements]
+            return _select_all_texts(html, selector)
         except Exception as e:
             logger.debug(f"Error extracting multiple with selector {selector}: {e}")
             return []
 
+    @staticmethod
+    def select_each(soup: BeautifulSoup, selectors: List[str]) -> List[List]:
+        """
+        Return the matches of every selector, walking the tree only once.
+        
+        Same result as [soup.select(s) for s in selectors]: the combined
+        selector finds each candidate once, which is then filed under every
+        selector it matches.
+        
+        Args:
+            soup: Parsed tree
+            selectors: CSS selectors
+            
+        Returns:
+            One list of matching elements per selector, in document order
+        """
+        combined, patterns = _compile_selectors(tuple(selectors))
+        groups = [[] for _ in patterns]
+        for node in combined.select(soup):
+            for group, pattern in zip(groups, patterns):
+                if pattern.match(node):
+                    group.append(node)
+        return groups
+
+    @staticmethod
+    def first_by_rank(element, tags: tuple, rank: Callable[[Any], Optional[int]]):
+        """
+        Find the best-ranked descendant in a single walk of an lxml subtree.
+        
+        Equivalent to trying each ranked lookup in turn and taking the first
+        hit, but the subtree is only traversed once and the walk stops at
+        the first rank-0 match.
+        
+        Args:
+            element: lxml element
+            tags: Descendant tags worth ranking
+            rank: Maps a descendant to its rank (0 is best), or None to skip it
+            
+        Returns:
+            First descendant with the lowest rank, or None
+        """
+        best = None
+        best_rank = None
+        for node in element.iterdescendants(*tags):
+            r = rank(node)
+            if r is not None and (best_rank is None or r < best_rank):
+                best, best_rank = node, r
+                if r == 0:
+                    break
+        return best
+
     @staticmethod
     def extract_attribute(html: str, selector: str, attribute: str) -> Optional[str]:
         """
@@ -67,9 +304,7 @@ class HTMLParser:
             Attribute value or None
         """
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            element = soup.select_one(selector)
-            return element.get(attribute) if element else None
+            return _select_first_attribute(html, selector, attribute)
         except Exception as e:
             logger.debug(f"Error extracting attribute {attribute}: {e}")
             return None
@@ -83,19 +318,40 @@ class HTMLParser:
             html: HTML content
             
         Returns:
-            Parsed JSON-LD data or None
+            First parsed JSON-LD block or None
         """
-        try:
-            import json
-            soup = BeautifulSoup(html, 'html.parser')
-            script = soup.find('script', {'type': 'application/ld+json'})
+        blocks = HTMLParser.extract_all_json_ld(html)
+        return blocks[0] if blocks else None
+
+    @staticmethod
+    def extract_all_json_ld(html: str) -> List:
+        """
+        Extract every JSON-LD block from HTML.
+        
+        Blocks that fail to decode are skipped.
+        
+        Args:
+            html: HTML content
             
-            if script:
-                return json.loads(script.string)
-            return None
+        Returns:
+            List of parsed JSON-LD blocks in document order
+        """
+        try:
+            texts = _JSON_LD_XPATH(_parse_lxml(html))
         except Exception as e:
             logger.debug(f"Error extracting JSON-LD: {e}")
-            return None
+            return []
+
+        blocks = []
+        for text in texts:
+            if not text.strip():
+                continue
+            try:
+                # orjson only accepts exact str, not lxml's smart string subclass
+                blocks.append(_loads_json(str(text)))
+            except Exception as e:
+                logger.debug(f"Error decoding JSON-LD block: {e}")
+        return blocks
 
     @staticmethod
     def extract_by_regex(text: str, pattern: str) -> Optional[str]:
@@ -110,7 +366,7 @@ class HTMLParser:
             First match or None
         """
         try:
-            match = re.search(pattern, text)
+            match = _compile_pattern(pattern).search(text)
             return match.group(1) if match and match.groups() else (match.group(0) if match else None)
         except Exception as e:
             logger.debug(f"Error extracting with regex {pattern}: {e}")
@@ -144,12 +400,12 @@ class AddressParser:
         }
 
         # Extract ZIP code (must have)
-        zip_match = re.search(r'\b(\d{5})(?:-(\d{4}))?\b', line)
+        zip_match = _ZIP_RE.search(line)
         if zip_match:
             result['zip_code'] = zip_match.group(1)
 
         # Split by common delimiters
-        parts = re.split(r'[,/\n]', line)
+        parts = line.translate(_DELIM_TRANS).split(',')
         parts = [p.strip() for p in parts if p.strip()]
 
         if len(parts) >= 1:
@@ -159,10 +415,10 @@ class AddressParser:
         if len(parts) >= 2:
             # Find city (before state/zip)
             for i, part in enumerate(parts[1:], 1):
-                # Check if this part contains state abbreviation
-                state_match = re.search(r'\b([A-Z]{2})\b', part)
-                if state_match:
-                    result['state'] = state_match.group(1)
+                # Check if this part contains a real state abbreviation
+                state = next((tok for tok in part.split() if tok in _US_STATES), None)
+                if state:
+                    result['state'] = state
                     if i > 1:
                         result['city'] = parts[1]
                     break
@@ -172,6 +428,83 @@ class AddressParser:
 
         return result
 
+    @staticmethod
+    def find_addresses(text: str, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Find every "Street, City, ST 12345" address in a block of text.
+        
+        The whole text is scanned by one compiled pattern, so a page's text
+        can be searched at once instead of card by card. Lines are kept
+        apart by newlines; a street never spans one.
+        
+        Args:
+            text: Text to scan, e.g. a page's visible text
+            limit: Stop after this many addresses
+            
+        Returns:
+            List of address component dictionaries, in text order
+        """
+        results = []
+        if limit is not None and limit <= 0:
+            return results
+        for match in _ADDRESS_IN_TEXT_RE.finditer(text):
+            results.append({k: v.strip() for k, v in match.groupdict().items()})
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    @staticmethod
+    def compile_layout(layout: str) -> Callable[[str], Optional[Dict[str, str]]]:
+        """
+        Build a parser specialized to a fixed address layout.
+        
+        Sources that always emit the same layout can skip the generic
+        heuristics. The layout lists fields in order, with commas between
+        comma-separated sections and spaces between fields inside a section,
+        e.g. 'street,city,state zip_code'. Within a section only the first
+        field may contain spaces. A line whose section count differs, or
+        whose state or ZIP isn't a real one, is rejected so the caller's
+        generic fallback can handle it.
+        
+        Args:
+            layout: Field layout description
+            
+        Returns:
+            Function mapping an address line to its components, or None if
+            the line doesn't fit the layout
+        """
+        sections = [tuple(section.split()) for section in layout.split(',')]
+        fields = {name for names in sections for name in names}
+        unknown = fields - {'street', 'city', 'state', 'zip_code'}
+        if unknown or not all(sections):
+            raise ValueError(f"Invalid address layout: {layout!r}")
+
+        def parse(line: str) -> Optional[Dict[str, str]]:
+            chunks = line.split(',')
+            if len(chunks) != len(sections):
+                return None
+
+            result = {'street': '', 'city': '', 'state': '', 'zip_code': ''}
+            for names, chunk in zip(sections, chunks):
+                if len(names) == 1:
+                    result[names[0]] = chunk.strip()
+                    continue
+                tokens = chunk.rsplit(None, len(names) - 1)
+                if len(tokens) != len(names):
+                    return None
+                for name, token in zip(names, tokens):
+                    result[name] = token.strip()
+
+            if not all(result[name] for name in fields):
+                return None
+            if 'state' in fields and result['state'] not in _US_STATES:
+                return None
+            if 'zip_code' in fields and not _ZIP_FIELD_RE.fullmatch(result['zip_code']):
+                return None
+            return result
+
+        return parse
+
     @staticmethod
     def parse_address_multiline(street: str, city: str, state: str, 
                                zip_code: str) -> Dict[str, str]:
@@ -205,8 +538,6 @@ class AddressParser:
         Returns:
             True if looks like address
         """
-        # Must have street number and ZIP code
-        has_number = re.search(r'\b\d{1,5}\b', text)
-        has_zip = re.search(r'\b\d{5}\b', text)
-        
-        return bool(has_number and has_zip)
+        # Must have street number and ZIP code. A standalone 5-digit ZIP
+        # also satisfies the 1-5 digit number check, so one scan covers both.
+        return _ZIP5_RE.search(text) is not None
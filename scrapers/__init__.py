@@ -2,7 +2,7 @@
 Initialization file for scrapers package.
 """
 
-from .base_scraper import BaseScraper, BrowserBasedScraper
+from .base_scraper import BaseScraper, BrowserBasedScraper, PlaywrightPool, PagePool, DiskHTMLCache
 from .fsbo_com import FSBOComScraper
 from .byowner_com import ByOwnerComScraper
 from .realtyless_com import RealtyLessComScraper
@@ -14,6 +14,9 @@ from .fsbo_landing import FSBOLandingPageScraper
 __all__ = [
     'BaseScraper',
     'BrowserBasedScraper',
+    'PlaywrightPool',
+    'PagePool',
+    'DiskHTMLCache',
     'FSBOComScraper',
     'ByOwnerComScraper',
     'RealtyLessComScraper',
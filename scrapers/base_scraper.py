@@ -2,19 +2,133 @@
 Base scraper class with common functionality for all FSBO scrapers.
 """
 
+import asyncio
+import aiohttp
+import atexit
 import requests
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
+import gzip
+import hashlib
 import logging
+import os
+import re
+import threading
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
-from utils.rate_limiter import RateLimiter, RetryConfig, retry_with_backoff
+from utils.rate_limiter import RateLimiter, RetryConfig, TokenBucket, retry_with_backoff
 from utils.user_agents import UserAgentRotator
 from utils.address_normalizer import AddressNormalizer
 
 logger = logging.getLogger(__name__)
 
+# One reusable event loop per thread; the CLI runs scrapers on a thread pool
+_thread_state = threading.local()
+
+# Requests the Playwright scrapers never need: static assets and trackers
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet', 'texttrack'})
+_TRACKER_URL_RE = re.compile(r'googletagmanager|doubleclick|google-analytics|facebook\.net|hotjar')
+
+# Lower-cased JSON keys checked, in order, for each listing field
+_FEED_KEYS = {
+    'street': ('street', 'streetaddress', 'street_address', 'address1', 'addressline1', 'address'),
+    'city': ('city', 'addresslocality'),
+    'state': ('state', 'statecode', 'state_code', 'addressregion'),
+    'zip_code': ('zip', 'zipcode', 'zip_code', 'postalcode', 'postal_code'),
+    'listing_url': ('url', 'permalink', 'href', 'slug'),
+}
+
+
+@lru_cache(maxsize=8192)
+def _normalize_cached(street: str, city: str, state: str,
+                      zip_code: str) -> Optional[Tuple[str, str, str, str]]:
+    """
+    Normalize and validate an address, memoized across listings and scrapers.
+    
+    Returns:
+        (street, city, state, zip_code) tuple, or None if invalid
+    """
+    normalized = AddressNormalizer.normalize_address(street, city, state, zip_code)
+    fields = (normalized['street'], normalized['city'],
+              normalized['state'], normalized['zip_code'])
+    if not AddressNormalizer.is_valid_address(*fields):
+        return None
+    return fields
+
+
+class DiskHTMLCache:
+    """
+    Gzipped on-disk cache of rendered page HTML, keyed by URL.
+    
+    Meant for development and repeated runs over the same metros: a fresh
+    hit skips the browser and navigation entirely. Disabled unless
+    FSBO_HTML_CACHE=1; FSBO_HTML_CACHE_DIR overrides the location.
+    """
+
+    def __init__(self, directory: Optional[str] = None, enabled: Optional[bool] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            directory: Cache directory (default ~/.cache/fsbo)
+            enabled: Override the FSBO_HTML_CACHE environment switch
+        """
+        self.directory = Path(
+            directory or os.environ.get('FSBO_HTML_CACHE_DIR', '~/.cache/fsbo')
+        ).expanduser()
+        self.enabled = os.environ.get('FSBO_HTML_CACHE') == '1' if enabled is None else enabled
+
+    def _path(self, url: str) -> Path:
+        """Return the cache file for a URL."""
+        return self.directory / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html.gz"
+
+    def get(self, url: str, max_age_s: float = 3600) -> Optional[str]:
+        """
+        Return cached HTML for a URL if it is younger than max_age_s.
+        
+        Args:
+            url: Page URL
+            max_age_s: Maximum entry age in seconds
+            
+        Returns:
+            Cached HTML, or None when disabled, missing or stale
+        """
+        if not self.enabled:
+            return None
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime > max_age_s:
+                return None
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, EOFError):
+            return None
+
+    def put(self, url: str, content: str) -> None:
+        """
+        Store HTML for a URL (no-op when disabled or content is empty).
+        
+        Args:
+            url: Page URL
+            content: Page HTML
+        """
+        if not self.enabled or not content:
+            return
+        path = self._path(url)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug("Could not cache %s: %s", url, e)
+
 
 class BaseScraper(ABC):
     """
@@ -22,6 +136,17 @@ class BaseScraper(ABC):
     Provides common functionality like rate limiting, retries, and user-agent rotation.
     """
 
+    # Max requests in flight at once on the async fetch path
+    max_concurrency = 5
+    # Open connections allowed to any one host; 0 leaves only the total cap
+    max_connections_per_host = 0
+    # Requests a host may receive back-to-back before the steady rate applies
+    burst_size = 2
+    # Pick a new session User-Agent after this many get_page() calls
+    rotate_user_agent_every = 10
+    # Rendered-page cache shared by the Playwright scrapers
+    html_cache = DiskHTMLCache()
+
     def __init__(self, source_name: str, base_url: str, min_delay: float = 2.0,
                  max_delay: float = 5.0):
         """
@@ -40,6 +165,8 @@ class BaseScraper(ABC):
         self.address_normalizer = AddressNormalizer()
         self.retry_config = RetryConfig(max_retries=3, backoff_factor=2.0)
         self.session = self._create_session()
+        self._request_count = 0
+        self._token_buckets: Dict[str, TokenBucket] = {}
 
     def _create_session(self) -> requests.Session:
         """Create configured requests session."""
@@ -61,22 +188,137 @@ class BaseScraper(ABC):
         """
         self.rate_limiter.wait()
         
-        headers = self.user_agent_rotator.get_headers()
+        # The session already carries the browser-like headers; only the
+        # User-Agent rotates, and only every few requests
+        self._request_count += 1
+        if self._request_count % self.rotate_user_agent_every == 0:
+            self.session.headers['User-Agent'] = self.user_agent_rotator.get_random_user_agent()
         
         try:
             response = self.session.get(
                 url,
-                headers=headers,
                 timeout=10,
                 **kwargs
             )
             response.raise_for_status()
-            logger.debug(f"Successfully fetched {url}")
+            logger.debug("Successfully fetched %s", url)
             return response
         except requests.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             raise
 
+    def _get_token_bucket(self, url: str) -> TokenBucket:
+        """
+        Get the async rate limiter for a URL's host.
+        
+        The steady rate matches the average of the scraper's configured
+        min/max delay.
+        """
+        host = urlparse(url).netloc
+        bucket = self._token_buckets.get(host)
+        if bucket is None:
+            avg_delay = (self.rate_limiter.min_delay + self.rate_limiter.max_delay) / 2
+            bucket = TokenBucket(rate=1 / max(avg_delay, 0.001), max_tokens=self.burst_size)
+            self._token_buckets[host] = bucket
+        return bucket
+
+    def _create_async_session(self) -> aiohttp.ClientSession:
+        """
+        Create an aiohttp session for one scrape run.
+        
+        Headers are set once on the session and connections are kept
+        alive, so every URL in the run reuses the same pooled sockets.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            limit_per_host=self.max_connections_per_host,
+            keepalive_timeout=60
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=self.user_agent_rotator.get_headers(),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+
+    async def get_page_async(self, session: aiohttp.ClientSession, url: str, **kwargs) -> str:
+        """
+        Make async GET request with rate limiting and retries.
+        
+        Args:
+            session: Session from _create_async_session()
+            url: URL to fetch
+            **kwargs: Additional arguments for session.get()
+            
+        Returns:
+            Response body text
+        """
+        config = self.retry_config
+        bucket = self._get_token_bucket(url)
+        last_exception = None
+
+        for attempt in range(config.max_retries + 1):
+            await bucket.wait_for_token()
+            try:
+                async with session.get(url, **kwargs) as response:
+                    response.raise_for_status()
+                    text = await response.text()
+                    logger.debug("Successfully fetched %s", url)
+                    return text
+            except aiohttp.ClientResponseError as e:
+                if e.status not in config.retry_on_status:
+                    raise
+                last_exception = e
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_exception = e
+
+            if attempt < config.max_retries:
+                wait_time = config.backoff_factor ** attempt
+                logger.warning(
+                    f"Fetching {url} failed (attempt {attempt + 1}/"
+                    f"{config.max_retries + 1}). Retrying in {wait_time}s..."
+                )
+                await asyncio.sleep(wait_time)
+
+        raise last_exception
+
+    @staticmethod
+    def _run_async(coro):
+        """
+        Run a coroutine to completion on the calling thread's event loop.
+        
+        The loop is created on first use and kept for later calls, rather
+        than built and torn down on every scrape like asyncio.run().
+        """
+        loop = getattr(_thread_state, 'loop', None)
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            _thread_state.loop = loop
+        return loop.run_until_complete(coro)
+
+    async def fetch_pages_async(self, urls: List[str]) -> List[Tuple[str, Optional[str]]]:
+        """
+        Fetch several pages concurrently over one keep-alive session.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            (url, content) pairs in input order; content is None if the
+            fetch failed
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._create_async_session() as session:
+            async def fetch(url: str) -> Tuple[str, Optional[str]]:
+                async with semaphore:
+                    try:
+                        return url, await self.get_page_async(session, url)
+                    except Exception as e:
+                        logger.error(f"Error scraping {url}: {e}")
+                        return url, None
+
+            return await asyncio.gather(*(fetch(url) for url in urls))
+
     def parse_listings(self, content: str) -> List[Dict]:
         """
         Parse listings from page content.
@@ -107,7 +349,8 @@ class BaseScraper(ABC):
         Returns:
             List of normalized listings
         """
-        all_listings = []
+        normalized = []
+        seen = set()
         
         logger.info(f"Starting scrape of {self.source_name}")
         
@@ -115,20 +358,19 @@ class BaseScraper(ABC):
             listing_urls = self.get_listing_urls()
             logger.info(f"Found {len(listing_urls)} pages to scrape from {self.source_name}")
             
-            for url in listing_urls:
+            pages = self._run_async(self.fetch_pages_async(listing_urls))
+            for url, content in pages:
+                if content is None:
+                    continue
                 try:
-                    response = self.get_page(url)
-                    listings = self.parse_listings(response.text)
-                    all_listings.extend(listings)
-                    logger.debug(f"Scraped {len(listings)} listings from {url}")
+                    listings = self._dedupe_listings(self.parse_listings(content), seen)
+                    # Normalize as each page is parsed; invalid addresses drop out
+                    normalized.extend(self._normalize_batch(listings))
+                    logger.debug("Scraped %d listings from %s", len(listings), url)
                 except Exception as e:
                     logger.error(f"Error scraping {url}: {e}")
                     continue
             
-            # Normalize addresses
-            normalized = [self._normalize_listing(listing) for listing in all_listings]
-            normalized = [l for l in normalized if l is not None]
-            
             logger.info(f"Completed scrape of {self.source_name}: {len(normalized)} valid listings")
             return normalized
             
@@ -147,31 +389,142 @@ class BaseScraper(ABC):
             Normalized listing or None if invalid
         """
         try:
-            normalized = self.address_normalizer.normalize_address(
-                street=listing.get('street', ''),
-                city=listing.get('city', ''),
-                state=listing.get('state', ''),
-                zip_code=listing.get('zip_code', '')
+            fields = _normalize_cached(
+                listing.get('street', ''),
+                listing.get('city', ''),
+                listing.get('state', ''),
+                listing.get('zip_code', '')
             )
             
-            if not self.address_normalizer.is_valid_address(
-                normalized['street'],
-                normalized['city'],
-                normalized['state'],
-                normalized['zip_code']
-            ):
-                logger.debug(f"Skipping invalid address: {listing}")
+            if fields is None:
+                logger.debug("Skipping invalid address: %s", listing)
                 return None
             
+            street, city, state, zip_code = fields
+            normalized = {'street': street, 'city': city, 'state': state, 'zip_code': zip_code}
             normalized['listing_url'] = listing.get('listing_url', '')
             normalized['source_website'] = self.source_name
             
             return normalized
             
         except Exception as e:
-            logger.debug(f"Error normalizing listing {listing}: {e}")
+            logger.debug("Error normalizing listing %s: %s", listing, e)
             return None
 
+    @staticmethod
+    def _dedupe_listings(listings: List[Dict], seen: set) -> List[Dict]:
+        """
+        Drop listings already seen in this scrape.
+        
+        Listings are keyed by (street, zip_code), or by listing_url when
+        there is no street; keys are added to seen.
+        
+        Args:
+            listings: Raw listing data
+            seen: Keys of listings kept so far, shared across pages
+            
+        Returns:
+            Listings not seen before, in input order
+        """
+        unique = []
+        for listing in listings:
+            street = listing.get('street', '')
+            key = (street, listing.get('zip_code', '')) if street else listing.get('listing_url', '')
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(listing)
+        return unique
+
+    def _listings_from_feed(self, feed: List) -> List[Dict]:
+        """
+        Extract listings from JSON API responses captured while rendering.
+        
+        Any object with a street, city, state and ZIP (directly or in a
+        nested "address" object) is treated as a listing.
+        
+        Args:
+            feed: Decoded JSON response bodies
+            
+        Returns:
+            List of extracted listings, at most max_listings
+        """
+        listings = []
+        stack = list(reversed(feed))
+
+        while stack and len(listings) < self.max_listings:
+            obj = stack.pop()
+            if isinstance(obj, list):
+                stack.extend(reversed(obj))
+                continue
+            if not isinstance(obj, dict):
+                continue
+
+            fields = {k.lower(): v for k, v in obj.items()}
+            if isinstance(fields.get('address'), dict):
+                fields.update({k.lower(): v for k, v in fields.pop('address').items()})
+
+            listing = {}
+            for field, keys in _FEED_KEYS.items():
+                value = next((fields[k] for k in keys if fields.get(k)), '')
+                listing[field] = value if isinstance(value, str) else str(value)
+
+            if all(listing[f] for f in ('street', 'city', 'state', 'zip_code')):
+                url = listing['listing_url']
+                if url and not url.startswith('http'):
+                    listing['listing_url'] = self.base_url + '/' + url.lstrip('/')
+                listings.append(listing)
+                continue
+
+            stack.extend(v for v in reversed(list(obj.values())) if isinstance(v, (dict, list)))
+
+        return listings
+
+    def _normalize_batch(self, listings: List[Dict]) -> List[Dict]:
+        """
+        Normalize a batch of listings, dropping invalid ones.
+        
+        Address fields are gathered column by column and each distinct
+        address is normalized once, however many listings share it.
+        
+        Args:
+            listings: Raw listing data
+            
+        Returns:
+            Normalized listings, in input order
+        """
+        keys = list(zip(
+            [listing.get('street', '') for listing in listings],
+            [listing.get('city', '') for listing in listings],
+            [listing.get('state', '') for listing in listings],
+            [listing.get('zip_code', '') for listing in listings],
+        ))
+
+        normalized_by_key = {}
+        for key in set(keys):
+            try:
+                normalized_by_key[key] = _normalize_cached(*key)
+            except Exception as e:
+                logger.debug("Error normalizing address %s: %s", key, e)
+                normalized_by_key[key] = None
+
+        normalized = []
+        for listing, key in zip(listings, keys):
+            fields = normalized_by_key[key]
+            if fields is None:
+                logger.debug("Skipping invalid address: %s", listing)
+                continue
+            street, city, state, zip_code = fields
+            normalized.append({
+                'street': street,
+                'city': city,
+                'state': state,
+                'zip_code': zip_code,
+                'listing_url': listing.get('listing_url', ''),
+                'source_website': self.source_name,
+            })
+        return normalized
+
     def close(self) -> None:
         """Close session and cleanup."""
         self.session.close()
@@ -220,3 +573,231 @@ class BrowserBasedScraper(BaseScraper):
         if self.playwright:
             await self.playwright.stop()
         logger.debug(f"Browser closed for {self.source_name}")
+
+
+async def _route_request(route) -> None:
+    """Playwright route handler that drops requests scrapers never read."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _TRACKER_URL_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class PlaywrightPool:
+    """
+    Process-wide Playwright browser shared by the JS-rendering scrapers.
+    
+    Chromium is launched once and each scraper gets a named BrowserContext
+    from it. Playwright objects are bound to the event loop that created
+    them, so the pool runs one loop on a background thread and all
+    browser work is submitted through run(); scrapers called from
+    different threads still run concurrently on it. The browser is
+    closed at process exit.
+    """
+
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _thread: Optional[threading.Thread] = None
+    _lock = threading.Lock()
+    _launch_lock: Optional[asyncio.Lock] = None
+    _playwright = None
+    _browser = None
+    _contexts: Dict = {}
+
+    @classmethod
+    def _get_loop(cls) -> asyncio.AbstractEventLoop:
+        """Start the pool's event loop thread on first use."""
+        with cls._lock:
+            if cls._loop is None:
+                cls._loop = asyncio.new_event_loop()
+                cls._thread = threading.Thread(
+                    target=cls._loop.run_forever, name='playwright-pool', daemon=True
+                )
+                cls._thread.start()
+                atexit.register(cls.shutdown)
+            return cls._loop
+
+    @classmethod
+    def run(cls, coro):
+        """
+        Run a coroutine on the pool's event loop and wait for its result.
+        
+        Args:
+            coro: Coroutine that may use pool contexts
+            
+        Returns:
+            The coroutine's result
+        """
+        loop = cls._get_loop()
+        if threading.current_thread() is cls._thread:
+            coro.close()
+            raise RuntimeError("PlaywrightPool.run() called from the pool's own event loop")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    @classmethod
+    async def run_async(cls, coro):
+        """
+        Awaitable form of run() for callers already inside an event loop.
+        
+        The caller's loop keeps running while the coroutine executes on
+        the pool's loop.
+        
+        Args:
+            coro: Coroutine that may use pool contexts
+            
+        Returns:
+            The coroutine's result
+        """
+        loop = cls._get_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    @classmethod
+    async def _get_browser(cls):
+        """Launch Chromium once, relaunching it if it has disconnected."""
+        if cls._launch_lock is None:
+            cls._launch_lock = asyncio.Lock()
+
+        async with cls._launch_lock:
+            if cls._browser is not None and cls._browser.is_connected():
+                return cls._browser
+
+            try:
+                from playwright.async_api import async_playwright
+            except ImportError:
+                logger.error("Playwright not installed. Install with: pip install playwright && playwright install")
+                raise
+
+            await cls._close_browser()
+            cls._playwright = await async_playwright().start()
+            cls._browser = await cls._playwright.chromium.launch(headless=True)
+            logger.debug("Shared Playwright browser initialized")
+            return cls._browser
+
+    @classmethod
+    async def get_context(cls, name: str, setup=None, **options):
+        """
+        Get the browser context for a scraper, creating it if needed.
+        
+        Args:
+            name: Context key, normally the scraper's source name
+            setup: Optional coroutine function called once with a new context
+            **options: Arguments for Browser.new_context()
+            
+        Returns:
+            Playwright BrowserContext
+        """
+        browser = await cls._get_browser()
+        context = cls._contexts.get(name)
+        if context is None or context.browser is not browser:
+            context = await browser.new_context(**options)
+            if setup is not None:
+                await setup(context)
+            cls._contexts[name] = context
+        return context
+
+    @staticmethod
+    async def block_assets(context) -> None:
+        """
+        Abort image/font/media/stylesheet/texttrack and analytics requests in a context.
+        
+        Suitable as the setup callback for get_context(); scraped data
+        comes from the DOM and XHR responses, which still load.
+        """
+        await context.route('**/*', _route_request)
+
+    @classmethod
+    async def close_context(cls, name: str) -> None:
+        """Close a scraper's context; the browser stays up for other scrapers."""
+        context = cls._contexts.pop(name, None)
+        if context is not None:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug("Error closing browser context %s: %.100s", name, e)
+
+    @classmethod
+    async def _close_browser(cls) -> None:
+        """Close every context, the browser and Playwright."""
+        for name in list(cls._contexts):
+            await cls.close_context(name)
+        if cls._browser:
+            await cls._browser.close()
+        if cls._playwright:
+            await cls._playwright.stop()
+        cls._browser = cls._playwright = None
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Close the shared browser and stop the pool's event loop."""
+        with cls._lock:
+            loop, cls._loop = cls._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(cls._close_browser(), loop).result(timeout=10)
+        except Exception as e:
+            logger.debug(f"Error closing Playwright browser: {str(e)[:100]}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            cls._thread.join(timeout=5)
+            loop.close()
+            cls._launch_lock = None
+        logger.debug("Shared Playwright browser closed")
+
+
+class PagePool:
+    """
+    Reusable Playwright pages on one browser context.
+    
+    Pages are opened lazily, up to size at once, and handed back for the
+    next URL instead of being closed, saving a CDP target and session per
+    navigation. A page whose user raised is closed rather than reused, and
+    its slot is freed so a waiting caller opens a fresh page in its place.
+    """
+
+    def __init__(self, context, size: int):
+        """
+        Initialize the pool.
+        
+        Args:
+            context: Playwright browser context pages are opened in
+            size: Maximum number of pages open at once
+        """
+        self.context = context
+        self.size = size
+        self._pages = []
+        self._idle = []
+        self._slots = asyncio.Semaphore(size)
+
+    @asynccontextmanager
+    async def page(self):
+        """Borrow a page for the duration of the block."""
+        async with self._slots:
+            if self._idle:
+                page = self._idle.pop()
+            else:
+                page = await self.context.new_page()
+                self._pages.append(page)
+
+            try:
+                yield page
+            except BaseException:
+                self._pages.remove(page)
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+                raise
+            self._idle.append(page)
+
+    async def close(self) -> None:
+        """Close every page the pool opened."""
+        pages, self._pages = self._pages, []
+        self._idle = []
+        for page in pages:
+            try:
+                await page.close()
+            except Exception as e:
+                logger.debug("Error closing page: %.100s", e)
@@ -3,15 +3,38 @@ Scraper for BeYcome.com - Uses Playwright for JavaScript rendering.
 """
 
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import logging
 import re
 import asyncio
+import json
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, PlaywrightPool
+from parsers.html_parser import AddressParser
 
 logger = logging.getLogger(__name__)
 
+# "Street, City, ST 12345"
+_ADDR_FULL_RE = re.compile(r'^(.+?),\s+(.+?),\s+([A-Z]{2})\s+(\d{5})')
+# "<address>, ST 12345", with street and city split afterwards
+_ADDR_PARTIAL_RE = re.compile(r'(.+?),\s+([A-Z]{2})\s+(\d{5})')
+# _ADDR_PARTIAL_RE's ", ST 12345" tail with whitespace removed
+_PAGE_HAS_ADDRESS_RE = re.compile(r',[A-Z]{2}\d{5}')
+_STATE_ZIP_RE = re.compile(r'([A-Z]{2})\s+(\d{5})')
+_ADDR_CLASS_RE = re.compile('address|street|title', re.I)
+_STREET_TEXT_RE = re.compile(r'\d+\s+\w+')
+
+_LISTING_SELECTOR = 'a[href*="/listing/"], [class*="listing"], [class*="card"]'
+# Listing card selectors, most specific first
+_LISTING_SELECTORS = (
+    'a[href*="/listing/"]',
+    'div[class*="listing"]',
+    'article',
+    '[class*="property-card"]',
+)
+_ALL_LISTING_SELECTOR = ', '.join(_LISTING_SELECTORS)
+_COUNT_LISTINGS_JS = 'sel => document.querySelectorAll(sel).length'
+
 
 class BeycomeScraper(BaseScraper):
     """
@@ -19,6 +42,9 @@ class BeycomeScraper(BaseScraper):
     Uses Playwright for JavaScript rendering since the site is a React SPA.
     """
 
+    # Browser pages are heavier than plain HTTP requests
+    max_concurrency = 4
+
     def __init__(self, max_listings: int = 10, scrape_url: str = None):
         """
         Initialize BeYcome scraper.
@@ -35,83 +61,100 @@ class BeycomeScraper(BaseScraper):
         )
         self.max_listings = max_listings
         self.scrape_url = scrape_url or "https://www.beycome.com/for-sale/detroit-mi"
-        self.browser = None
         self.context = None
-        self.playwright_instance = None
 
     async def setup_browser(self):
-        """Initialize Playwright browser."""
-        try:
-            from playwright.async_api import async_playwright
-            
-            self.playwright_instance = await async_playwright().start()
-            self.browser = await self.playwright_instance.chromium.launch(headless=True)
-            self.context = await self.browser.new_context(
-                viewport={'width': 1280, 'height': 720}
-            )
-            logger.debug(f"Browser initialized for {self.source_name}")
-        except ImportError:
-            logger.error("Playwright not installed. Install with: pip install playwright && playwright install")
-            raise
-
-    async def cleanup_browser(self):
-        """Close browser and cleanup."""
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright_instance:
-            await self.playwright_instance.stop()
-        logger.debug(f"Browser closed for {self.source_name}")
-
-    async def get_page_content(self, url: str) -> str:
+        """Get this scraper's context from the shared Playwright browser."""
+        self.context = await PlaywrightPool.get_context(
+            self.source_name,
+            setup=self._configure_context,
+            viewport={'width': 1280, 'height': 720},
+            java_script_enabled=True,
+            bypass_csp=True
+        )
+
+    @classmethod
+    async def _configure_context(cls, context) -> None:
+        """Set up request blocking and stealth on a new context."""
+        # Listings come from the DOM or JSON feed, so static assets are never needed
+        await PlaywrightPool.block_assets(context)
+        await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => false})")
+
+    async def get_page_content(self, url: str, feed: Optional[List] = None) -> str:
         """
         Get page content using Playwright browser.
         
         Args:
             url: URL to fetch
+            feed: If given, JSON bodies of the page's XHR/fetch responses
+                are appended to it
             
         Returns:
             HTML content of the page
         """
+        cached = self.html_cache.get(url)
+        if cached is not None:
+            return cached
+
+        page = None
         try:
-            if not self.browser:
-                await self.setup_browser()
-            
+            await self.setup_browser()
             page = await self.context.new_page()
+
+            responses = []
+
+            def collect_json(response):
+                if (response.request.resource_type in ('xhr', 'fetch')
+                        and 'json' in response.headers.get('content-type', '')):
+                    responses.append(response)
+
+            if feed is not None:
+                page.on('response', collect_json)
             
             try:
-                # Use load event with reasonable timeout
-                await page.goto(url, wait_until='load', timeout=15000)
+                # Listings are waited for explicitly below, so the DOM is enough
+                await page.goto(url, wait_until='domcontentloaded', timeout=8000)
             except Exception as e:
                 logger.debug(f"Page load timeout: {str(e)[:50]}, continuing")
             
             # Wait for listings to load
             try:
-                await page.wait_for_selector('a[href*="/listing/"], [class*="listing"], [class*="card"]', timeout=4000)
-            except:
+                await page.wait_for_selector(_LISTING_SELECTOR, timeout=4000)
+            except Exception:
                 logger.debug("Listing selectors not found immediately")
             
-            # Scroll to trigger lazy loading
-            for i in range(2):
+            # Scroll once to trigger lazy loading, but only wait for it when
+            # the first render did not already hold enough listings
+            try:
+                count = await page.evaluate(_COUNT_LISTINGS_JS, _LISTING_SELECTOR)
+                if count < self.max_listings:
+                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                    await page.wait_for_function(
+                        f"n => ({_COUNT_LISTINGS_JS})({json.dumps(_LISTING_SELECTOR)}) > n",
+                        arg=count,
+                        timeout=1500
+                    )
+            except Exception:
+                pass
+            
+            for response in responses:
                 try:
-                    await page.evaluate("window.scrollBy(0, 500)")
-                    await page.wait_for_load_state("networkidle", timeout=1500)
-                except:
+                    feed.append(await response.json())
+                except Exception:
                     pass
-            
-            # Get page content
+
             content = await page.content()
-            await page.close()
-            
+            self.html_cache.put(url, content)
             return content if content else ""
         except Exception as e:
             logger.warning(f"⚠️  Error fetching {url}: {str(e)[:100]}")
-            try:
-                await page.close()
-            except:
-                pass
             return ""
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
 
     def get_listing_urls(self) -> List[str]:
         """
@@ -132,86 +175,76 @@ class BeycomeScraper(BaseScraper):
         Returns:
             List of extracted listings
         """
-        listings = []
-        soup = BeautifulSoup(content, 'html.parser')
-
-        # Try multiple selectors for listings
-        listing_selectors = [
-            'a[href*="/listing/"]',
-            'div[class*="listing"]',
-            'article',
-            '[class*="property-card"]'
-        ]
-        
-        links = []
-        for selector in listing_selectors:
-            links = soup.select(selector)
-            if links:
-                logger.debug(f"Found {len(links)} potential listings with selector: {selector}")
-                break
+        listings = _parse_listings_page(content, self.max_listings, self.base_url)
+        logger.info(f"Parsed {len(listings)} listings from {self.source_name}")
+        return listings
+
+    @staticmethod
+    def _listing_selector_rank(node) -> int:
+        """Return the index of the first _LISTING_SELECTORS entry the node matches."""
+        attrs = node.attributes
+        if node.tag == 'a' and '/listing/' in (attrs.get('href') or ''):
+            return 0
+        css_class = attrs.get('class') or ''
+        if node.tag == 'div' and 'listing' in css_class:
+            return 1
+        if node.tag == 'article':
+            return 2
+        return 3
+
+    @staticmethod
+    def _find_parent(node, tags):
+        """Return the nearest ancestor whose tag is in tags, or None."""
+        parent = node.parent
+        while parent is not None and parent.tag not in tags:
+            parent = parent.parent
+        return parent
+
+    @staticmethod
+    def _find_address_text(card) -> str:
+        """
+        Find address text inside a listing card.
         
-        for idx, link in enumerate(links[:self.max_listings]):
-            try:
-                # Get listing URL
-                listing_url = link.get('href', '') if link.name == 'a' else ''
-                if not listing_url:
-                    link_elem = link.find('a', href=True)
-                    if link_elem:
-                        listing_url = link_elem['href']
-                
-                if not listing_url:
-                    continue
-                
-                if not listing_url.startswith('http'):
-                    listing_url = self.base_url + listing_url
-                
-                # Get card/container
-                card = link if link.name in ['article', 'div'] else link.find_parent(['div', 'article', 'li'])
-                if not card:
-                    card = link.parent
-                
-                # Extract address text
-                address_text = ""
-                
-                # Try to find address in common locations
-                address_elem = (
-                    card.find('h2') or
-                    card.find('h3') or
-                    card.find(['span', 'div'], class_=re.compile('address|street|title', re.I)) or
-                    card.find(string=re.compile(r'\d+\s+\w+', re.I))
-                )
-                
-                if address_elem:
-                    address_text = address_elem.get_text(strip=True) if hasattr(address_elem, 'get_text') else str(address_elem)
-                
-                # Fallback: get card text
-                if not address_text:
-                    address_text = card.get_text(strip=True)[:150]
-                
-                if not address_text:
-                    continue
-                
-                # Extract address components
-                address_match = self._extract_address_components(address_text)
-                
-                if address_match:
-                    listing = {
-                        'street': address_match.get('street', ''),
-                        'city': address_match.get('city', ''),
-                        'state': address_match.get('state', ''),
-                        'zip_code': address_match.get('zip_code', ''),
-                        'listing_url': listing_url
-                    }
-                    
-                    listings.append(listing)
-                    logger.debug(f"Extracted listing {idx+1}: {address_match}")
+        Checks, in order: an h2, an h3, a span/div whose class mentions
+        address/street/title, then the first text node that looks like
+        a street number and name.
+        """
+        heading = card.css_first('h2') or card.css_first('h3')
+        if heading:
+            return heading.text(strip=True)
 
-            except Exception as e:
-                logger.debug(f"Error parsing BeYcome listing: {str(e)[:100]}")
-                continue
+        for node in card.css('span[class], div[class]'):
+            # css() also matches the card itself; only descendants count
+            if node != card and _ADDR_CLASS_RE.search(node.attributes.get('class') or ''):
+                return node.text(strip=True)
 
-        logger.info(f"Parsed {len(listings)} listings from {self.source_name}")
-        return listings
+        for node in card.traverse(include_text=True):
+            if node.tag == '-text':
+                text = node.text_content or ''
+                if _STREET_TEXT_RE.search(text):
+                    return text.strip()
+
+        return ''
+
+    @staticmethod
+    def _text_prefix(card, limit: int) -> str:
+        """
+        Return card.text(strip=True)[:limit] without joining the whole subtree.
+        
+        Text nodes are stripped and concatenated only until limit
+        characters have been collected.
+        """
+        parts = []
+        length = 0
+        for node in card.traverse(include_text=True):
+            if node.tag == '-text':
+                text = (node.text_content or '').strip()
+                if text:
+                    parts.append(text)
+                    length += len(text)
+                    if length >= limit:
+                        break
+        return ''.join(parts)[:limit]
 
     @staticmethod
     def _extract_address_components(text: str) -> Optional[Dict[str, str]]:
@@ -225,9 +258,21 @@ class BeycomeScraper(BaseScraper):
             Dict with street, city, state, zip_code or None
         """
         try:
+            # Fast path for the exact "Street, City, ST 12345" shape: plain
+            # splits plus one anchored match on the short tail
+            if text.count(',') == 2 and '\n' not in text:
+                street, city, tail = text.split(',')
+                state_zip = _STATE_ZIP_RE.fullmatch(tail.strip())
+                if state_zip and street.strip() and city.strip() and city[:1].isspace() and tail[:1].isspace():
+                    return {
+                        'street': street.strip(),
+                        'city': city.strip(),
+                        'state': state_zip.group(1),
+                        'zip_code': state_zip.group(2)
+                    }
+
             # Pattern: "Street, City, State ZIP"
-            pattern = r'^(.+?),\s+(.+?),\s+([A-Z]{2})\s+(\d{5})'
-            match = re.search(pattern, text)
+            match = _ADDR_FULL_RE.match(text)
             
             if match:
                 return {
@@ -238,8 +283,7 @@ class BeycomeScraper(BaseScraper):
                 }
             
             # Try to find state and zip
-            pattern2 = r'(.+?),\s+([A-Z]{2})\s+(\d{5})'
-            match2 = re.search(pattern2, text)
+            match2 = _ADDR_PARTIAL_RE.search(text)
             
             if match2:
                 full_address = match2.group(1).strip()
@@ -258,7 +302,7 @@ class BeycomeScraper(BaseScraper):
             
             return None
         except Exception as e:
-            logger.debug(f"Error extracting address: {str(e)[:100]}")
+            logger.debug("Error extracting address: %.100s", e)
             return None
 
     def scrape(self) -> List[Dict]:
@@ -269,12 +313,8 @@ class BeycomeScraper(BaseScraper):
             List of normalized listings
         """
         try:
-            # Try to run async scrape in event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self._scrape_async())
-            loop.close()
-            return result
+            # The shared browser lives on the pool's event loop
+            return PlaywrightPool.run(self._scrape_async())
         except RuntimeError:
             logger.warning(f"Could not run Playwright for {self.source_name} - event loop already active")
             return []
@@ -282,39 +322,65 @@ class BeycomeScraper(BaseScraper):
             logger.error(f"Error in {self.source_name}: {str(e)[:100]}")
             return []
 
+    async def scrape_async(self) -> List[Dict]:
+        """
+        Execute scraping from inside a running event loop.
+        
+        Returns:
+            List of normalized listings
+        """
+        return await PlaywrightPool.run_async(self._scrape_async())
+
     async def _scrape_async(self) -> List[Dict]:
         """Async version of scrape."""
-        all_listings = []
+        found = 0
+        normalized = []
         
         logger.info(f"Starting scrape of {self.source_name}")
         
         try:
-            await self.setup_browser()
-            
             listing_urls = self.get_listing_urls()
             logger.info(f"Found {len(listing_urls)} pages to scrape from {self.source_name}")
             
-            for url in listing_urls:
+            # Pages share the browser context. Parsing runs on a worker
+            # thread so it overlaps with pages still loading
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            loop = asyncio.get_running_loop()
+
+            async def fetch_and_parse(url: str) -> List[Dict]:
                 try:
-                    logger.debug(f"Fetching {url} with Playwright...")
-                    content = await self.get_page_content(url)
+                    feed = []
+                    async with semaphore:
+                        await self._get_token_bucket(url).wait_for_token()
+                        logger.debug(f"Fetching {url} with Playwright...")
+                        content = await self.get_page_content(url, feed)
+
+                    # The SPA renders from its own JSON API; read that when
+                    # it carries addresses instead of walking the DOM
+                    listings = self._listings_from_feed(feed)
+                    if listings:
+                        logger.debug(f"Scraped {len(listings)} listings from JSON feed of {url}")
+                        return listings
                     
                     if not content:
                         logger.warning(f"No content retrieved from {url}")
-                        continue
+                        return []
                     
-                    listings = self.parse_listings(content)
-                    all_listings.extend(listings)
-                    logger.debug(f"Scraped {len(listings)} listings from {url}")
+                    listings = await loop.run_in_executor(
+                        None, _parse_listings_page, content, self.max_listings, self.base_url
+                    )
+                    logger.info(f"Parsed {len(listings)} listings from {self.source_name}")
+                    return listings
                 except Exception as e:
                     logger.warning(f"Error scraping {url}: {str(e)[:100]}")
-                    continue
+                    return []
+
+            seen = set()
+            for listings in await asyncio.gather(*(fetch_and_parse(url) for url in listing_urls)):
+                found += len(listings)
+                normalized.extend(self._normalize_batch(self._dedupe_listings(listings, seen)))
             
-            if all_listings:
-                # Normalize addresses
-                normalized = [self._normalize_listing(listing) for listing in all_listings]
-                normalized = [l for l in normalized if l is not None]
-                
+            if found:
                 logger.info(f"Completed scrape of {self.source_name}: {len(normalized)} valid listings")
                 return normalized
             else:
@@ -324,11 +390,107 @@ class BeycomeScraper(BaseScraper):
         except Exception as e:
             logger.warning(f"Error in {self.source_name} scraper: {str(e)[:100]}")
             return []
-        
-        finally:
-            await self.cleanup_browser()
 
     def close(self) -> None:
         """Close session and cleanup."""
         super().close()
         logger.debug(f"Closed scraper for {self.source_name}")
+
+
+def _parse_listings_page(content: str, max_listings: int, base_url: str) -> List[Dict]:
+    """
+    Parse BeYcome listing HTML from page.
+    
+    Shares no scraper state, so it can run on a worker thread.
+    
+    Args:
+        content: HTML content
+        max_listings: Maximum number of listings to return
+        base_url: Prefix for relative listing URLs
+        
+    Returns:
+        List of extracted listings
+    """
+    listings = []
+    tree = LexborHTMLParser(content)
+
+    # Every address path below needs ", ST 12345" somewhere in the page
+    # text; one scan of the whitespace-free text rules pages out early
+    body = tree.body
+    if body is None:
+        return listings
+    page_text = body.text(separator='\n')
+    if not _PAGE_HAS_ADDRESS_RE.search(''.join(page_text.split())):
+        return listings
+
+    # One pass over the tree for all candidate selectors; keep only the
+    # nodes of the highest-priority selector that matched anything
+    links = []
+    best = len(_LISTING_SELECTORS)
+    for node in tree.css(_ALL_LISTING_SELECTOR):
+        rank = BeycomeScraper._listing_selector_rank(node)
+        if rank < best:
+            best, links = rank, [node]
+        elif rank == best and len(links) < max_listings:
+            links.append(node)
+        # Nothing outranks the first selector, so stop once it has enough
+        if best == 0 and len(links) >= max_listings:
+            break
+    if links:
+        logger.debug(f"Found {len(links)} potential listings with selector: {_LISTING_SELECTORS[best]}")
+    
+    for idx, link in enumerate(links):
+        try:
+            # Get listing URL
+            listing_url = (link.attributes.get('href') or '') if link.tag == 'a' else ''
+            if not listing_url:
+                link_elem = link.css_first('a[href]')
+                if link_elem:
+                    listing_url = link_elem.attributes.get('href') or ''
+            
+            if not listing_url:
+                continue
+            
+            if not listing_url.startswith('http'):
+                listing_url = base_url + listing_url
+            
+            # Get card/container
+            card = link if link.tag in ('article', 'div') else BeycomeScraper._find_parent(link, ('div', 'article', 'li'))
+            if not card:
+                card = link.parent
+            
+            # Extract address text from common locations
+            address_text = BeycomeScraper._find_address_text(card)
+            
+            # Fallback: get card text
+            if not address_text:
+                address_text = BeycomeScraper._text_prefix(card, 150)
+            
+            if not address_text:
+                continue
+            
+            # Extract address components
+            address_match = BeycomeScraper._extract_address_components(address_text)
+            
+            if address_match:
+                listing = {
+                    'street': address_match.get('street', ''),
+                    'city': address_match.get('city', ''),
+                    'state': address_match.get('state', ''),
+                    'zip_code': address_match.get('zip_code', ''),
+                    'listing_url': listing_url
+                }
+                
+                listings.append(listing)
+                logger.debug("Extracted listing %d: %s", idx + 1, address_match)
+
+        except Exception as e:
+            logger.debug("Error parsing BeYcome listing: %.100s", e)
+            continue
+
+    # Addresses on the page but no usable cards: take them from the text
+    if not listings:
+        for address in AddressParser.find_addresses(page_text, max_listings):
+            listings.append({**address, 'listing_url': ''})
+
+    return listings
@@ -3,15 +3,53 @@ Scraper for ByOwner.com - Uses Playwright for JavaScript rendering.
 """
 
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
 import logging
 import re
 import asyncio
+from lxml import etree
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, PlaywrightPool, PagePool
+from parsers.html_parser import HTMLParser
 
 logger = logging.getLogger(__name__)
 
+# "Street, City, ST 12345"
+_ADDR_CANON_RE = re.compile(r'^(.+?),\s+(.+?),\s+([A-Z]{2})\s+(\d{5})')
+# "Street | City, ST 12345"
+_ADDR_PIPE_RE = re.compile(r'^([^|]+)\|\s*(.+?),\s+([A-Z]{2})\s+(\d{5})')
+# Cloudflare interstitial / block page markers
+_BLOCKED_RE = re.compile(r'Cloudflare|(?i:blocked)')
+# Card selectors, most preferred first: div[data-test*="listing"],
+# div.listing-card, article[data-test*="property"], li[data-test*="property"]
+_PROPERTY_CARDS_XPATH = etree.XPath(
+    '//div[contains(@data-test, "listing")]'
+    ' | //div[contains(concat(" ", normalize-space(@class), " "), " listing-card ")]'
+    ' | //article[contains(@data-test, "property")]'
+    ' | //li[contains(@data-test, "property")]'
+)
+_PROPERTY_CLASS_RE = re.compile('property|listing|card', re.I)
+_ADDR_CLASS_RE = re.compile('address|street', re.I)
+_LOC_CLASS_RE = re.compile('address|location', re.I)
+_LISTING_HREF_RE = re.compile(r'/\d+/|/property/')
+_ADDRESS_TAGS = ('span', 'div', 'h2', 'h3')
+
+
+def _first_ranked(nodes: List, rank) -> List:
+    """Keep the nodes with the best (lowest) rank, in document order."""
+    ranks = [rank(node) for node in nodes]
+    best = min(ranks, default=None)
+    return [node for node, r in zip(nodes, ranks) if r == best]
+
+
+def _address_elem_rank(element) -> Optional[int]:
+    """Rank address candidates: span.address/street, div.address/location, h2, h3."""
+    tag = element.tag
+    if tag == 'span':
+        return 0 if _ADDR_CLASS_RE.search(element.get('class', '')) else None
+    if tag == 'div':
+        return 1 if _LOC_CLASS_RE.search(element.get('class', '')) else None
+    return 2 if tag == 'h2' else 3
+
 
 class ByOwnerComScraper(BaseScraper):
     """
@@ -19,6 +57,9 @@ class ByOwnerComScraper(BaseScraper):
     Uses Playwright for JavaScript rendering since the site is heavily JS-based.
     """
 
+    # Browser pages are heavier than plain HTTP requests
+    max_concurrency = 4
+
     def __init__(self, max_listings: int = 10, scrape_url: str = None):
         """
         Initialize ByOwner.com scraper.
@@ -35,32 +76,25 @@ class ByOwnerComScraper(BaseScraper):
         )
         self.max_listings = max_listings
         self.scrape_url = scrape_url or f"{self.base_url}/miami/florida"
-        self.browser = None
         self.context = None
-        self.playwright_instance = None
+        self.pages = None
 
     async def setup_browser(self):
-        """Initialize Playwright browser."""
-        try:
-            from playwright.async_api import async_playwright
-            
-            self.playwright_instance = await async_playwright().start()
-            self.browser = await self.playwright_instance.chromium.launch(headless=True)
-            self.context = await self.browser.new_context()
-            logger.debug(f"Browser initialized for {self.source_name}")
-        except ImportError:
-            logger.error("Playwright not installed. Install with: pip install playwright && playwright install")
-            raise
+        """Get a context from the shared Playwright browser."""
+        self.context = await PlaywrightPool.get_context(
+            self.source_name, setup=PlaywrightPool.block_assets
+        )
+        self.pages = PagePool(self.context, self.max_concurrency)
+        logger.debug(f"Browser context ready for {self.source_name}")
 
     async def cleanup_browser(self):
-        """Close browser and cleanup."""
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright_instance:
-            await self.playwright_instance.stop()
-        logger.debug(f"Browser closed for {self.source_name}")
+        """Close this scraper's pages and context; the shared browser stays up."""
+        if self.pages is not None:
+            await self.pages.close()
+            self.pages = None
+        await PlaywrightPool.close_context(self.source_name)
+        self.context = None
+        logger.debug(f"Browser context closed for {self.source_name}")
 
     async def get_page_content(self, url: str) -> str:
         """
@@ -72,36 +106,38 @@ class ByOwnerComScraper(BaseScraper):
         Returns:
             HTML content of the page
         """
+        cached = self.html_cache.get(url)
+        if cached is not None:
+            return cached
+
         try:
-            if not self.browser:
+            if not self.context:
                 await self.setup_browser()
             
-            page = await self.context.new_page()
-            
-            # Navigate to page
-            await page.goto(url, wait_until='networkidle', timeout=30000)
-            
-            # Get page content first to check for Cloudflare
-            content = await page.content()
+            async with self.pages.page() as page:
+                # Navigate to page; ad beacons keep networkidle from ever settling,
+                # so the listing selector below is the readiness signal
+                try:
+                    await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+                except Exception as e:
+                    logger.debug(f"Page load timeout: {str(e)[:50]}, continuing")
+                
+                # Try to wait for listings to load
+                try:
+                    await page.wait_for_selector('[data-test*="listing"], .listing-card, [class*="property"]', timeout=5000)
+                except Exception:
+                    logger.debug("Listing selectors not found, checking for any content...")
+                
+                # Serialize the DOM once and check it for Cloudflare in place
+                content = await page.content()
             
-            if 'Cloudflare' in content or 'blocked' in content.lower():
+            if _BLOCKED_RE.search(content):
                 logger.warning(f"⚠️  Cloudflare protection detected on {url}. Site may be blocking automated requests.")
                 logger.warning("    Install: pip install undetected-chromedriver")
                 logger.warning("    Or configure proxy rotation in site settings")
-                await page.close()
                 return ""
             
-            # Try to wait for listings to load
-            try:
-                await page.wait_for_selector('[data-test*="listing"], .listing-card, [class*="property"]', timeout=5000)
-            except:
-                logger.debug("Listing selectors not found, checking for any content...")
-                # Try to find any listings even without specific selectors
-                pass
-            
-            content = await page.content()
-            await page.close()
-            
+            self.html_cache.put(url, content)
             return content
         except Exception as e:
             logger.warning(f"⚠️  Error fetching {url}: {str(e)[:100]}")
@@ -129,47 +165,38 @@ class ByOwnerComScraper(BaseScraper):
             List of extracted listings
         """
         listings = []
-        soup = BeautifulSoup(content, 'html.parser')
-
-        # Look for property listings - various selectors for flexibility
-        property_selectors = [
-            'div[data-test*="listing"]',
-            'div.listing-card',
-            'article[data-test*="property"]',
-            'li[data-test*="property"]'
-        ]
-        
-        # Try multiple selectors
-        property_cards = None
-        for selector in property_selectors:
-            property_cards = soup.select(selector)
-            if property_cards:
-                logger.debug(f"Found {len(property_cards)} listings using selector: {selector}")
-                break
+        root = HTMLParser.parse_tree(content)
+        if root is None:
+            logger.info("Parsed 0 listings from ByOwner.com")
+            return listings
+
+        # Look for property listings - various selectors for flexibility,
+        # matched in a single pass over the tree
+        property_cards = _first_ranked(_PROPERTY_CARDS_XPATH(root), self._property_card_rank)
+        if property_cards:
+            logger.debug(f"Found {len(property_cards)} listings using combined property selectors")
         
         if not property_cards:
             # Fallback: look for any div with property information
-            property_cards = soup.find_all('div', class_=re.compile('property|listing|card', re.I))
+            property_cards = [div for div in root.iter('div') if _PROPERTY_CLASS_RE.search(div.get('class', ''))]
             logger.debug(f"Using fallback selector, found {len(property_cards)} potential cards")
 
-        for idx, card in enumerate(property_cards[:self.max_listings]):
+        # Cards without a usable address don't count towards max_listings
+        for idx, card in enumerate(property_cards):
+            if len(listings) >= self.max_listings:
+                break
             try:
                 # Extract address from various possible locations
                 address_text = ""
                 
-                # Try common address locations
-                address_elem = (
-                    card.find('span', class_=re.compile('address|street', re.I)) or
-                    card.find('div', class_=re.compile('address|location', re.I)) or
-                    card.find('h2') or
-                    card.find('h3')
-                )
+                # Try common address locations, in priority order, in one walk
+                address_elem = HTMLParser.first_by_rank(card, _ADDRESS_TAGS, _address_elem_rank)
                 
-                if address_elem:
-                    address_text = address_elem.get_text(strip=True)
+                if address_elem is not None:
+                    address_text = HTMLParser.get_element_text(address_elem)
                 else:
                     # Try to extract from text content
-                    address_text = card.get_text(strip=True)[:200]
+                    address_text = HTMLParser.get_element_text(card, 200)
                 
                 if not address_text:
                     continue
@@ -187,8 +214,9 @@ class ByOwnerComScraper(BaseScraper):
                     }
                     
                     # Try to find listing URL
-                    link = card.find('a', href=re.compile(r'/\d+/|/property/'))
-                    if link:
+                    link = next((a for a in card.iterdescendants('a')
+                                 if _LISTING_HREF_RE.search(a.get('href', ''))), None)
+                    if link is not None:
                         listing['listing_url'] = link.get('href', '')
                         if not listing['listing_url'].startswith('http'):
                             listing['listing_url'] = self.base_url + listing['listing_url']
@@ -200,9 +228,23 @@ class ByOwnerComScraper(BaseScraper):
                 logger.debug(f"Error parsing listing card: {e}")
                 continue
 
+        # Listings hold plain strings only; release the page tree now
+        root.clear()
+
         logger.info(f"Parsed {len(listings)} listings from ByOwner.com")
         return listings
 
+    @staticmethod
+    def _property_card_rank(card) -> int:
+        """Return the index of the _PROPERTY_CARDS_XPATH branch the card matches first."""
+        if card.tag == 'div' and 'listing' in card.get('data-test', ''):
+            return 0
+        if card.tag == 'div' and 'listing-card' in card.get('class', '').split():
+            return 1
+        if card.tag == 'article':
+            return 2
+        return 3
+
     @staticmethod
     def _extract_address_components(text: str) -> Optional[Dict[str, str]]:
         """
@@ -216,8 +258,7 @@ class ByOwnerComScraper(BaseScraper):
         """
         try:
             # Pattern: "Street, City, State ZIP"
-            pattern = r'^(.+?),\s+(.+?),\s+([A-Z]{2})\s+(\d{5})'
-            match = re.search(pattern, text)
+            match = _ADDR_CANON_RE.match(text)
             
             if match:
                 return {
@@ -228,8 +269,7 @@ class ByOwnerComScraper(BaseScraper):
                 }
             
             # Alternative pattern: Street | City, State ZIP
-            pattern2 = r'^([^|]+)\|\s*(.+?),\s+([A-Z]{2})\s+(\d{5})'
-            match2 = re.search(pattern2, text)
+            match2 = _ADDR_PIPE_RE.match(text)
             
             if match2:
                 return {
@@ -253,12 +293,8 @@ class ByOwnerComScraper(BaseScraper):
             List of normalized listings (empty until Cloudflare bypass is implemented)
         """
         try:
-            # Try to run async scrape in event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self._scrape_async())
-            loop.close()
-            return result
+            # The shared browser lives on the pool's event loop
+            return PlaywrightPool.run(self._scrape_async())
         except RuntimeError:
             # If event loop is already running, return empty
             logger.warning(f"Could not run Playwright for {self.source_name} - event loop already active")
@@ -268,9 +304,19 @@ class ByOwnerComScraper(BaseScraper):
             logger.error(f"Error in {self.source_name}: {str(e)[:100]}")
             return []
 
+    async def scrape_async(self) -> List[Dict]:
+        """
+        Execute scraping from inside a running event loop.
+        
+        Returns:
+            List of normalized listings
+        """
+        return await PlaywrightPool.run_async(self._scrape_async())
+
     async def _scrape_async(self) -> List[Dict]:
         """Async version of scrape."""
         all_listings = []
+        seen = set()
         
         logger.info(f"Starting scrape of {self.source_name}")
         logger.warning(f"⚠️  Note: {self.source_name} uses Cloudflare protection")
@@ -282,26 +328,38 @@ class ByOwnerComScraper(BaseScraper):
             listing_urls = self.get_listing_urls()
             logger.info(f"Found {len(listing_urls)} pages to scrape from {self.source_name}")
             
-            for url in listing_urls:
+            # Each URL gets its own page in the shared context; the semaphore
+            # and per-host token bucket keep the load on the site bounded
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            loop = asyncio.get_running_loop()
+
+            async def fetch_and_parse(url: str) -> List[Dict]:
                 try:
-                    logger.debug(f"Fetching {url} with Playwright...")
-                    content = await self.get_page_content(url)
+                    async with semaphore:
+                        await self._get_token_bucket(url).wait_for_token()
+                        logger.debug(f"Fetching {url} with Playwright...")
+                        content = await self.get_page_content(url)
                     
                     if not content:
                         logger.warning(f"No content retrieved from {url}")
-                        continue
+                        return []
                     
-                    listings = self.parse_listings(content)
-                    all_listings.extend(listings)
+                    # Parse on a worker thread so the loop keeps driving the
+                    # other pages' navigations meanwhile
+                    listings = await loop.run_in_executor(None, self.parse_listings, content)
                     logger.debug(f"Scraped {len(listings)} listings from {url}")
+                    return listings
                 except Exception as e:
                     logger.warning(f"Error scraping {url}: {str(e)[:100]}")
-                    continue
+                    return []
+
+            for listings in await asyncio.gather(*(fetch_and_parse(url) for url in listing_urls)):
+                all_listings.extend(self._dedupe_listings(listings, seen))
             
             if all_listings:
                 # Normalize addresses
-                normalized = [self._normalize_listing(listing) for listing in all_listings]
-                normalized = [l for l in normalized if l is not None]
+                normalized = self._normalize_batch(all_listings)
                 
                 logger.info(f"Completed scrape of {self.source_name}: {len(normalized)} valid listings")
                 return normalized
@@ -3,16 +3,50 @@ Scraper for Craigslist housing classifieds (by-owner listings).
 Uses Playwright for JavaScript rendering since Craigslist moved to dynamic content.
 """
 
-from typing import List, Dict
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional
 import logging
 import re
 import asyncio
+from lxml import etree
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, PlaywrightPool, PagePool
+from parsers.html_parser import HTMLParser, AddressParser
 
 logger = logging.getLogger(__name__)
 
+# Bytes fed to the streaming parser at a time
+_FEED_CHUNK_SIZE = 64 * 1024
+_TITLE_TAGS = ('span', 'a', 'h2', 'h3')
+_ZIP_RE = re.compile(r'\b(\d{5})\b')
+_STATE_RE = re.compile(r'\b([A-Z]{2})\b')
+# Step through the page one viewport at a time so lazy rows render
+_SCROLL_TO_BOTTOM_JS = """
+async () => {
+    const step = window.innerHeight;
+    for (let y = 0; y < document.body.scrollHeight; y += step) {
+        window.scrollTo(0, y);
+        await new Promise(r => setTimeout(r, 100));
+    }
+}
+"""
+_ENOUGH_LISTINGS_JS = "n => document.querySelectorAll('[data-pid]').length >= n"
+
+
+def _is_result_title(element) -> bool:
+    """Check for the result-title class (BeautifulSoup's class_='result-title')."""
+    css_class = element.get('class', '')
+    return 'result-title' in css_class.split() or css_class == 'result-title'
+
+
+def _title_elem_rank(element) -> Optional[int]:
+    """Rank title candidates: span.result-title, a.result-title, a, h2, h3."""
+    tag = element.tag
+    if tag == 'span':
+        return 0 if _is_result_title(element) else None
+    if tag == 'a':
+        return 1 if _is_result_title(element) else 2
+    return 3 if tag == 'h2' else 4
+
 
 class CraigslistHousingScraper(BaseScraper):
     """
@@ -21,40 +55,42 @@ class CraigslistHousingScraper(BaseScraper):
     Uses Playwright for JavaScript rendering.
     """
 
-    def __init__(self):
-        """Initialize Craigslist housing scraper."""
+    # Browser pages are heavier than plain HTTP requests
+    max_concurrency = 4
+
+    def __init__(self, max_listings: int = 50):
+        """
+        Initialize Craigslist housing scraper.
+        
+        Args:
+            max_listings: Maximum number of listings to parse per search page
+        """
         super().__init__(
             source_name='Craigslist Housing',
             base_url='https://craigslist.org',
             min_delay=2.0,
             max_delay=5.0
         )
-        self.browser = None
+        self.max_listings = max_listings
         self.context = None
-        self.playwright_instance = None
+        self.pages = None
 
     async def setup_browser(self):
-        """Initialize Playwright browser."""
-        try:
-            from playwright.async_api import async_playwright
-            
-            self.playwright_instance = await async_playwright().start()
-            self.browser = await self.playwright_instance.chromium.launch(headless=True)
-            self.context = await self.browser.new_context()
-            logger.debug(f"Browser initialized for {self.source_name}")
-        except ImportError:
-            logger.error("Playwright not installed. Install with: pip install playwright && playwright install")
-            raise
+        """Get a context from the shared Playwright browser."""
+        self.context = await PlaywrightPool.get_context(
+            self.source_name, setup=PlaywrightPool.block_assets
+        )
+        self.pages = PagePool(self.context, self.max_concurrency)
+        logger.debug(f"Browser context ready for {self.source_name}")
 
     async def cleanup_browser(self):
-        """Close browser and cleanup."""
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright_instance:
-            await self.playwright_instance.stop()
-        logger.debug(f"Browser closed for {self.source_name}")
+        """Close this scraper's pages and context; the shared browser stays up."""
+        if self.pages is not None:
+            await self.pages.close()
+            self.pages = None
+        await PlaywrightPool.close_context(self.source_name)
+        self.context = None
+        logger.debug(f"Browser context closed for {self.source_name}")
 
     def get_listing_urls(self) -> List[str]:
         """
@@ -95,51 +131,58 @@ class CraigslistHousingScraper(BaseScraper):
         Returns:
             HTML content of the page
         """
+        cached = self.html_cache.get(url)
+        if cached is not None:
+            return cached
+
         try:
-            if not self.browser:
+            if not self.context:
                 await self.setup_browser()
             
-            page = await self.context.new_page()
-            
-            try:
-                # Use load event instead of domcontentloaded for faster loading
-                await page.goto(url, wait_until='load', timeout=20000)
-            except Exception as e:
-                logger.debug(f"Initial load took time, continuing: {str(e)[:50]}")
-                # Continue even if it times out
-                pass
-            
-            # Wait for any listing elements
-            try:
-                await page.wait_for_function("document.querySelectorAll('[data-pid], [href*=\"/\"]').length > 0", timeout=3000)
-            except:
-                logger.debug("Waiting for listings...")
-            
-            # Scroll down to load more content
-            try:
-                for _ in range(2):
-                    await page.evaluate("window.scrollBy(0, 500)")
-                    await page.wait_for_load_state("networkidle", timeout=1500)
-            except:
-                pass
-            
-            # Get page content
-            content = await page.content()
-            await page.close()
+            async with self.pages.page() as page:
+                try:
+                    # Use load event instead of domcontentloaded for faster loading
+                    await page.goto(url, wait_until='load', timeout=20000)
+                except Exception as e:
+                    logger.debug(f"Initial load took time, continuing: {str(e)[:50]}")
+                    # Continue even if it times out
+                    pass
+                
+                # Wait for any listing elements
+                try:
+                    await page.wait_for_function("document.querySelectorAll('[data-pid], [href*=\"/\"]').length > 0", timeout=3000)
+                except:
+                    logger.debug("Waiting for listings...")
+                
+                # Scroll browser-side in one call, then stop waiting as soon as
+                # enough result rows exist instead of idling on fixed timeouts
+                try:
+                    await page.evaluate(_SCROLL_TO_BOTTOM_JS)
+                    await page.wait_for_function(
+                        _ENOUGH_LISTINGS_JS,
+                        arg=self.max_listings,
+                        timeout=3000
+                    )
+                except Exception:
+                    pass
+                
+                # Get page content
+                content = await page.content()
             
+            self.html_cache.put(url, content)
             return content if content else ""
         except Exception as e:
             logger.warning(f"Error fetching {url}: {str(e)[:100]}")
-            try:
-                await page.close()
-            except:
-                pass
             return ""
 
     def parse_listings(self, content: str) -> List[Dict]:
         """
         Parse Craigslist listing HTML.
         
+        The page is stream-parsed, so once max_listings li.result-row
+        cards (the top-ranked selector) are extracted the rest of the
+        document is never parsed.
+        
         Args:
             content: HTML content
             
@@ -147,44 +190,86 @@ class CraigslistHousingScraper(BaseScraper):
             List of extracted listings
         """
         listings = []
-        soup = BeautifulSoup(content, 'html.parser')
-
-        # Try multiple selectors for modern Craigslist structure
-        listing_selectors = [
-            'li.result-row',
-            '[data-pid]',
-            'article',
-            'div[role="article"]',
-            '.cl-search-result'
-        ]
-        
-        results = []
-        for selector in listing_selectors:
-            results = soup.select(selector)
-            if results:
-                logger.debug(f"Found {len(results)} listings with selector: {selector}")
+        data = content.encode('utf-8')
+        parser = etree.HTMLPullParser(events=('start', 'end'), encoding='utf-8')
+
+        # Cards for each selector rank, in document order. Selectors are
+        # matched on start tags; a card is parsed once its end tag is seen.
+        by_rank = {}
+        top = by_rank.setdefault(0, [])
+        done = 0
+        root = None
+        for offset in range(0, len(data), _FEED_CHUNK_SIZE):
+            parser.feed(data[offset:offset + _FEED_CHUNK_SIZE])
+            for event, elem in parser.read_events():
+                if event == 'start':
+                    rank = self._listing_rank(elem)
+                    if rank is not None:
+                        by_rank.setdefault(rank, []).append(elem)
+                elif done < len(top) and elem is top[done]:
+                    # Cards queued after the oldest pending one are nested
+                    # in it, so they are all complete now
+                    done = self._extract_results(top, done, listings)
+                    if listings:
+                        for card in top[:done]:
+                            card.clear(keep_tail=True)
+                if len(listings) >= self.max_listings:
+                    break
+            if len(listings) >= self.max_listings:
                 break
+        else:
+            try:
+                root = parser.close()
+            except etree.LxmlError:
+                root = None
+
+        # Only the highest-priority selector that matched anything is used
+        best = min((rank for rank, nodes in by_rank.items() if nodes), default=None)
+        if best is not None and len(listings) < self.max_listings:
+            logger.debug(f"Found {len(by_rank[best])} listings with combined listing selectors")
+            self._extract_results(by_rank[best], done if best == 0 else 0, listings)
+
+        # No usable result cards: scan the page's text for full addresses
+        if not listings and root is not None:
+            text = HTMLParser.get_element_text(root, separator='\n')
+            for address in AddressParser.find_addresses(text, self.max_listings):
+                listings.append({**address, 'listing_url': ''})
+
+        # Listings hold plain strings only; release the page tree now
+        if root is not None:
+            root.clear()
+
+        logger.info(f"Parsed {len(listings)} listings from Craigslist")
+        return listings
+
+    def _extract_results(self, results: List, start: int, listings: List[Dict]) -> int:
+        """
+        Extract listings from result cards until max_listings is reached.
         
-        # Process each listing
-        for idx, result in enumerate(results):
+        Args:
+            results: Result card elements
+            start: Index of the first card to process
+            listings: List the extracted listings are appended to
+            
+        Returns:
+            Index of the first unprocessed card
+        """
+        for idx in range(start, len(results)):
+            if len(listings) >= self.max_listings:
+                return idx
+            result = results[idx]
             try:
-                # Try to get address/title
-                title_elem = (
-                    result.find('span', class_='result-title') or
-                    result.find('a', class_='result-title') or
-                    result.find('a') or
-                    result.find('h2') or
-                    result.find('h3')
-                )
+                # Try to get address/title, in priority order, in one walk
+                title_elem = HTMLParser.first_by_rank(result, _TITLE_TAGS, _title_elem_rank)
                 
-                if not title_elem:
+                if title_elem is None:
                     continue
 
-                address_text = title_elem.get_text(strip=True)
+                address_text = HTMLParser.get_element_text(title_elem)
                 
                 # Get listing URL
-                link = result.find('a', href=True)
-                listing_url = link['href'] if link else ''
+                link = next((a for a in result.iterdescendants('a') if a.get('href') is not None), None)
+                listing_url = link.get('href') if link is not None else ''
                 if listing_url and not listing_url.startswith('http'):
                     listing_url = f"https://craigslist.org{listing_url}"
 
@@ -206,8 +291,28 @@ class CraigslistHousingScraper(BaseScraper):
                 logger.debug(f"Error parsing Craigslist listing: {str(e)[:100]}")
                 continue
 
-        logger.info(f"Parsed {len(listings)} listings from Craigslist")
-        return listings
+        return len(results)
+
+    @staticmethod
+    def _listing_rank(node) -> Optional[int]:
+        """
+        Return the rank of the first result selector the node matches.
+        
+        Selectors, most preferred first: li.result-row, [data-pid], article,
+        div[role="article"], .cl-search-result. None if nothing matches.
+        """
+        classes = node.get('class', '').split()
+        if node.tag == 'li' and 'result-row' in classes:
+            return 0
+        if node.get('data-pid') is not None:
+            return 1
+        if node.tag == 'article':
+            return 2
+        if node.tag == 'div' and node.get('role') == 'article':
+            return 3
+        if 'cl-search-result' in classes:
+            return 4
+        return None
 
     def _parse_craigslist_address(self, text: str) -> Dict[str, str]:
         """
@@ -227,7 +332,7 @@ class CraigslistHousingScraper(BaseScraper):
         }
 
         # Look for ZIP code
-        zip_match = re.search(r'\b(\d{5})\b', text)
+        zip_match = _ZIP_RE.search(text)
         if zip_match:
             result['zip_code'] = zip_match.group(1)
 
@@ -241,7 +346,7 @@ class CraigslistHousingScraper(BaseScraper):
             result['street'] = parts[0]
 
         # Try to extract state if present
-        state_match = re.search(r'\b([A-Z]{2})\b', text)
+        state_match = _STATE_RE.search(text)
         if state_match:
             result['state'] = state_match.group(1)
 
@@ -255,12 +360,8 @@ class CraigslistHousingScraper(BaseScraper):
             List of normalized listings
         """
         try:
-            # Try to run async scrape in event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self._scrape_async())
-            loop.close()
-            return result
+            # The shared browser lives on the pool's event loop
+            return PlaywrightPool.run(self._scrape_async())
         except RuntimeError:
             logger.warning(f"Could not run Playwright for {self.source_name} - event loop already active")
             return []
@@ -268,9 +369,19 @@ class CraigslistHousingScraper(BaseScraper):
             logger.error(f"Error in {self.source_name}: {str(e)[:100]}")
             return []
 
+    async def scrape_async(self) -> List[Dict]:
+        """
+        Execute scraping from inside a running event loop.
+        
+        Returns:
+            List of normalized listings
+        """
+        return await PlaywrightPool.run_async(self._scrape_async())
+
     async def _scrape_async(self) -> List[Dict]:
         """Async version of scrape."""
         all_listings = []
+        seen = set()
         
         logger.info(f"Starting scrape of {self.source_name}")
         
@@ -280,26 +391,38 @@ class CraigslistHousingScraper(BaseScraper):
             listing_urls = self.get_listing_urls()
             logger.info(f"Found {len(listing_urls)} pages to scrape from {self.source_name}")
             
-            for url in listing_urls:
+            # Each URL gets its own page in the shared context; the semaphore
+            # and per-host token bucket keep the load on the site bounded
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            loop = asyncio.get_running_loop()
+
+            async def fetch_and_parse(url: str) -> List[Dict]:
                 try:
-                    logger.debug(f"Fetching {url} with Playwright...")
-                    content = await self.get_page_content(url)
+                    async with semaphore:
+                        await self._get_token_bucket(url).wait_for_token()
+                        logger.debug(f"Fetching {url} with Playwright...")
+                        content = await self.get_page_content(url)
                     
                     if not content:
                         logger.warning(f"No content retrieved from {url}")
-                        continue
+                        return []
                     
-                    listings = self.parse_listings(content)
-                    all_listings.extend(listings)
+                    # Parse on a worker thread so the loop keeps driving the
+                    # other pages' navigations meanwhile
+                    listings = await loop.run_in_executor(None, self.parse_listings, content)
                     logger.debug(f"Scraped {len(listings)} listings from {url}")
+                    return listings
                 except Exception as e:
                     logger.warning(f"Error scraping {url}: {str(e)[:100]}")
-                    continue
+                    return []
+
+            for listings in await asyncio.gather(*(fetch_and_parse(url) for url in listing_urls)):
+                all_listings.extend(self._dedupe_listings(listings, seen))
             
             if all_listings:
                 # Normalize addresses
-                normalized = [self._normalize_listing(listing) for listing in all_listings]
-                normalized = [l for l in normalized if l is not None]
+                normalized = self._normalize_batch(all_listings)
                 
                 logger.info(f"Completed scrape of {self.source_name}: {len(normalized)} valid listings")
                 return normalized
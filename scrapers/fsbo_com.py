@@ -2,17 +2,38 @@
 Scraper for FSBO.com - the largest FSBO marketplace.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
 import logging
 import re
 import asyncio
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from urllib.parse import urljoin
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, PlaywrightPool, PagePool
 
 logger = logging.getLogger(__name__)
 
+_LISTING_ID_RE = re.compile(r'/listings/listings/show/id/(\d+)/')
+# "3 beds" / "2.5 ba": one pattern for both, the unit tells them apart
+_BED_BATH_RE = re.compile(r'\b\d+(?:\.\d+)?\s*(bd|bed|beds|ba|bath|baths)\b')
+# The units alone, for a case-insensitive scan of raw HTML; no leading \b
+# since "3bd" has none
+_BED_BATH_UNIT_RE = re.compile(r'(bd|bed|beds|ba|bath|baths)\b', re.I)
+_BED_BATH_KINDS = {'bd': 'bed', 'bed': 'bed', 'beds': 'bed', 'ba': 'bath', 'bath': 'bath', 'baths': 'bath'}
+# "700 NE 26th Terr #804Miami, FL 33137": street runs straight into the city
+_ADDRESS_RE = re.compile(r'(.*?)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})\s*(\d{5})')
+_ZIP_RE = re.compile(r'\b(\d{5})\b')
+_LISTING_LINK_SELECTOR = 'a[href*="/listings/listings/show/id/"]'
+# First div with "row" anywhere in its class, e.g. the breadcrumb row
+_BREADCRUMB_SELECTOR = 'div[class*="row"]'
+_HREFS_JS = 'els => els.map(e => e.getAttribute("href"))'
+_NEW_LISTING_LINKS_JS = (
+    'h => { const a = document.querySelector(\'%s\'); return !!a && a.getAttribute("href") !== h; }'
+    % _LISTING_LINK_SELECTOR
+)
+# Page number in a result URL: "?page=2", "&page=2" or "/page/2"
+_PAGE_NUMBER_RE = re.compile(r'([?&]page=|/page/)(\d+)', re.I)
+
 
 class FSBOComScraper(BaseScraper):
     """
@@ -22,13 +43,16 @@ class FSBOComScraper(BaseScraper):
     Always check robots.txt and terms before scraping.
     """
 
-    def __init__(self, max_listings: int = 10, scrape_url = None, allowed_states: List[str] = None):
+    def __init__(self, max_listings: int = 10, scrape_url = None, allowed_states: List[str] = None,
+                 max_concurrent_pages: int = 8):
         """
         Initialize FSBO.com scraper.
         
         Args:
             max_listings: Maximum number of listings to scrape (default: 10)
             scrape_url: URL or list of URLs to scrape listing IDs from (default: FSBO homepage)
+            allowed_states: Only keep listings in these state codes (default: all)
+            max_concurrent_pages: Browser pages open at once for JS pagination
         """
         super().__init__(
             source_name='FSBO.com',
@@ -38,6 +62,8 @@ class FSBOComScraper(BaseScraper):
         )
         self.max_listings = max_listings
         self.allowed_states = [s.strip().upper() for s in (allowed_states or []) if s.strip()]
+        self.max_concurrent_pages = max_concurrent_pages
+        self.pages = None
         # Handle both single URL string and list of URLs
         if scrape_url is None:
             self.scrape_urls = [self.base_url]
@@ -46,57 +72,57 @@ class FSBOComScraper(BaseScraper):
         else:
             self.scrape_urls = [scrape_url]
 
-    async def get_listing_urls_with_js(self, scrape_url: str, max_listings_from_url: int) -> List[str]:
+    async def get_listing_urls_with_js(self, scrape_url: str, max_listings_from_url: int,
+                                       claimed_ids: Optional[set] = None) -> List[str]:
         """
         Get listing URLs using Playwright to handle JavaScript-based pagination.
         
+        Pages come from this scraper's page pool on the shared browser, so
+        concurrent calls reuse at most max_concurrent_pages pages instead of
+        launching a browser or opening a page each. When the "Next" link
+        carries a page number, later pages are loaded side by side from
+        their URLs instead of clicked through one at a time.
+        
         Args:
             scrape_url: URL to scrape
             max_listings_from_url: Max listings to get from this URL
+            claimed_ids: IDs found by every URL paginated alongside this one;
+                pagination stops once it holds max_listings_from_url IDs
             
         Returns:
             List of unique listing IDs
         """
         listing_ids = []
+        seen_ids = set()
+        if claimed_ids is None:
+            claimed_ids = seen_ids
+        max_pages = 20  # Limit to prevent infinite loops
+        next_url = None
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            try:
+        pages = await self._get_pages()
+        
+        try:
+            async with pages.page() as page:
                 await page.goto(scrape_url, wait_until='domcontentloaded', timeout=30000)
-                await page.wait_for_timeout(2000)  # Wait for JS to load
+                await self._wait_for_listing_links(page, scrape_url)
                 
                 page_num = 1
-                max_pages = 20  # Limit to prevent infinite loops
                 
-                while len(listing_ids) < max_listings_from_url and page_num <= max_pages:
+                while len(claimed_ids) < max_listings_from_url and page_num <= max_pages:
                     logger.info(f"Processing page {page_num} of {scrape_url}")
-                    
-                    # Get page content
-                    content = await page.content()
-                    soup = BeautifulSoup(content, 'html.parser')
-                    
-                    # Extract listing IDs
-                    links = soup.find_all('a', href=re.compile(r'/listings/listings/show/id/\d+/'))
-                    listings_found = 0
-                    
-                    for link in links:
-                        href = link.get('href', '')
-                        match = re.search(r'/listings/listings/show/id/(\d+)/', href)
-                        if match:
-                            listing_id = match.group(1)
-                            if listing_id not in listing_ids:
-                                listing_ids.append(listing_id)
-                                listings_found += 1
-                                if len(listing_ids) >= max_listings_from_url:
-                                    break
-                    
+                
+                    # Collect listing link hrefs in the browser; the DOM is
+                    # never serialized or re-parsed here
+                    hrefs = await page.eval_on_selector_all(_LISTING_LINK_SELECTOR, _HREFS_JS)
+                    listings_found = self._add_listing_ids(
+                        hrefs, listing_ids, seen_ids, claimed_ids, max_listings_from_url
+                    )
+                
                     logger.info(f"Found {listings_found} new listings on page {page_num}")
-                    
+                
                     if listings_found == 0:
                         break
-                    
+                
                     # Try to click the "Next" button
                     try:
                         # Look for next button with various selectors
@@ -105,17 +131,31 @@ class FSBOComScraper(BaseScraper):
                             next_button = await page.query_selector('a:has-text("next")')
                         if not next_button:
                             next_button = await page.query_selector('a:has-text(">")')
-                        
+                    
                         if next_button:
                             # Check if button is disabled
                             classes = await next_button.get_attribute('class')
                             if classes and 'disabled' in classes:
                                 logger.info("Next button is disabled, reached last page")
                                 break
-                            
+                        
+                            # A numbered link to page 2 means every page has
+                            # its own URL; stop clicking and load them directly
+                            if page_num == 1:
+                                href = await next_button.get_attribute('href')
+                                next_url = self._numbered_page_url(urljoin(page.url, href or ''), 2)
+                                if next_url:
+                                    break
+                        
                             logger.info("Clicking next button...")
-                            await next_button.click()
-                            await page.wait_for_timeout(2000)  # Wait for new content
+                            await asyncio.gather(next_button.click(), page.wait_for_load_state('domcontentloaded'))
+                            # Go on once the first listing link is a new one
+                            try:
+                                await page.wait_for_function(
+                                    _NEW_LISTING_LINKS_JS, arg=hrefs[0] if hrefs else None, timeout=8000
+                                )
+                            except Exception:
+                                logger.debug(f"Listing links on page {page_num + 1} did not change yet, continuing")
                             page_num += 1
                         else:
                             logger.info("No next button found, stopping pagination")
@@ -123,14 +163,141 @@ class FSBOComScraper(BaseScraper):
                     except Exception as e:
                         logger.warning(f"Could not click next button: {e}")
                         break
+            
+            if next_url:
+                await self._collect_numbered_pages(
+                    next_url, max_pages, listing_ids, seen_ids, claimed_ids, max_listings_from_url
+                )
                 
-            except Exception as e:
-                logger.error(f"Error with Playwright pagination: {e}")
-            finally:
-                await browser.close()
+        except Exception as e:
+            logger.error(f"Error with Playwright pagination: {e}")
         
         return listing_ids
 
+    async def _collect_numbered_pages(self, page_url: str, max_pages: int, listing_ids: List[str],
+                                      seen_ids: set, claimed_ids: set, max_listings_from_url: int) -> None:
+        """
+        Load numbered result pages from 2 on, a pool's worth at a time.
+        
+        Pages of a batch load concurrently but are consumed in page order,
+        stopping at the first page that adds nothing.
+        
+        Args:
+            page_url: URL of page 2, whose page number is substituted
+            max_pages: Last page number to load
+            listing_ids: Listing IDs found so far, extended in place
+            seen_ids: IDs already in listing_ids
+            claimed_ids: IDs found across all URLs being paginated
+            max_listings_from_url: Max listings to get from this URL
+        """
+        pages = await self._get_pages()
+
+        async def fetch_hrefs(url: str) -> List[str]:
+            async with pages.page() as page:
+                await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+                await self._wait_for_listing_links(page, url)
+                return await page.eval_on_selector_all(_LISTING_LINK_SELECTOR, _HREFS_JS)
+
+        first = 2
+        while first <= max_pages and len(claimed_ids) < max_listings_from_url:
+            numbers = range(first, min(first + pages.size, max_pages + 1))
+            results = await asyncio.gather(
+                *(fetch_hrefs(self._numbered_page_url(page_url, n)) for n in numbers),
+                return_exceptions=True
+            )
+            for page_num, hrefs in zip(numbers, results):
+                if isinstance(hrefs, Exception):
+                    logger.warning(f"Could not load page {page_num}: {hrefs}")
+                    return
+                listings_found = self._add_listing_ids(
+                    hrefs, listing_ids, seen_ids, claimed_ids, max_listings_from_url
+                )
+                logger.info(f"Found {listings_found} new listings on page {page_num}")
+                if listings_found == 0 or len(claimed_ids) >= max_listings_from_url:
+                    return
+            first += len(numbers)
+
+    @staticmethod
+    def _numbered_page_url(url: str, page_num: int) -> Optional[str]:
+        """
+        Return url with its page number replaced, or None if it has none.
+        
+        Args:
+            url: Absolute URL of a result page
+            page_num: Page number to put in the URL
+            
+        Returns:
+            URL of that page, or None if url carries no page number
+        """
+        if not _PAGE_NUMBER_RE.search(url):
+            return None
+        return _PAGE_NUMBER_RE.sub(lambda m: f"{m.group(1)}{page_num}", url, count=1)
+
+    @staticmethod
+    async def _wait_for_listing_links(page, url: str) -> None:
+        """Go on as soon as the JS has rendered listing links."""
+        try:
+            await page.wait_for_selector(_LISTING_LINK_SELECTOR, timeout=8000)
+        except Exception:
+            logger.debug(f"No listing links rendered on {url} yet, continuing")
+
+    @staticmethod
+    def _add_listing_ids(hrefs: List[str], listing_ids: List[str], seen_ids: set,
+                         claimed_ids: set, limit: int) -> int:
+        """
+        Append the new listing IDs found in hrefs, until claimed_ids holds limit.
+        
+        Returns:
+            Number of IDs added
+        """
+        added = 0
+        for href in hrefs:
+            match = _LISTING_ID_RE.search(href or '')
+            if match:
+                listing_id = match.group(1)
+                if listing_id not in seen_ids:
+                    seen_ids.add(listing_id)
+                    listing_ids.append(listing_id)
+                    claimed_ids.add(listing_id)
+                    added += 1
+                    if len(claimed_ids) >= limit:
+                        break
+        return added
+
+    async def _get_pages(self) -> PagePool:
+        """Return the page pool, creating it on the pooled context if needed."""
+        if self.pages is None:
+            context = await PlaywrightPool.get_context(self.source_name, setup=PlaywrightPool.block_assets)
+            self.pages = PagePool(context, self.max_concurrent_pages)
+        return self.pages
+
+    async def _collect_listing_ids_js(self, scrape_urls: List[str], max_listings_from_url: int) -> List[List[str]]:
+        """
+        Paginate several search result URLs concurrently.
+        
+        The URLs share one quota: each stops paginating once they have
+        found max_listings_from_url distinct IDs between them, so running
+        them side by side loads no more pages than the quota needs.
+        
+        Args:
+            scrape_urls: Search result URLs
+            max_listings_from_url: Max distinct listings to get across all URLs
+            
+        Returns:
+            Listing IDs for each URL, in input order
+        """
+        try:
+            await self._get_pages()
+            claimed_ids = set()
+            return await asyncio.gather(*(
+                self.get_listing_urls_with_js(url, max_listings_from_url, claimed_ids) for url in scrape_urls
+            ))
+        finally:
+            if self.pages is not None:
+                await self.pages.close()
+                self.pages = None
+            await PlaywrightPool.close_context(self.source_name)
+
     def get_listing_urls(self) -> List[str]:
         """
         Get list of FSBO.com listing URLs to scrape.
@@ -140,37 +307,51 @@ class FSBOComScraper(BaseScraper):
             List of listing page URLs
         """
         listing_ids = []
+        seen_ids = set()
         
         try:
+            # Paginate every search results URL at once on the shared
+            # browser against one shared quota, trimmed to order below
+            js_urls = [url for url in self.scrape_urls if 'search/results' in url]
+            js_ids = {}
+            if js_urls and self.max_listings > 0:
+                logger.info(f"Using Playwright for JS pagination on {len(js_urls)} URLs")
+                results = PlaywrightPool.run(self._collect_listing_ids_js(js_urls, self.max_listings))
+                js_ids = dict(zip(js_urls, results))
+            
+            # Fetch the plain HTML pages concurrently over the async session
+            http_urls = [url for url in self.scrape_urls if url not in js_ids]
+            http_pages = {}
+            if http_urls and self.max_listings > 0:
+                http_pages = dict(self._run_async(self.fetch_pages_async(http_urls)))
+            
             # Iterate through all scrape URLs
             for scrape_url in self.scrape_urls:
                 if len(listing_ids) >= self.max_listings:
                     break
                 
-                max_from_this_url = self.max_listings - len(listing_ids)
-                
-                # Use Playwright for search results pages (they have JS pagination)
-                if 'search/results' in scrape_url:
-                    logger.info(f"Using Playwright for JS pagination on {scrape_url}")
-                    new_ids = asyncio.run(self.get_listing_urls_with_js(scrape_url, max_from_this_url))
-                    listing_ids.extend(new_ids)
+                if scrape_url in js_ids:
+                    for listing_id in js_ids[scrape_url]:
+                        if len(listing_ids) >= self.max_listings:
+                            break
+                        if listing_id not in seen_ids:
+                            seen_ids.add(listing_id)
+                            listing_ids.append(listing_id)
                 else:
                     # Use simple HTTP request for other pages
                     logger.info(f"Using HTTP request for {scrape_url}")
-                    response = self.get_page(scrape_url)
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    html = http_pages[scrape_url]
+                    if html is None:
+                        raise RuntimeError(f"Could not fetch {scrape_url}")
                     
-                    links = soup.find_all('a', href=re.compile(r'/listings/listings/show/id/\d+/'))
-                    
-                    for link in links:
+                    # The ID is all that's needed and the URL pattern is
+                    # distinctive, so scan the raw HTML instead of parsing it
+                    for listing_id in _LISTING_ID_RE.findall(html):
                         if len(listing_ids) >= self.max_listings:
                             break
-                        href = link.get('href', '')
-                        match = re.search(r'/listings/listings/show/id/(\d+)/', href)
-                        if match:
-                            listing_id = match.group(1)
-                            if listing_id not in listing_ids:
-                                listing_ids.append(listing_id)
+                        if listing_id not in seen_ids:
+                            seen_ids.add(listing_id)
+                            listing_ids.append(listing_id)
             
             logger.info(f"Found {len(listing_ids)} total unique listing IDs")
             
@@ -187,6 +368,27 @@ class FSBOComScraper(BaseScraper):
         
         return urls
 
+    @staticmethod
+    def _has_bed_and_bath(pattern: re.Pattern, text: str) -> bool:
+        """
+        Check text for both a bed and a bath unit.
+        
+        One scan that stops as soon as both kinds have turned up.
+        
+        Args:
+            pattern: Regex whose first group is a unit in _BED_BATH_KINDS
+            text: Text to scan
+            
+        Returns:
+            True if both kinds were found
+        """
+        found = set()
+        for match in pattern.finditer(text):
+            found.add(_BED_BATH_KINDS[match.group(1).lower()])
+            if len(found) == 2:
+                return True
+        return False
+
     def parse_listings(self, content: str) -> List[Dict]:
         """
         Parse FSBO.com listing HTML from individual listing pages.
@@ -198,13 +400,20 @@ class FSBOComScraper(BaseScraper):
             List of extracted listings
         """
         listings = []
-        soup = BeautifulSoup(content, 'html.parser')
+
+        # Visible bed/bath text needs both unit words in the raw HTML, so
+        # pages without them (login, error, 404) are dropped unparsed
+        if not self._has_bed_and_bath(_BED_BATH_UNIT_RE, content):
+            return listings
+
+        soup = BeautifulSoup(content, 'lxml')
+
+        # Walk the tree for its text once; every check below reuses it
+        page_text = soup.get_text(" ", strip=True)
+        lower_text = page_text.lower()
 
         # Require bed and bath indicators to keep only home listings
-        page_text = soup.get_text(" ", strip=True).lower()
-        has_bed = re.search(r'\b\d+(?:\.\d+)?\s*(bd|bed|beds)\b', page_text)
-        has_bath = re.search(r'\b\d+(?:\.\d+)?\s*(ba|bath|baths)\b', page_text)
-        if not (has_bed and has_bath):
+        if not self._has_bed_and_bath(_BED_BATH_RE, lower_text):
             return listings
 
         try:
@@ -217,10 +426,7 @@ class FSBOComScraper(BaseScraper):
                 
                 # Parse format: "700 NE 26th Terr #804Miami, FL 33137"
                 # This needs to split street from "City, State ZIP"
-                match = re.search(
-                    r'(.*?)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})\s*(\d{5})',
-                    address_text
-                )
+                match = _ADDRESS_RE.search(address_text)
                 
                 if match:
                     street = match.group(1).strip()
@@ -243,7 +449,7 @@ class FSBOComScraper(BaseScraper):
                     return listings
             
             # Fallback: Try breadcrumb format "Home>FL>Miami>700 NE 26th Terr #804"
-            breadcrumb_div = soup.find('div', class_=lambda x: x and 'row' in x if x else False)
+            breadcrumb_div = soup.select_one(_BREADCRUMB_SELECTOR)
             if breadcrumb_div:
                 breadcrumb_text = breadcrumb_div.get_text(strip=True)
                 if '>' in breadcrumb_text:
@@ -255,7 +461,7 @@ class FSBOComScraper(BaseScraper):
                         state = parts[-3].strip()
                         
                         # Look for zip code in the page
-                        zip_code = self._extract_zip_from_page(soup)
+                        zip_code = self._extract_zip_from_text(page_text)
                         
                         listing = {
                             'street': street,
@@ -268,22 +474,21 @@ class FSBOComScraper(BaseScraper):
                         logger.info(f"Extracted from breadcrumb: {street}, {city}, {state} {zip_code}")
                         return listings
             
-            logger.warning(f"No address found in page. First 200 chars: {soup.get_text()[:200]}")
+            logger.warning(f"No address found in page. First 200 chars: {page_text[:200]}")
 
         except Exception as e:
             logger.error(f"Error parsing FSBO.com listing: {e}", exc_info=True)
 
         return listings
 
-    def _extract_zip_from_page(self, soup: BeautifulSoup) -> str:
-        """Extract ZIP code from page content."""
+    def _extract_zip_from_text(self, text: str) -> str:
+        """Extract ZIP code from page text."""
         # Look for zip code patterns in the page text
-        text = soup.get_text()
-        match = re.search(r'\b(\d{5})\b', text)
+        match = _ZIP_RE.search(text)
         return match.group(1) if match else ''
 
     @staticmethod
     def _extract_zip(text: str) -> str:
         """Extract ZIP code from address text."""
-        match = re.search(r'\b(\d{5})\b', text)
+        match = _ZIP_RE.search(text)
         return match.group(1) if match else ''
@@ -3,16 +3,59 @@ Scraper for generic FSBO landing pages on the web.
 """
 
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import atexit
 import logging
+import os
 import re
-from urllib.parse import urljoin, urlparse, parse_qs, unquote
+from urllib.parse import urljoin, urlparse, parse_qs, unquote, urlencode
 
 from .base_scraper import BaseScraper
 from parsers.html_parser import AddressParser, HTMLParser
 
 logger = logging.getLogger(__name__)
 
+# Whole lines of a text block that contain a 5-digit ZIP
+_ZIP_LINE_RE = re.compile(r'^.*\b\d{5}\b.*$', re.M)
+_STREET_NUMBER_RE = re.compile(r'\b\d{1,5}\b')
+# Common UI/auth text that marks a block as page chrome, not an address
+_BLOCKED_PHRASES = (
+    'sign in', 'sign up', 'login', 'continue with', 'get started',
+    'forgot password', 'mortgage', 'payment calculator',
+    'home affordability', 'welcome', 'by clicking', 'privacy',
+    'terms', 'list my property'
+)
+_BLOCKED_PHRASE_RE = re.compile('|'.join(map(re.escape, _BLOCKED_PHRASES)))
+_LINKS_ONLY = SoupStrainer('a', href=True)
+# Common elements where addresses appear
+_ADDRESS_SELECTORS = (
+    'address',
+    '[class*="address"]',
+    '[class*="location"]',
+    '[class*="listing"]',
+    '[class*="property"]',
+)
+
+
+@lru_cache(maxsize=4096)
+def _validate_address(street: str, city: str, state: str, zip_code: str) -> bool:
+    """
+    Check stripped address fields, memoized since pages repeat addresses.
+
+    Returns:
+        True if every field is present and the street looks like one
+    """
+    if not (street and city and state and zip_code):
+        return False
+
+    # Reject price-like or incomplete street lines
+    if street.startswith('$'):
+        return False
+    return bool(_STREET_NUMBER_RE.search(street))
+
 
 class FSBOLandingPageScraper(BaseScraper):
     """
@@ -22,6 +65,9 @@ class FSBOLandingPageScraper(BaseScraper):
     FSBO properties on a single page.
     """
 
+    # Worker processes shared by every instance for multi-page parsing
+    _parse_pool: Optional[ProcessPoolExecutor] = None
+
     def __init__(
         self,
         landing_urls: Optional[List[str]] = None,
@@ -52,6 +98,19 @@ class FSBOLandingPageScraper(BaseScraper):
         self.allowlist_domains = [d.lower().strip() for d in (allowlist_domains or []) if d.strip()]
         self.allowed_states = [s.strip().upper() for s in (allowed_states or []) if s.strip()]
         self.blacklist_domains = [d.lower().strip() for d in (blacklist_domains or []) if d.strip()]
+        # Domain sets, matched against every dotted suffix of a host
+        self._allow_suffixes = frozenset(self.allowlist_domains)
+        self._block_suffixes = frozenset(self.blacklist_domains)
+
+    @classmethod
+    def _get_parse_pool(cls) -> ProcessPoolExecutor:
+        """Return the shared parse process pool, creating it once."""
+        if FSBOLandingPageScraper._parse_pool is None:
+            FSBOLandingPageScraper._parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1
+            )
+            atexit.register(FSBOLandingPageScraper._parse_pool.shutdown)
+        return FSBOLandingPageScraper._parse_pool
 
     def get_listing_urls(self) -> List[str]:
         """
@@ -72,11 +131,10 @@ class FSBOLandingPageScraper(BaseScraper):
         listings: List[Dict] = []
         seen = set()
 
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = HTMLParser.get_soup(content)
 
         # 1) Try JSON-LD structured data first
-        json_ld = HTMLParser.extract_json_ld(content)
-        if json_ld:
+        for json_ld in HTMLParser.extract_all_json_ld(content):
             self._extract_from_json_ld(json_ld, listings, seen)
 
         # 2) Extract addresses from visible text blocks
@@ -104,16 +162,28 @@ class FSBOLandingPageScraper(BaseScraper):
         Uses DuckDuckGo HTML results (no API key required).
         """
         discovered = []
+        seen = set()
+
+        # Run every search at once over the async session; results are
+        # still consumed in query order
+        search_url = "https://duckduckgo.com/html/"
+        pages = self._run_async(self.fetch_pages_async(
+            [f"{search_url}?{urlencode({'q': query})}" for query in queries]
+        ))
 
-        for query in queries:
+        for query, (_, content) in zip(queries, pages):
             if len(discovered) >= max_results:
                 break
+            if content is None:
+                logger.debug(f"Search failed for query '{query}'")
+                continue
             try:
-                search_url = "https://duckduckgo.com/html/"
-                response = self.get_page(search_url, params={"q": query})
-                soup = BeautifulSoup(response.text, 'html.parser')
+                # Only result links matter, so build nodes for nothing else
+                soup = BeautifulSoup(content, 'lxml', parse_only=_LINKS_ONLY)
 
                 for link in soup.select('a.result__a'):
+                    if len(discovered) >= max_results:
+                        break
                     href = link.get('href', '')
                     if not href:
                         continue
@@ -136,9 +206,10 @@ class FSBOLandingPageScraper(BaseScraper):
                             href = unquote(qs['uddg'][0])
                             if 'duckduckgo.com/y.js' in href:
                                 continue
+                            # Only an unwrapped link needs parsing again
+                            parsed = urlparse(href)
 
                     # Skip DuckDuckGo scripts/ads and non-http(s)
-                    parsed = urlparse(href)
                     if 'duckduckgo.com' in parsed.netloc:
                         continue
                     if parsed.scheme not in ('http', 'https'):
@@ -148,10 +219,9 @@ class FSBOLandingPageScraper(BaseScraper):
 
                     if not self._is_allowed_domain(href):
                         continue
-                    if href not in discovered:
+                    if href not in seen:
+                        seen.add(href)
                         discovered.append(href)
-                    if len(discovered) >= max_results:
-                        break
             except Exception as e:
                 logger.debug(f"Search failed for query '{query}': {str(e)[:100]}")
 
@@ -166,12 +236,12 @@ class FSBOLandingPageScraper(BaseScraper):
             host = urlparse(url).netloc.lower()
             if not host:
                 return False
-            if self.blacklist_domains:
-                if any(host == domain or host.endswith(f".{domain}") for domain in self.blacklist_domains):
-                    return False
-            if not self.allowlist_domains:
-                return True
-            return any(host == domain or host.endswith(f".{domain}") for domain in self.allowlist_domains)
+            # A domain matches the host itself or any of its subdomains
+            labels = host.split('.')
+            suffixes = {'.'.join(labels[i:]) for i in range(len(labels))}
+            if not self._block_suffixes.isdisjoint(suffixes):
+                return False
+            return not self._allow_suffixes or not self._allow_suffixes.isdisjoint(suffixes)
         except Exception:
             return False
 
@@ -187,18 +257,30 @@ class FSBOLandingPageScraper(BaseScraper):
             listing_urls = self.get_listing_urls()
             logger.info(f"Found {len(listing_urls)} pages to scrape from {self.source_name}")
 
-            for url in listing_urls:
-                try:
-                    response = self.get_page(url)
-                    listings = self.parse_listings(response.text)
-                    for listing in listings:
-                        if not listing.get('listing_url'):
-                            listing['listing_url'] = url
-                    all_listings.extend(listings)
-                    logger.debug(f"Scraped {len(listings)} listings from {url}")
-                except Exception as e:
-                    logger.error(f"Error scraping {url}: {e}")
+            pages = [
+                (url, content)
+                for url, content in self._run_async(self.fetch_pages_async(listing_urls))
+                if content is not None
+            ]
+
+            # Parsing is GIL-bound BeautifulSoup work, so with several pages
+            # it goes to worker processes; results come back in input order
+            texts = [content for _, content in pages]
+            args = (texts, repeat(self.max_listings), repeat(self.allowed_states))
+            if len(texts) > 1:
+                results = self._get_parse_pool().map(parse_landing_html, *args, chunksize=8)
+            else:
+                results = map(parse_landing_html, *args)
+
+            for (url, _), result in zip(pages, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error scraping {url}: {result}")
                     continue
+                for listing in result:
+                    if not listing.get('listing_url'):
+                        listing['listing_url'] = url
+                all_listings.extend(result)
+                logger.debug(f"Scraped {len(result)} listings from {url}")
 
             normalized = [self._normalize_listing(listing) for listing in all_listings]
             normalized = [l for l in normalized if l is not None]
@@ -216,29 +298,21 @@ class FSBOLandingPageScraper(BaseScraper):
         """
         candidates = []
 
-        # Common selectors where addresses appear
-        selectors = [
-            'address',
-            '[class*="address"]',
-            '[class*="location"]',
-            '[class*="listing"]',
-            '[class*="property"]'
-        ]
-
-        for selector in selectors:
-            for elem in soup.select(selector):
-                text = elem.get_text(" ", strip=True)
+        # Common selectors where addresses appear, matched in one traversal;
+        # candidates stay grouped by selector, as with a select() per selector
+        texts = {}
+        for group in HTMLParser.select_each(soup, _ADDRESS_SELECTORS):
+            for elem in group:
+                text = texts.get(id(elem))
+                if text is None:
+                    text = texts[id(elem)] = elem.get_text(" ", strip=True)
                 if text:
                     candidates.append(text)
 
         # Fallback: scan text nodes for ZIP patterns
         body_text = soup.get_text("\n", strip=True)
-        for line in body_text.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            if re.search(r'\b\d{5}\b', line):
-                candidates.append(line)
+        for line in _ZIP_LINE_RE.findall(body_text):
+            candidates.append(line.strip())
 
         # De-duplicate while preserving order
         seen = set()
@@ -255,27 +329,21 @@ class FSBOLandingPageScraper(BaseScraper):
         """
         Heuristic filter to drop non-address UI text blocks.
         """
-        cleaned = re.sub(r'\s+', ' ', text).strip()
+        cleaned = ' '.join(text.split())
 
-        # Too long or too many words usually indicates page chrome
+        # Too long or too many words usually indicates page chrome; the
+        # text is single-spaced, so spaces count the word gaps
         if len(cleaned) > 240:
             return False
-        if len(cleaned.split()) > 28:
+        if cleaned.count(' ') > 27:
             return False
 
         # Must have a street number
-        if not re.search(r'\b\d{1,5}\b', cleaned):
+        if not _STREET_NUMBER_RE.search(cleaned):
             return False
 
         # Block common UI/auth text
-        blocked_phrases = [
-            'sign in', 'sign up', 'login', 'continue with', 'get started',
-            'forgot password', 'mortgage', 'payment calculator',
-            'home affordability', 'welcome', 'by clicking', 'privacy',
-            'terms', 'list my property'
-        ]
-        lower = cleaned.lower()
-        if any(p in lower for p in blocked_phrases):
+        if _BLOCKED_PHRASE_RE.search(cleaned.lower()):
             return False
 
         return True
@@ -301,8 +369,8 @@ class FSBOLandingPageScraper(BaseScraper):
                         for elem in item.get('itemListElement', []):
                             if isinstance(elem, dict):
                                 addr = elem.get('address') or (elem.get('item') or {}).get('address')
-                                if addr:
-                                    self._add_from_json_ld_address(addr, listings, seen)
+                                if addr and not self._add_from_json_ld_address(addr, listings, seen):
+                                    break
                         continue
 
                     if address:
@@ -310,12 +378,20 @@ class FSBOLandingPageScraper(BaseScraper):
         except Exception as e:
             logger.debug(f"JSON-LD parsing failed: {str(e)[:100]}")
 
-    def _add_from_json_ld_address(self, address: Dict, listings: List[Dict], seen: set) -> None:
+    def _add_from_json_ld_address(self, address: Dict, listings: List[Dict], seen: set) -> bool:
         """
         Add listing from JSON-LD address block.
+
+        Returns:
+            False once max_listings is reached, True to keep going
         """
+        if len(listings) >= self.max_listings:
+            return False
         if not isinstance(address, dict):
-            return
+            return True
+        # Skip other states before validating the address
+        if not self._is_allowed_state({'state': address.get('addressRegion', '')}):
+            return True
 
         listing = self._to_listing(
             {
@@ -328,6 +404,7 @@ class FSBOLandingPageScraper(BaseScraper):
         )
         if listing:
             self._add_unique(listings, seen, listing)
+        return len(listings) < self.max_listings
 
     @staticmethod
     def _to_listing(parsed: Dict[str, str], listing_url: str) -> Optional[Dict]:
@@ -342,13 +419,7 @@ class FSBOLandingPageScraper(BaseScraper):
         state = parsed.get('state', '').strip()
         zip_code = parsed.get('zip_code', '').strip()
 
-        if not (street and city and state and zip_code):
-            return None
-
-        # Reject price-like or incomplete street lines
-        if street.startswith('$'):
-            return None
-        if not re.search(r'\b\d{1,5}\b', street):
+        if not _validate_address(street, city, state, zip_code):
             return None
 
         return {
@@ -376,3 +447,22 @@ class FSBOLandingPageScraper(BaseScraper):
         seen.add(key)
         listings.append(listing)
         return True
+
+
+def parse_landing_html(content: str, max_listings: int, allowed_states: List[str]):
+    """
+    Parse one landing page in a worker process.
+
+    Args:
+        content: Landing page HTML
+        max_listings: Maximum listings to extract from the page
+        allowed_states: State codes to keep; empty keeps all
+
+    Returns:
+        Listing dicts without listing_url, or the exception parsing raised
+    """
+    try:
+        scraper = FSBOLandingPageScraper(max_listings=max_listings, allowed_states=allowed_states)
+        return scraper.parse_listings(content)
+    except Exception as e:
+        return e
@@ -3,16 +3,50 @@ Scraper for RealtyLess.com - Uses Playwright for JavaScript rendering.
 """
 
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import logging
 import re
 import asyncio
 import json
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, PlaywrightPool, PagePool
 
 logger = logging.getLogger(__name__)
 
+# RealtyLess listing pages are /listing/<id>
+_LISTING_HREF_RE = re.compile(r'/listing/\d+')
+_ADDRESS_CLASS_RE = re.compile('address|street|title', re.I)
+# Resolves once a listing link exists (false after 3s without one), then
+# scrolls a screen twice, each time waiting up to 1s for new nodes
+_SETTLE_LISTINGS_JS = """
+async () => {
+    // Resolve with ready() once it holds or any DOM change makes it hold,
+    // or with its value after ms
+    const waitFor = (ready, ms) => new Promise(resolve => {
+        if (ready()) return resolve(true);
+        const observer = new MutationObserver(() => {
+            if (ready()) { observer.disconnect(); resolve(true); }
+        });
+        observer.observe(document, {childList: true, subtree: true});
+        setTimeout(() => { observer.disconnect(); resolve(ready()); }, ms);
+    });
+    const found = await waitFor(() => document.querySelector('a[href*="/listing"]') !== null, 3000);
+    for (let i = 0; i < 2; i++) {
+        window.scrollBy(0, window.innerHeight);
+        const count = document.getElementsByTagName('*').length;
+        await waitFor(() => document.getElementsByTagName('*').length > count, 1000);
+    }
+    return found;
+}
+"""
+# "Street, City, ST 12345", else "Street | City, ST 12345"
+_ADDRESS_LINE_RE = re.compile(
+    r'(?P<street1>.+?),\s+(?P<city1>.+?),\s+(?P<state1>[A-Z]{2})\s+(?P<zip1>\d{5})'
+    r'|(?P<street2>[^|]+)\|\s*(?P<city2>.+?),\s+(?P<state2>[A-Z]{2})\s+(?P<zip2>\d{5})'
+)
+# Anything ending in ", ST 12345"
+_ADDRESS_STATE_ZIP_RE = re.compile(r'(.+?),\s+([A-Z]{2})\s+(\d{5})')
+
 
 class RealtyLessComScraper(BaseScraper):
     """
@@ -20,6 +54,9 @@ class RealtyLessComScraper(BaseScraper):
     Uses Playwright for JavaScript rendering since the site is a React SPA.
     """
 
+    # Browser pages are heavier than plain HTTP requests
+    max_concurrency = 4
+
     def __init__(self, max_listings: int = 10, scrape_url: str = None):
         """
         Initialize RealtyLess.com scraper.
@@ -37,77 +74,83 @@ class RealtyLessComScraper(BaseScraper):
         self.max_listings = max_listings
         # Default to Tampa Bay area if no URL provided
         self.scrape_url = scrape_url or "https://realtyless.com/postings?lat=28.0035328&lng=-82.7686912"
-        self.browser = None
         self.context = None
-        self.playwright_instance = None
+        self.pages = None
 
     async def setup_browser(self):
-        """Initialize Playwright browser."""
-        try:
-            from playwright.async_api import async_playwright
-            
-            self.playwright_instance = await async_playwright().start()
-            self.browser = await self.playwright_instance.chromium.launch(headless=True)
-            self.context = await self.browser.new_context(
-                viewport={'width': 1280, 'height': 720}
-            )
-            logger.debug(f"Browser initialized for {self.source_name}")
-        except ImportError:
-            logger.error("Playwright not installed. Install with: pip install playwright && playwright install")
-            raise
+        """Get a context and page pool from the shared Playwright browser."""
+        self.context = await PlaywrightPool.get_context(
+            self.source_name, setup=PlaywrightPool.block_assets,
+            viewport={'width': 1280, 'height': 720}
+        )
+        self.pages = PagePool(self.context, self.max_concurrency)
+        logger.debug(f"Browser context ready for {self.source_name}")
 
     async def cleanup_browser(self):
-        """Close browser and cleanup."""
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright_instance:
-            await self.playwright_instance.stop()
-        logger.debug(f"Browser closed for {self.source_name}")
+        """Close this scraper's pages and context; the shared browser stays up."""
+        if self.pages is not None:
+            await self.pages.close()
+            self.pages = None
+        await PlaywrightPool.close_context(self.source_name)
+        self.context = None
+        logger.debug(f"Browser context closed for {self.source_name}")
 
-    async def get_page_content(self, url: str) -> str:
+    async def get_page_content(self, url: str, feed: Optional[List] = None) -> str:
         """
         Get page content using Playwright browser.
         
         Args:
             url: URL to fetch
+            feed: If given, JSON bodies of the page's XHR/fetch responses
+                are appended to it; once one holds listings the page is
+                not rendered any further and "" is returned
             
         Returns:
             HTML content of the page
         """
         try:
-            if not self.browser:
+            if not self.context:
                 await self.setup_browser()
             
-            page = await self.context.new_page()
-            
-            try:
-                # Use load event with shorter timeout first
-                await page.goto(url, wait_until='load', timeout=12000)
-            except Exception as e:
-                logger.debug(f"Page load timeout after 12s, continuing: {str(e)[:50]}")
-                # Try to get content anyway even if timeout
-                pass
-            
-            # Wait for listings to load - use shorter timeout
-            try:
-                await page.wait_for_selector('a[href*="/listing"]', timeout=3000)
-            except:
-                logger.debug("Listing selectors not immediately visible, proceeding")
-            
-            # Try scrolling with very short waits
-            for i in range(2):
+            async with self.pages.page() as page:
+                responses = asyncio.Queue()
+
+                def collect_json(response):
+                    if (response.request.resource_type in ('xhr', 'fetch')
+                            and 'json' in response.headers.get('content-type', '')):
+                        responses.put_nowait(response)
+
+                if feed is None:
+                    try:
+                        # Use load event with shorter timeout first
+                        await page.goto(url, wait_until='load', timeout=12000)
+                    except Exception as e:
+                        logger.debug(f"Page load timeout after 12s, continuing: {str(e)[:50]}")
+                        # Try to get content anyway even if timeout
+                else:
+                    # Pages are reused, so the listener must not outlive this URL
+                    page.on('response', collect_json)
+                    try:
+                        try:
+                            await page.goto(url, wait_until='commit', timeout=12000)
+                        except Exception as e:
+                            logger.debug(f"Page navigation failed, continuing: {str(e)[:50]}")
+                        if await self._wait_for_feed(page, responses, feed):
+                            logger.debug(f"Found listings in JSON feed of {url}, skipping render")
+                            return ""
+                    finally:
+                        page.remove_listener('response', collect_json)
+                
+                # Wait for listings, then scroll twice for lazy loads, in one
+                # round trip to the page
                 try:
-                    await page.evaluate("window.scrollBy(0, window.innerHeight)")
-                    # Use very short timeout for scroll loads
-                    await page.wait_for_load_state("networkidle", timeout=1000)
-                except:
+                    if not await page.evaluate(_SETTLE_LISTINGS_JS):
+                        logger.debug("Listing selectors not immediately visible, proceeding")
+                except Exception:
                     pass
-            
-            # Get page content
-            content = await page.content()
-            await page.close()
+                
+                # Get page content; the page goes back to the pool
+                content = await page.content()
             
             if content and len(content) > 1000:
                 logger.debug(f"Retrieved {len(content)} bytes of content")
@@ -118,12 +161,44 @@ class RealtyLessComScraper(BaseScraper):
                 
         except Exception as e:
             logger.warning(f"⚠️  Error fetching {url}: {str(e)[:100]}")
-            try:
-                await page.close()
-            except:
-                pass
             return ""
 
+    async def _wait_for_feed(self, page, responses: asyncio.Queue, feed: List) -> bool:
+        """
+        Decode JSON responses as they arrive until one holds listings.
+        
+        Gives up once the page's load event fires (or times out after
+        12s), the point where the HTML path would have started.
+        
+        Args:
+            page: Page being loaded
+            responses: Queue of the page's JSON responses
+            feed: Decoded bodies are appended to it
+            
+        Returns:
+            True if a response held listings
+        """
+        loaded = asyncio.ensure_future(page.wait_for_load_state('load', timeout=12000))
+        try:
+            while True:
+                getter = asyncio.ensure_future(responses.get())
+                done, _ = await asyncio.wait({getter, loaded}, return_when=asyncio.FIRST_COMPLETED)
+                if getter not in done:
+                    getter.cancel()
+                    return False
+                try:
+                    data = await getter.result().json()
+                except Exception:
+                    continue
+                feed.append(data)
+                if self._listings_from_feed([data]):
+                    return True
+        finally:
+            if loaded.done():
+                loaded.exception()
+            else:
+                loaded.cancel()
+
     def get_listing_urls(self) -> List[str]:
         """
         Get list of RealtyLess.com listing URLs.
@@ -144,44 +219,37 @@ class RealtyLessComScraper(BaseScraper):
             List of extracted listings
         """
         listings = []
-        soup = BeautifulSoup(content, 'html.parser')
+        tree = LexborHTMLParser(content)
 
         # Look for listing links - RealtyLess uses /listing/ID pattern
-        listing_links = soup.find_all('a', href=re.compile(r'/listing/\d+'))
+        listing_links = [
+            link for link in tree.css('a[href*="/listing/"]')
+            if _LISTING_HREF_RE.search(link.attributes.get('href') or '')
+        ]
         
         logger.debug(f"Found {len(listing_links)} listing links")
         
         for idx, link in enumerate(listing_links[:self.max_listings]):
             try:
-                listing_url = link.get('href', '')
+                listing_url = link.attributes.get('href') or ''
                 if not listing_url.startswith('http'):
                     listing_url = self.base_url + listing_url
                 
                 # Get the listing card/container
-                card = link.find_parent(['div', 'article', 'li'])
-                if not card:
-                    card = link.parent
+                card = self._find_parent(link, ('div', 'article', 'li')) or link.parent
                 
                 # Extract address - typically in the card heading or near the link
-                address_text = ""
-                
-                # Try various selectors for address
                 address_elem = (
-                    card.find('h2') or
-                    card.find('h3') or
-                    card.find(['span', 'div'], class_=re.compile('address|street|title', re.I)) or
-                    link.find_parent().find('h2') or
-                    link.find_parent().find('h3')
+                    card.css_first('h2') or
+                    card.css_first('h3') or
+                    self._find_address_class_elem(card)
                 )
-                
-                if address_elem:
-                    address_text = address_elem.get_text(strip=True)
+                address_text = address_elem.text(strip=True) if address_elem else ""
                 
                 # Alternative: get text near the link
                 if not address_text:
-                    # Get parent text and extract first meaningful part
-                    parent_text = card.get_text(strip=True)
-                    address_text = parent_text[:150]  # Take first 150 chars
+                    # Get card text and extract first meaningful part
+                    address_text = card.text(strip=True)[:150]  # Take first 150 chars
                 
                 if not address_text:
                     continue
@@ -211,6 +279,23 @@ class RealtyLessComScraper(BaseScraper):
         logger.info(f"Parsed {len(listings)} listings from {self.source_name}")
         return listings
 
+    @staticmethod
+    def _find_parent(node, tags):
+        """Return the nearest ancestor whose tag is in tags, or None."""
+        parent = node.parent
+        while parent is not None and parent.tag not in tags:
+            parent = parent.parent
+        return parent
+
+    @staticmethod
+    def _find_address_class_elem(card):
+        """Return the first span/div below card whose class mentions address/street/title."""
+        for node in card.css('span[class], div[class]'):
+            # css() also matches the card itself; only descendants count
+            if node != card and _ADDRESS_CLASS_RE.search(node.attributes.get('class') or ''):
+                return node
+        return None
+
     @staticmethod
     def _extract_address_components(text: str) -> Optional[Dict[str, str]]:
         """
@@ -223,33 +308,21 @@ class RealtyLessComScraper(BaseScraper):
             Dict with street, city, state, zip_code or None
         """
         try:
-            # Pattern: "Street, City, State ZIP"
-            pattern = r'^(.+?),\s+(.+?),\s+([A-Z]{2})\s+(\d{5})'
-            match = re.search(pattern, text)
+            # "Street, City, State ZIP" or "Street | City, State ZIP" in one
+            # match; the first alternative wins where both would apply
+            match = _ADDRESS_LINE_RE.match(text)
             
             if match:
+                n = '1' if match.group('street1') is not None else '2'
                 return {
-                    'street': match.group(1).strip(),
-                    'city': match.group(2).strip(),
-                    'state': match.group(3).strip(),
-                    'zip_code': match.group(4).strip()
-                }
-            
-            # Alternative pattern: Street | City, State ZIP
-            pattern2 = r'^([^|]+)\|\s*(.+?),\s+([A-Z]{2})\s+(\d{5})'
-            match2 = re.search(pattern2, text)
-            
-            if match2:
-                return {
-                    'street': match2.group(1).strip(),
-                    'city': match2.group(2).strip(),
-                    'state': match2.group(3).strip(),
-                    'zip_code': match2.group(4).strip()
+                    'street': match.group('street' + n).strip(),
+                    'city': match.group('city' + n).strip(),
+                    'state': match.group('state' + n).strip(),
+                    'zip_code': match.group('zip' + n).strip()
                 }
             
             # Fallback: try to find pattern with just state and zip
-            pattern3 = r'(.+?),\s+([A-Z]{2})\s+(\d{5})'
-            match3 = re.search(pattern3, text)
+            match3 = _ADDRESS_STATE_ZIP_RE.search(text)
             
             if match3:
                 full_address = match3.group(1).strip()
@@ -279,12 +352,8 @@ class RealtyLessComScraper(BaseScraper):
             List of normalized listings
         """
         try:
-            # Try to run async scrape in event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self._scrape_async())
-            loop.close()
-            return result
+            # The shared browser lives on the pool's event loop
+            return PlaywrightPool.run(self._scrape_async())
         except RuntimeError:
             # If event loop is already running, return empty
             logger.warning(f"Could not run Playwright for {self.source_name} - event loop already active")
@@ -293,6 +362,15 @@ class RealtyLessComScraper(BaseScraper):
             logger.error(f"Error in {self.source_name}: {str(e)[:100]}")
             return []
 
+    async def scrape_async(self) -> List[Dict]:
+        """
+        Execute scraping from inside a running event loop.
+        
+        Returns:
+            List of normalized listings
+        """
+        return await PlaywrightPool.run_async(self._scrape_async())
+
     async def _scrape_async(self) -> List[Dict]:
         """Async version of scrape."""
         all_listings = []
@@ -305,21 +383,41 @@ class RealtyLessComScraper(BaseScraper):
             listing_urls = self.get_listing_urls()
             logger.info(f"Found {len(listing_urls)} pages to scrape from {self.source_name}")
             
-            for url in listing_urls:
+            # Pages load concurrently in the shared context; the semaphore
+            # and per-host token bucket keep the load on the site bounded
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            loop = asyncio.get_running_loop()
+
+            async def fetch_and_parse(url: str) -> List[Dict]:
                 try:
-                    logger.debug(f"Fetching {url} with Playwright...")
-                    content = await self.get_page_content(url)
+                    feed = []
+                    async with semaphore:
+                        await self._get_token_bucket(url).wait_for_token()
+                        logger.debug(f"Fetching {url} with Playwright...")
+                        content = await self.get_page_content(url, feed)
+
+                    # The SPA renders from its own JSON API; read that when
+                    # it carries addresses instead of walking the DOM
+                    listings = self._listings_from_feed(feed)
+                    if listings:
+                        logger.debug(f"Scraped {len(listings)} listings from JSON feed of {url}")
+                        return listings
                     
                     if not content:
                         logger.warning(f"No content retrieved from {url}")
-                        continue
+                        return []
                     
-                    listings = self.parse_listings(content)
-                    all_listings.extend(listings)
+                    # Parse on a worker thread so the loop keeps driving the
+                    # other pages' navigations meanwhile
+                    listings = await loop.run_in_executor(None, self.parse_listings, content)
                     logger.debug(f"Scraped {len(listings)} listings from {url}")
+                    return listings
                 except Exception as e:
                     logger.warning(f"Error scraping {url}: {str(e)[:100]}")
-                    continue
+                    return []
+
+            for listings in await asyncio.gather(*(fetch_and_parse(url) for url in listing_urls)):
+                all_listings.extend(listings)
             
             if all_listings:
                 # Normalize addresses
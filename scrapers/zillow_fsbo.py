@@ -3,15 +3,23 @@ Scraper for Zillow FSBO listings.
 Handles both static and JavaScript-rendered content.
 """
 
-from typing import List, Dict
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional, Tuple
+from selectolax.lexbor import LexborHTMLParser
 import logging
 import re
+import asyncio
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, PlaywrightPool, PagePool
+from parsers.html_parser import AddressParser
 
 logger = logging.getLogger(__name__)
 
+# "City, ST 12345": the state is the word before the ZIP
+_STATE_RE = re.compile(r'(\w+),\s*(\w+)\s*(\d{5})')
+_CARD_SELECTOR = 'div.property-card'
+# Server-rendered pages name the card class in their HTML
+_CARD_MARKER = 'property-card'
+
 
 class ZillowFSBOScraper(BaseScraper):
     """
@@ -29,6 +37,8 @@ class ZillowFSBOScraper(BaseScraper):
             min_delay=4.0,
             max_delay=10.0
         )
+        # Zillow cards always use "Street, City, ST 12345"
+        self._parse_address = AddressParser.compile_layout('street,city,state zip_code')
 
     def get_listing_urls(self) -> List[str]:
         """
@@ -57,6 +67,64 @@ class ZillowFSBOScraper(BaseScraper):
         
         return urls[:2]  # Limit for demo
 
+    async def fetch_pages_async(self, urls: List[str]) -> List[Tuple[str, Optional[str]]]:
+        """
+        Fetch pages over HTTP, rendering only those that need JavaScript.
+        
+        Server-rendered pages carry their property cards in the HTML; pages
+        without any are loaded again in the shared Playwright browser.
+        
+        Args:
+            urls: Page URLs
+            
+        Returns:
+            (url, content) pairs in input order; content is None on failure
+        """
+        pages = await super().fetch_pages_async(urls)
+        js_urls = [url for url, content in pages if not content or _CARD_MARKER not in content]
+        if not js_urls:
+            return pages
+
+        logger.info(f"Rendering {len(js_urls)} JS-only pages from {self.source_name} with Playwright")
+        try:
+            rendered = dict(await PlaywrightPool.run_async(self._render_pages(js_urls)))
+        except Exception as e:
+            logger.warning(f"Could not render pages with Playwright: {str(e)[:100]}")
+            return pages
+        return [(url, rendered.get(url) or content) for url, content in pages]
+
+    async def _render_pages(self, urls: List[str]) -> List[Tuple[str, Optional[str]]]:
+        """
+        Render pages concurrently on this scraper's browser context.
+        
+        Args:
+            urls: Page URLs
+            
+        Returns:
+            (url, content) pairs in input order; content is None on failure
+        """
+        context = await PlaywrightPool.get_context(self.source_name, setup=PlaywrightPool.block_assets)
+        pages = PagePool(context, self.max_concurrency)
+
+        async def render(url: str) -> Tuple[str, Optional[str]]:
+            try:
+                async with pages.page() as page:
+                    await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+                    try:
+                        await page.wait_for_selector(_CARD_SELECTOR, timeout=5000)
+                    except Exception:
+                        logger.debug(f"No property cards rendered on {url}")
+                    return url, await page.content()
+            except Exception as e:
+                logger.warning(f"⚠️  Error rendering {url}: {str(e)[:100]}")
+                return url, None
+
+        try:
+            return await asyncio.gather(*(render(url) for url in urls))
+        finally:
+            await pages.close()
+            await PlaywrightPool.close_context(self.source_name)
+
     def parse_listings(self, content: str) -> List[Dict]:
         """
         Parse Zillow listing HTML.
@@ -68,25 +136,31 @@ class ZillowFSBOScraper(BaseScraper):
             List of extracted listings
         """
         listings = []
-        soup = BeautifulSoup(content, 'html.parser')
+        tree = LexborHTMLParser(content)
 
         # Template structure - adapt to actual Zillow HTML
-        listing_cards = soup.find_all('div', class_='property-card')
+        listing_cards = tree.css(_CARD_SELECTOR)
 
         for card in listing_cards:
             try:
                 # Extract address
-                address_element = card.find('address')
+                address_element = card.css_first('address')
                 if not address_element:
                     continue
 
-                address_text = address_element.get_text(strip=True)
+                address_text = address_element.text(strip=True)
                 
                 # Extract listing URL
-                link = card.find('a', class_='property-link')
-                listing_url = link['href'] if link else ''
+                link = card.css_first('a.property-link')
+                listing_url = (link.attributes.get('href') or '') if link else ''
+
+                # Parse address with the layout-specific parser first
+                parsed = self._parse_address(address_text)
+                if parsed:
+                    parsed['listing_url'] = listing_url
+                    listings.append(parsed)
+                    continue
 
-                # Parse address
                 parts = [p.strip() for p in address_text.split(',')]
                 
                 if len(parts) >= 2:
@@ -109,7 +183,7 @@ class ZillowFSBOScraper(BaseScraper):
     def _extract_state(address_text: str) -> str:
         """Extract state abbreviation from address."""
         # Look for state pattern at end of address
-        match = re.search(r'(\w+),\s*(\w+)\s*(\d{5})', address_text)
+        match = _STATE_RE.search(address_text)
         if match:
             return match.group(2)[:2].upper()
         return ''
@@ -3,15 +3,25 @@ SQLite database storage for FSBO listings.
 Handles all database operations for storing and retrieving property data.
 """
 
+import hashlib
 import sqlite3
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 import logging
+import threading
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# One SQL string for single and bulk inserts, so sqlite3's statement cache
+# prepares it once per connection; duplicates hit the hash index and are skipped
+_INSERT_LISTING_SQL = '''
+    INSERT OR IGNORE INTO listings (street, city, state, zip_code,
+                                   listing_url, source_website, listing_hash, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
 
 class FSBODatabase:
     """Manages SQLite database for FSBO property listings."""
@@ -25,22 +35,41 @@ class FSBODatabase:
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived connection, shared across threads one block at a time
+        self._conn = self._connect()
+        self._lock = threading.RLock()
         self._init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database with write-friendly settings."""
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # WAL skips the rollback journal copy, and NORMAL syncs only at
+        # checkpoints instead of on every commit
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA cache_size=-65536')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        return conn
+
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            conn.close()
+        """Context manager for the database connection; commits on success."""
+        with self._lock:
+            conn = self._conn
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Database error: {e}")
+                raise
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
     def _init_database(self) -> None:
         """Create database tables if they don't exist."""
@@ -59,16 +88,20 @@ class FSBODatabase:
                     source_website TEXT NOT NULL,
                     scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    listing_hash TEXT UNIQUE NOT NULL,
+                    listing_hash BLOB UNIQUE NOT NULL,
                     is_exported INTEGER DEFAULT 0,
                     notes TEXT
                 )
             ''')
 
-            # Dedupe index
+            # Dedupe uses the index behind listing_hash UNIQUE; drop the
+            # duplicate one older databases created by hand
+            cursor.execute('DROP INDEX IF EXISTS idx_listing_hash')
+
+            # Unexported/exported listings, newest first, optionally by source
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_listing_hash 
-                ON listings(listing_hash)
+                CREATE INDEX IF NOT EXISTS idx_exported_scraped
+                ON listings(is_exported, scraped_at DESC, source_website)
             ''')
 
             cursor.execute('''
@@ -76,11 +109,27 @@ class FSBODatabase:
                 ON listings(street, city, state, zip_code)
             ''')
 
+            # Per-source counts, and per-source listings by export state,
+            # newest first; supersedes the plain idx_source
+            cursor.execute('DROP INDEX IF EXISTS idx_source')
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_source 
-                ON listings(source_website)
+                CREATE INDEX IF NOT EXISTS idx_source_exported
+                ON listings(source_website, is_exported, scraped_at DESC)
             ''')
 
+            # Databases from before BLAKE2 hashing hold 32-char hex MD5
+            # TEXT hashes; rehash those rows so dedupe keeps matching them
+            rows = cursor.execute(
+                "SELECT id, street, city, state, zip_code FROM listings WHERE typeof(listing_hash) = 'text'"
+            ).fetchall()
+            if rows:
+                cursor.executemany(
+                    'UPDATE listings SET listing_hash = ? WHERE id = ?',
+                    [(self._generate_hash(row['street'], row['city'], row['state'], row['zip_code']), row['id'])
+                     for row in rows]
+                )
+                logger.info(f"Rehashed {len(rows)} listings")
+
             # Scrape history table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS scrape_history (
@@ -97,6 +146,14 @@ class FSBODatabase:
                 )
             ''')
 
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_history_source
+                ON scrape_history(source_website, scrape_start DESC)
+            ''')
+
+            # Refresh planner statistics where they are missing or stale
+            cursor.execute('PRAGMA optimize')
+
             conn.commit()
             logger.info("Database initialized successfully")
 
@@ -120,24 +177,17 @@ class FSBODatabase:
         listing_hash = self._generate_hash(street, city, state, zip_code)
 
         with self.get_connection() as conn:
-            cursor = conn.cursor()
+            cursor = conn.execute(_INSERT_LISTING_SQL, (street, city, state, zip_code, listing_url,
+                                                        source_website, listing_hash, notes))
 
-            try:
-                cursor.execute('''
-                    INSERT INTO listings (street, city, state, zip_code, 
-                                         listing_url, source_website, listing_hash, notes)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (street, city, state, zip_code, listing_url, source_website, 
-                      listing_hash, notes))
-                
-                listing_id = cursor.lastrowid
-                logger.debug(f"Added listing {listing_id}: {street}, {city}, {state}")
-                return listing_id
-
-            except sqlite3.IntegrityError:
+            if cursor.rowcount == 0:
                 logger.debug(f"Duplicate listing skipped: {street}, {city}, {state}")
                 return None
 
+            listing_id = cursor.lastrowid
+            logger.debug(f"Added listing {listing_id}: {street}, {city}, {state}")
+            return listing_id
+
     def bulk_add_listings(self, listings: List[Dict]) -> Tuple[int, int]:
         """
         Add multiple listings at once.
@@ -148,25 +198,24 @@ class FSBODatabase:
         Returns:
             Tuple of (new_count, duplicate_count)
         """
-        new_count = 0
-        duplicate_count = 0
-
-        for listing in listings:
-            result = self.add_listing(
-                street=listing['street'],
-                city=listing['city'],
-                state=listing['state'],
-                zip_code=listing['zip_code'],
-                listing_url=listing.get('listing_url'),
-                source_website=listing['source_website'],
-                notes=listing.get('notes')
-            )
-            
-            if result is not None:
-                new_count += 1
-            else:
-                duplicate_count += 1
+        rows = [
+            (listing['street'], listing['city'], listing['state'], listing['zip_code'],
+             listing.get('listing_url'), listing['source_website'],
+             self._generate_hash(listing['street'], listing['city'],
+                                 listing['state'], listing['zip_code']),
+             listing.get('notes'))
+            for listing in listings
+        ]
+        if not rows:
+            return 0, 0
+
+        # One statement and one commit for the whole batch; duplicates,
+        # including repeats within the batch, are ignored by the hash index
+        with self.get_connection() as conn:
+            new_count = conn.executemany(_INSERT_LISTING_SQL, rows).rowcount
 
+        duplicate_count = len(rows) - new_count
+        logger.debug(f"Bulk added {new_count} listings, skipped {duplicate_count} duplicates")
         return new_count, duplicate_count
 
     def get_listings(self, limit: int = None, offset: int = 0,
@@ -186,19 +235,7 @@ class FSBODatabase:
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
-            query = 'SELECT * FROM listings WHERE 1=1'
-            params = []
-
-            if source:
-                query += ' AND source_website = ?'
-                params.append(source)
-
-            if exported:
-                query += ' AND is_exported = 1'
-            else:
-                query += ' AND is_exported = 0'
-
-            query += ' ORDER BY scraped_at DESC'
+            query, params = self._listings_query('*', source, exported)
 
             if limit:
                 query += f' LIMIT ? OFFSET ?'
@@ -209,6 +246,46 @@ class FSBODatabase:
 
             return [dict(row) for row in rows]
 
+    @staticmethod
+    def _listings_query(columns: str, source: str = None,
+                        exported: bool = False) -> Tuple[str, List]:
+        """
+        Build the listings SELECT shared by get_listings and exports.
+        
+        Args:
+            columns: Column list to select
+            source: Filter by source website
+            exported: Only exported listings
+            
+        Returns:
+            Tuple of (query, params), newest first
+        """
+        query = f'SELECT {columns} FROM listings WHERE 1=1'
+        params = []
+
+        if source:
+            query += ' AND source_website = ?'
+            params.append(source)
+
+        if exported:
+            query += ' AND is_exported = 1'
+        else:
+            query += ' AND is_exported = 0'
+
+        query += ' ORDER BY scraped_at DESC'
+        return query, params
+
+    def _iter_listings(self, fields: List[str], source: str = None,
+                       exported: bool = False) -> Iterator[sqlite3.Row]:
+        """
+        Yield listing rows with only the given fields, one at a time.
+        
+        The connection stays held until the generator is exhausted or closed.
+        """
+        with self.get_connection() as conn:
+            query, params = self._listings_query(', '.join(fields), source, exported)
+            yield from conn.execute(query, params)
+
     def get_listing_count(self, source: str = None) -> int:
         """Get total count of listings."""
         with self.get_connection() as conn:
@@ -224,15 +301,10 @@ class FSBODatabase:
     def mark_as_exported(self, listing_ids: List[int]) -> None:
         """Mark listings as exported."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            for listing_id in listing_ids:
-                cursor.execute(
-                    'UPDATE listings SET is_exported = 1, last_updated = CURRENT_TIMESTAMP WHERE id = ?',
-                    (listing_id,)
-                )
-
-            conn.commit()
+            conn.executemany(
+                'UPDATE listings SET is_exported = 1, last_updated = CURRENT_TIMESTAMP WHERE id = ?',
+                [(listing_id,) for listing_id in listing_ids]
+            )
 
     def record_scrape_session(self, source_website: str, listings_found: int,
                             listings_new: int, listings_duplicates: int,
@@ -304,7 +376,7 @@ class FSBODatabase:
             logger.warning("All data cleared from database")
 
     def export_to_csv(self, output_path: str, source: str = None,
-                     exported_only: bool = False) -> None:
+                     exported_only: bool = False) -> int:
         """
         Export listings to CSV file.
         
@@ -312,37 +384,48 @@ class FSBODatabase:
             output_path: Path to CSV file
             source: Filter by source website
             exported_only: Only export marked listings
+            
+        Returns:
+            Number of rows written (0 if nothing was exported)
         """
         import csv
 
-        listings = self.get_listings(source=source, exported=exported_only)
-
-        if not listings:
-            logger.warning("No listings to export")
-            return
-
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
         # Filter to only include fields we want in CSV
         fieldnames = ['id', 'street', 'city', 'state', 'zip_code', 
                      'listing_url', 'source_website', 'scraped_at']
-        
-        filtered_listings = [
-            {key: listing.get(key, '') for key in fieldnames}
-            for listing in listings
-        ]
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(filtered_listings)
+        # Rows go straight from the cursor to the file
+        rows = self._iter_listings(fieldnames, source=source, exported=exported_only)
+        try:
+            first = next(rows, None)
+            if first is None:
+                logger.warning("No listings to export")
+                return 0
+
+            output_file = Path(output_path)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(output_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerow(first)
+                count = 1
+                for row in rows:
+                    writer.writerow(row)
+                    count += 1
+        finally:
+            rows.close()
 
-        logger.info(f"Exported {len(listings)} listings to {output_path}")
+        logger.info(f"Exported {count} listings to {output_path}")
+        return count
 
     @staticmethod
-    def _generate_hash(street: str, city: str, state: str, zip_code: str) -> str:
-        """Generate unique hash for address deduplication."""
-        import hashlib
-        address_string = f"{street.lower()}{city.lower()}{state.lower()}{zip_code}"
-        return hashlib.md5(address_string.encode()).hexdigest()
+    def _generate_hash(street: str, city: str, state: str, zip_code: str) -> bytes:
+        """Generate unique 16-byte hash for address deduplication."""
+        # Same digest as hashing the joined string, without building it
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(street.lower().encode())
+        digest.update(city.lower().encode())
+        digest.update(state.lower().encode())
+        digest.update(zip_code.encode())
+        return digest.digest()
@@ -2,39 +2,45 @@
 """Test fetching from byowner.com"""
 
 import requests
-from bs4 import BeautifulSoup
-import re
+from selectolax.lexbor import LexborHTMLParser
+
+# Case-insensitive substring match on the class attribute, like the old regex
+_CARD_SELECTOR = ', '.join(
+    f'{tag}[class*={word} i]'
+    for tag in ('article', 'div')
+    for word in ('card', 'listing', 'property')
+)
 
 url = "https://www.byowner.com/miami/florida"
 
-headers = {
+session = requests.Session()
+session.headers.update({
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-}
+})
 
 print(f"Fetching: {url}")
-response = requests.get(url, headers=headers, timeout=10)
+response = session.get(url, timeout=10)
 
 print(f"Status: {response.status_code}")
 print(f"URL: {response.url}")
 
-soup = BeautifulSoup(response.text, 'html.parser')
+tree = LexborHTMLParser(response.text)
 
 # Look for property cards or listings
-cards = soup.find_all(['article', 'div'], class_=re.compile('card|listing|property', re.I))
+cards = tree.css(_CARD_SELECTOR)
 
 print(f"\nFound {len(cards)} property cards")
 
 # Look for links to individual properties
-import re
-property_links = soup.find_all('a', href=re.compile(r'/property/', re.I))
+property_links = tree.css('a[href*="/property/" i]')
 
 print(f"Found {len(property_links)} property links")
 for link in property_links[:10]:
-    href = link.get('href', '')
-    text = link.get_text(strip=True)
+    href = link.attributes.get('href') or ''
+    text = link.text(strip=True)
     print(f"  {href[:80]}")
     print(f"    Text: {text[:60]}")
 
 # Print first 2000 chars
 print(f"\nFirst 1500 chars of body:")
-print(soup.get_text()[:1500])
+print((tree.body or tree.root).text()[:1500])
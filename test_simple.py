@@ -1,39 +1,85 @@
 #!/usr/bin/env python
 """Direct test of fetching and parsing one page."""
 
+import orjson
 import requests
 from bs4 import BeautifulSoup
 import re
 
+_ADDR_RE = re.compile(
+    r'(\d+\s+[A-Za-z0-9\s\.\#\-]+?)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})\s*(\d{5})'
+)
+
 url = "https://fsbo.com/listings/listings/show/id/546971/"
 
+session = requests.Session()
+
 print(f"Fetching: {url}")
-response = requests.get(url, timeout=10)
+response = session.get(url, timeout=10)
 print(f"Status: {response.status_code}\n")
 
-soup = BeautifulSoup(response.text, 'html.parser')
+soup = BeautifulSoup(response.text, 'lxml')
+
+
+def find_json_ld_address(soup):
+    """Return the first PostalAddress-style dict in the page's JSON-LD, if any."""
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = orjson.loads(script.get_text())
+        except orjson.JSONDecodeError:
+            continue
+        stack = [data]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(item)
+            elif isinstance(item, dict):
+                address = item.get('address')
+                if isinstance(address, dict) and address.get('streetAddress'):
+                    return address
+                stack.extend(item.values())
+    return None
+
+
+def print_address(source, street, city, state, zip_code):
+    print(f"Found address via {source}:")
+    print(f"  Street: {street.strip()}")
+    print(f"  City: {city.strip()}")
+    print(f"  State: {state.strip()}")
+    print(f"  ZIP: {zip_code.strip()}")
+
 
 # Look for breadcrumb
 breadcrumb = soup.find('div', class_='breadcrumbs')
+breadcrumb_text = breadcrumb.get_text(' ', strip=True) if breadcrumb else ''
 if breadcrumb:
     print("Found breadcrumb:")
     print(f"  {breadcrumb.get_text(strip=True)[:200]}")
     print()
 
-# Look for address patterns
-body_text = soup.get_text()
-address_match = re.search(
-    r'(\d+\s+[A-Za-z0-9\s\.\#\-]+?)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})\s*(\d{5})',
-    body_text
-)
+# Structured data first, then the breadcrumb, and only then the main content
+json_ld_address = find_json_ld_address(soup)
+address_match = None if json_ld_address else _ADDR_RE.search(breadcrumb_text)
 
-if address_match:
-    print("Found address via regex:")
-    print(f"  Street: {address_match.group(1).strip()}")
-    print(f"  City: {address_match.group(2).strip()}")
-    print(f"  State: {address_match.group(3).strip()}")
-    print(f"  ZIP: {address_match.group(4).strip()}")
+if json_ld_address:
+    print_address(
+        'JSON-LD',
+        str(json_ld_address.get('streetAddress', '')),
+        str(json_ld_address.get('addressLocality', '')),
+        str(json_ld_address.get('addressRegion', '')),
+        str(json_ld_address.get('postalCode', '')),
+    )
+elif address_match:
+    print_address('breadcrumb', *address_match.groups())
 else:
-    print("No address match found")
-    print("\nFirst 500 chars of body text:")
-    print(body_text[:500])
+    # Search the main content, skipping nav and footer
+    main = soup.select_one('main') or soup
+    body_text = main.get_text(' ', strip=True)
+    address_match = _ADDR_RE.search(body_text)
+
+    if address_match:
+        print_address('regex', *address_match.groups())
+    else:
+        print("No address match found")
+        print("\nFirst 500 chars of body text:")
+        print(body_text[:500])
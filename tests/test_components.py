@@ -3,9 +3,17 @@ Unit tests for FSBO Scraper components.
 """
 
 import unittest
+import json
+import tempfile
+from pathlib import Path
+from config import SiteConfig
 from utils.address_normalizer import AddressNormalizer
-from utils.rate_limiter import RateLimiter
+from utils.rate_limiter import RateLimiter, RetryConfig, TokenBucket, retry_with_backoff
 from utils.user_agents import UserAgentRotator
+from parsers.html_parser import HTMLParser, AddressParser
+from scrapers.base_scraper import DiskHTMLCache, PagePool
+from scrapers.beycome_com import BeycomeScraper
+from storage.database import FSBODatabase
 
 
 class TestAddressNormalizer(unittest.TestCase):
@@ -66,6 +74,18 @@ class TestAddressNormalizer(unittest.TestCase):
         )
         self.assertEqual(result, "62701")
 
+    def test_extract_zip_leftmost(self):
+        """Test the first ZIP-shaped number wins, as with a regex search."""
+        self.assertEqual(
+            AddressNormalizer.extract_zip_from_string("12345 Main St, Springfield, IL 62701"),
+            "12345"
+        )
+        self.assertEqual(AddressNormalizer.extract_zip_from_string("x 62701-12345"), "62701")
+        self.assertEqual(
+            AddressNormalizer.extract_zip_from_string("123 Main St, Springfield, IL 62701-1234"),
+            "62701-1234"
+        )
+
     def test_format_mailing_label(self):
         """Test mailing label formatting."""
         addr = {
@@ -95,12 +115,49 @@ class TestRateLimiter(unittest.TestCase):
         import time
         limiter = RateLimiter(min_delay=0.1, max_delay=0.2, jitter=False)
         
+        start = time.time()
+        limiter.wait()
+        self.assertLess(time.time() - start, 0.05)
+
         start = time.time()
         limiter.wait()
         elapsed = time.time() - start
         
         self.assertGreaterEqual(elapsed, 0.09)
 
+    def test_retry_skips_non_retryable_errors(self):
+        """Test that errors outside retry_on_exception are raised at once."""
+        calls = []
+
+        @retry_with_backoff(RetryConfig(max_retries=3))
+        def parse():
+            calls.append(1)
+            raise ValueError("bad page")
+
+        with self.assertRaises(ValueError):
+            parse()
+        self.assertEqual(len(calls), 1)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test async token-bucket rate limiting."""
+
+    def test_burst_then_steady_rate(self):
+        """Test a full bucket allows a burst, then refills at the set rate."""
+        import asyncio
+        import time
+        bucket = TokenBucket(rate=20, max_tokens=2)
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.wait_for_token() for _ in range(4)))
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(run())
+        # Two tokens are free; the other two need ~0.05s each to refill
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertLess(elapsed, 0.5)
+
 
 class TestUserAgentRotator(unittest.TestCase):
     """Test user agent rotation."""
@@ -122,6 +179,10 @@ class TestUserAgentRotator(unittest.TestCase):
         self.assertIn('Accept', headers)
         self.assertIn('Accept-Language', headers)
 
+        # Each call gets its own copy
+        headers['Accept'] = 'changed'
+        self.assertNotEqual(rotator.get_headers()['Accept'], 'changed')
+
     def test_current_user_agent(self):
         """Test tracking current user agent."""
         rotator = UserAgentRotator()
@@ -132,5 +193,322 @@ class TestUserAgentRotator(unittest.TestCase):
         self.assertEqual(ua1, ua2)
 
 
+class TestHTMLParser(unittest.TestCase):
+    """Test HTML extraction helpers."""
+
+    HTML = (
+        '<html><body><h1 class="title">123 Main St</h1>'
+        '<a class="link" href="/listing/1">One</a>'
+        '<a class="link" href="/listing/2">Two</a>'
+        '</body></html>'
+    )
+
+    def test_extract_text_by_css(self):
+        """Test single element text extraction."""
+        result = HTMLParser.extract_text_by_css(self.HTML, 'h1.title')
+        self.assertEqual(result, '123 Main St')
+
+        result = HTMLParser.extract_text_by_css(self.HTML, 'h2')
+        self.assertIsNone(result)
+
+    def test_extract_multiple_and_attribute(self):
+        """Test multi-element and attribute extraction."""
+        result = HTMLParser.extract_multiple_by_css(self.HTML, 'a.link')
+        self.assertEqual(result, ['One', 'Two'])
+
+        result = HTMLParser.extract_attribute(self.HTML, 'a.link', 'href')
+        self.assertEqual(result, '/listing/1')
+
+    def test_extract_json_ld(self):
+        """Test JSON-LD extraction."""
+        html = '<html><script type="application/ld+json">{"@type": "House"}</script></html>'
+        self.assertEqual(HTMLParser.extract_json_ld(html), {'@type': 'House'})
+        self.assertIsNone(HTMLParser.extract_json_ld(self.HTML))
+
+    def test_extract_all_json_ld(self):
+        """Test multiple JSON-LD blocks are all returned, skipping bad ones."""
+        html = (
+            '<html><head>'
+            '<script type="application/ld+json">{"a": 1}</script>'
+            '<script type="application/ld+json">not json</script>'
+            '<script type="application/ld+json">[{"b": 2}]</script>'
+            '</head></html>'
+        )
+        self.assertEqual(HTMLParser.extract_all_json_ld(html), [{'a': 1}, [{'b': 2}]])
+        self.assertEqual(HTMLParser.extract_all_json_ld(''), [])
+
+    def test_select_each(self):
+        """Test one traversal gives the same groups as a select() per selector."""
+        soup = HTMLParser.get_soup(
+            '<div class="listing"><span class="address">12 Main St</span></div>'
+            '<address class="listing">9 Oak Ave</address>'
+        )
+        selectors = ['address', '[class*="listing"]', 'li']
+        self.assertEqual(HTMLParser.select_each(soup, selectors),
+                         [soup.select(s) for s in selectors])
+
+    def test_soup_is_reused(self):
+        """Test that the same page is only parsed once."""
+        self.assertIs(HTMLParser.get_soup(self.HTML), HTMLParser.get_soup(self.HTML))
+
+
+class TestAddressParser(unittest.TestCase):
+    """Test address line parsing."""
+
+    def test_parse_address_line(self):
+        """Test splitting a single-line address."""
+        result = AddressParser.parse_address_line("123 Main St, Springfield, IL 62701")
+        self.assertEqual(result['street'], '123 Main St')
+        self.assertEqual(result['city'], 'Springfield')
+        self.assertEqual(result['state'], 'IL')
+        self.assertEqual(result['zip_code'], '62701')
+
+    def test_parse_address_line_ignores_directionals(self):
+        """Test capitalized non-state tokens are not taken as the state."""
+        result = AddressParser.parse_address_line("500 Main St, NW Denver, CO 80202")
+        self.assertEqual(result['state'], 'CO')
+        self.assertEqual(result['city'], 'NW Denver')
+
+    def test_compile_layout(self):
+        """Test layout-specialized parsers."""
+        parse = AddressParser.compile_layout('street,city state zip_code')
+        self.assertEqual(
+            parse("12 Elm St, Salt Lake City UT 84101"),
+            {'street': '12 Elm St', 'city': 'Salt Lake City', 'state': 'UT', 'zip_code': '84101'}
+        )
+        self.assertIsNone(parse("no commas here"))
+        self.assertIsNone(parse("12 Elm St, Salt Lake City XX 84101"))
+
+        parse = AddressParser.compile_layout('street,city,state zip_code')
+        self.assertIsNone(parse("123 Main St, Apt 4, Springfield, IL 62701"))
+        self.assertIsNone(parse("123 Main St, Springfield, IL 62701, USA"))
+        self.assertIsNone(parse("123 Main St, Springfield, IL 627011"))
+
+        with self.assertRaises(ValueError):
+            AddressParser.compile_layout('street,county')
+
+    def test_find_addresses(self):
+        """Test scanning a block of text for addresses."""
+        text = "Open house\n123 Main St, Springfield, IL 62701\nCall now\n9 Oak Ave | Denver, CO 80202"
+        result = AddressParser.find_addresses(text)
+        self.assertEqual([a['street'] for a in result], ['123 Main St', '9 Oak Ave'])
+        self.assertEqual(result[1]['city'], 'Denver')
+        self.assertEqual(len(AddressParser.find_addresses(text, limit=1)), 1)
+
+    def test_is_likely_address(self):
+        """Test address detection."""
+        self.assertTrue(AddressParser.is_likely_address("123 Main St, Springfield, IL 62701"))
+        self.assertFalse(AddressParser.is_likely_address("Call us today"))
+
+    def test_extract_by_regex(self):
+        """Test regex extraction with and without groups."""
+        self.assertEqual(HTMLParser.extract_by_regex("id: 546971", r'id: (\d+)'), '546971')
+        self.assertEqual(HTMLParser.extract_by_regex("id: 546971", r'\d+'), '546971')
+        self.assertIsNone(HTMLParser.extract_by_regex("none", r'\d+'))
+
+
+class TestSiteConfig(unittest.TestCase):
+    """Test site configuration loading."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.config_path = Path(self.tmpdir.name) / 'sites.json'
+        self.config_path.write_text(json.dumps({
+            'sites': [
+                {'name': 'A', 'scraper': 'site_a', 'enabled': True},
+                {'name': 'B', 'scraper': 'site_b', 'enabled': False},
+            ]
+        }))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_lazy_load(self):
+        """Test config is only read on first access."""
+        config = SiteConfig(str(self.config_path))
+        self.assertIsNone(config._sites)
+        self.assertEqual(len(config.sites['sites']), 2)
+
+    def test_get_site(self):
+        """Test site lookup by scraper name."""
+        config = SiteConfig(str(self.config_path))
+        self.assertEqual(config.get_site('site_a')['name'], 'A')
+        self.assertIsNone(config.get_site('missing'))
+        self.assertTrue(config.is_site_enabled('site_a'))
+        self.assertFalse(config.is_site_enabled('site_b'))
+        self.assertFalse(config.is_site_enabled('missing'))
+
+    def test_config_cache(self):
+        """Test unchanged files are served from cache and edits are picked up."""
+        first = SiteConfig(str(self.config_path)).sites
+        self.assertIs(SiteConfig(str(self.config_path)).sites, first)
+
+        self.config_path.write_text(json.dumps({'sites': [{'name': 'C', 'scraper': 'site_c'}]}))
+        config = SiteConfig(str(self.config_path))
+        self.assertEqual(config.get_site('site_c')['name'], 'C')
+
+    def test_invalid_config_uses_defaults(self):
+        """Test a config that fails schema validation falls back to defaults."""
+        self.config_path.write_text(json.dumps({'sites': [{'name': 'No scraper key'}]}))
+        config = SiteConfig(str(self.config_path))
+        self.assertEqual(config.sites, SiteConfig._get_default_config())
+
+    def test_save_round_trip(self):
+        """Test saving preserves the loaded config."""
+        SiteConfig(str(self.config_path)).save_config()
+        config = SiteConfig(str(self.config_path))
+        self.assertEqual(config.get_site('site_b')['name'], 'B')
+
+
+
+class TestBeycomeFeed(unittest.TestCase):
+    """Test listing extraction from captured Beycome JSON responses."""
+
+    def test_listings_from_feed(self):
+        """Test nested and schema.org-style address objects are found."""
+        scraper = BeycomeScraper(max_listings=5)
+        feed = [
+            {'results': [
+                {'id': 1, 'streetAddress': '12 Main St', 'city': 'Detroit',
+                 'state': 'MI', 'zipCode': 48201, 'url': '/listing/12-main'},
+                {'address': {'addressLine1': '9 Oak Ave', 'addressLocality': 'Troy',
+                             'addressRegion': 'MI', 'postalCode': '48083'}},
+                {'streetAddress': '1 Incomplete Rd', 'city': 'Detroit'},
+            ]},
+            {'filters': ['price', 'beds']},
+        ]
+
+        listings = scraper._listings_from_feed(feed)
+        scraper.close()
+
+        self.assertEqual(len(listings), 2)
+        self.assertEqual(listings[0]['zip_code'], '48201')
+        self.assertEqual(listings[0]['listing_url'], 'https://www.beycome.com/listing/12-main')
+        self.assertEqual(listings[1]['street'], '9 Oak Ave')
+        self.assertEqual(listings[1]['listing_url'], '')
+
+
+
+class TestDiskHTMLCache(unittest.TestCase):
+    """Test the on-disk rendered page cache."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip_and_expiry(self):
+        """Test fresh entries are returned and stale ones are not."""
+        cache = DiskHTMLCache(self.tmpdir.name, enabled=True)
+        url = 'https://example.com/listings?page=1'
+        self.assertIsNone(cache.get(url))
+
+        cache.put(url, '<html>cached</html>')
+        self.assertEqual(cache.get(url), '<html>cached</html>')
+        self.assertIsNone(cache.get(url, max_age_s=-1))
+
+    def test_disabled(self):
+        """Test a disabled cache neither stores nor returns pages."""
+        cache = DiskHTMLCache(self.tmpdir.name, enabled=False)
+        cache.put('https://example.com', '<html></html>')
+        self.assertIsNone(cache.get('https://example.com'))
+        self.assertEqual(list(Path(self.tmpdir.name).iterdir()), [])
+
+
+class TestPagePool(unittest.TestCase):
+    """Test Playwright page reuse."""
+
+    class FakePage:
+        def __init__(self):
+            self.closed = False
+
+        async def close(self):
+            self.closed = True
+
+    class FakeContext:
+        def __init__(self):
+            self.opened = []
+
+        async def new_page(self):
+            page = TestPagePool.FakePage()
+            self.opened.append(page)
+            return page
+
+    def test_pages_are_reused_and_bounded(self):
+        """Test pages are handed back, capped at size, and dropped on error."""
+        import asyncio
+        context = self.FakeContext()
+        pool = PagePool(context, size=2)
+
+        async def use():
+            async with pool.page():
+                await asyncio.sleep(0.01)
+
+        async def fail():
+            async with pool.page():
+                raise RuntimeError('navigation crashed')
+
+        async def run():
+            await asyncio.gather(*(use() for _ in range(6)))
+            with self.assertRaises(RuntimeError):
+                await fail()
+            self.assertEqual(sum(page.closed for page in context.opened), 1)
+            await use()
+            await pool.close()
+
+        asyncio.run(run())
+        self.assertEqual(len(context.opened), 2)
+        self.assertTrue(all(page.closed for page in context.opened))
+
+    def test_failing_pages_do_not_starve_waiters(self):
+        """Test callers still get pages after every borrowed page raised."""
+        import asyncio
+        context = self.FakeContext()
+        pool = PagePool(context, size=2)
+
+        async def fail():
+            try:
+                async with pool.page():
+                    await asyncio.sleep(0.01)
+                    raise RuntimeError('navigation timed out')
+            except RuntimeError:
+                return False
+
+        async def run():
+            results = await asyncio.wait_for(
+                asyncio.gather(*(fail() for _ in range(6))), timeout=5
+            )
+            await pool.close()
+            return results
+
+        self.assertEqual(asyncio.run(run()), [False] * 6)
+        self.assertEqual(len(context.opened), 6)
+        self.assertTrue(all(page.closed for page in context.opened))
+
+
+class TestFSBODatabase(unittest.TestCase):
+    """Test listing storage."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = FSBODatabase(str(Path(self.tmpdir.name) / 'listings.db'))
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_bulk_add_counts_duplicates(self):
+        """Test duplicates within a batch and against stored rows are skipped."""
+        listings = [
+            {'street': street, 'city': 'Austin', 'state': 'TX',
+             'zip_code': '78701', 'source_website': 'Test'}
+            for street in ('1 Main St', '2 Oak Ave', '2 OAK AVE', '3 Elm St')
+        ]
+        self.assertEqual(self.db.bulk_add_listings(listings), (3, 1))
+        self.assertEqual(self.db.bulk_add_listings(listings[:2]), (0, 2))
+        self.assertEqual(self.db.get_listing_count(), 3)
+
+
 if __name__ == '__main__':
     unittest.main()
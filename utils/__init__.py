@@ -3,7 +3,7 @@ Initialization file for utils package.
 """
 
 from .address_normalizer import AddressNormalizer
-from .rate_limiter import RateLimiter, RetryConfig, RequestThrottler
+from .rate_limiter import RateLimiter, RetryConfig, RequestThrottler, TokenBucket
 from .user_agents import UserAgentRotator
 from .logger import setup_logging, logger
 
@@ -12,6 +12,7 @@ __all__ = [
     'RateLimiter',
     'RetryConfig',
     'RequestThrottler',
+    'TokenBucket',
     'UserAgentRotator',
     'setup_logging',
     'logger',
@@ -4,14 +4,21 @@ Handles standardization of addresses to meet Thanks.io requirements.
 """
 
 import re
+from types import MappingProxyType
 from typing import Dict, Optional, Tuple
 
+_NON_DIGIT_RE = re.compile(r'\D')
+# str.translate table deleting every non-digit ASCII character
+_ASCII_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+_ZIP_RE = re.compile(r'\b(\d{5})(?:-(\d{4}))?\b')
+_FIVE_DIGITS_RE = re.compile(r'\d{5}')
+
 
 class AddressNormalizer:
     """Normalizes and standardizes addresses for USPS compatibility."""
 
     # State abbreviations mapping
-    STATE_ABBREV = {
+    STATE_ABBREV = MappingProxyType({
         'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
         'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
         'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
@@ -25,19 +32,36 @@ class AddressNormalizer:
         'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
         'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
         'wisconsin': 'WI', 'wyoming': 'WY', 'district of columbia': 'DC'
-    }
+    })
+
+    # Valid 2-letter postal codes, for O(1) membership checks
+    STATE_CODES = frozenset(STATE_ABBREV.values())
 
     # Common street type abbreviations
     STREET_TYPES = {
         'street': 'St', 'st': 'St', 'avenue': 'Ave', 'ave': 'Ave',
         'road': 'Rd', 'rd': 'Rd', 'drive': 'Dr', 'dr': 'Dr',
         'boulevard': 'Blvd', 'blvd': 'Blvd', 'court': 'Ct', 'ct': 'Ct',
-        'lane': 'Ln', 'ln': 'Ln', 'way': 'Way', 'way': 'Way',
+        'lane': 'Ln', 'ln': 'Ln', 'way': 'Way',
         'circle': 'Cir', 'cir': 'Cir', 'trail': 'Trl', 'trl': 'Trl',
         'parkway': 'Pkwy', 'pkwy': 'Pkwy', 'plaza': 'Plz', 'plz': 'Plz',
         'terrace': 'Ter', 'ter': 'Ter', 'highway': 'Hwy', 'hwy': 'Hwy',
     }
 
+    # Compass direction abbreviations
+    DIRECTIONS = {
+        'north': 'N', 'south': 'S', 'east': 'E', 'west': 'W',
+        'northeast': 'NE', 'northwest': 'NW', 'southeast': 'SE', 'southwest': 'SW',
+    }
+
+    # Every word normalize_street abbreviates, matched in one whole-word
+    # alternation (longest first) and looked up by its lowercase form
+    _STREET_TOKENS = {**STREET_TYPES, **DIRECTIONS}
+    _STREET_TOKEN_RE = re.compile(
+        r'\b(' + '|'.join(map(re.escape, sorted(_STREET_TOKENS, key=len, reverse=True))) + r')\b',
+        re.IGNORECASE,
+    )
+
     @classmethod
     def normalize_address(cls, street: str, city: str, state: str, 
                          zip_code: str) -> Dict[str, str]:
@@ -72,14 +96,8 @@ class AddressNormalizer:
         # Capitalize words
         street = street.title()
         
-        # Standardize direction prefixes
-        street = re.sub(r'\b(North|South|East|West|Northeast|Northwest|Southeast|Southwest)\b',
-                       lambda m: m.group(1)[:1], street)
-        
-        # Standardize street types
-        for full, abbrev in cls.STREET_TYPES.items():
-            pattern = rf'\b{full}\b'
-            street = re.sub(pattern, abbrev, street, flags=re.IGNORECASE)
+        # Standardize directions and street types
+        street = cls._STREET_TOKEN_RE.sub(lambda m: cls._STREET_TOKENS[m.group(1).lower()], street)
         
         return street.strip()
 
@@ -99,17 +117,15 @@ class AddressNormalizer:
         if not state:
             return ""
         
-        state = state.strip().lower()
+        state = state.strip()
+        code = state.upper()
         
-        # Already abbreviated
-        if len(state) == 2 and state.isupper():
-            return state.upper()
+        # Already abbreviated, in any case
+        if len(code) == 2 and code in cls.STATE_CODES:
+            return code
         
         # Look up in mapping
-        if state in cls.STATE_ABBREV:
-            return cls.STATE_ABBREV[state]
-        
-        return state.upper()
+        return cls.STATE_ABBREV.get(state.lower(), code)
 
     @classmethod
     def normalize_zip(cls, zip_code: str) -> str:
@@ -117,8 +133,11 @@ class AddressNormalizer:
         if not zip_code:
             return ""
         
-        # Remove non-digits
-        digits = re.sub(r'\D', '', zip_code)
+        # Remove non-digits; the regex only handles the rare non-ASCII input
+        if zip_code.isascii():
+            digits = zip_code.translate(_ASCII_NON_DIGITS)
+        else:
+            digits = _NON_DIGIT_RE.sub('', zip_code)
         
         # Return 5 or 9 digit format
         if len(digits) >= 9:
@@ -146,5 +165,18 @@ class AddressNormalizer:
     @classmethod
     def extract_zip_from_string(cls, text: str) -> Optional[str]:
         """Extract ZIP code from text."""
-        match = re.search(r'\b(\d{5})(?:-(\d{4}))?\b', text)
+        # Fast path: scraped addresses almost always end with the ZIP (or ZIP+4).
+        # Only taken when nothing earlier could be the regex's leftmost match
+        tail = text.rstrip()
+        if tail[-10:-5].isdigit() and tail[-5:-4] == '-' and tail[-4:].isdigit():
+            candidate = tail[-10:]
+        else:
+            candidate = tail[-5:]
+        if len(candidate) >= 5 and candidate[:5].isdigit() and candidate.isascii():
+            prefix = tail[:-len(candidate)]
+            before = prefix[-1:]
+            if not (before.isalnum() or before == '_') and not _FIVE_DIGITS_RE.search(prefix):
+                return candidate
+
+        match = _ZIP_RE.search(text)
         return match.group(0) if match else None
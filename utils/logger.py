@@ -4,9 +4,43 @@ Logging configuration for the FSBO scraper.
 
 import logging
 import logging.handlers
+import os
 from pathlib import Path
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that builds each second's timestamp string only once.
+    
+    The date format has one-second resolution, so records logged in the
+    same second reuse the cached string instead of calling strftime.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        if not datefmt:
+            # The default format appends milliseconds
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached = self._cached_time
+        if cached[0] != second:
+            cached = (second, super().formatTime(record, datefmt))
+            self._cached_time = cached
+        return cached[1]
+
+
+def _has_file_handler(logger: logging.Logger, log_file: str) -> bool:
+    """Check whether logger already writes to log_file."""
+    path = os.path.abspath(log_file)
+    return any(
+        isinstance(handler, logging.FileHandler) and handler.baseFilename == path
+        for handler in logger.handlers
+    )
+
+
 def setup_logging(log_level: str = 'INFO', log_file: str = None) -> logging.Logger:
     """
     Configure logging for the application.
@@ -18,23 +52,33 @@ def setup_logging(log_level: str = 'INFO', log_file: str = None) -> logging.Logg
     Returns:
         Configured logger instance
     """
+    level = getattr(logging, log_level.upper())
     logger = logging.getLogger('fsbo_scraper')
-    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.setLevel(level)
+    # Handlers live here; letting records reach the root logger too would print them twice
+    logger.propagate = False
 
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
+    if logger.handlers:
+        # Already configured (the module sets up a default logger on import):
+        # update the level instead of stacking duplicate handlers
+        for handler in logger.handlers:
+            handler.setLevel(level)
+        formatter = logger.handlers[0].formatter
+    else:
+        # Console handler
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(level)
 
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+        # Formatter
+        formatter = _CachedTimeFormatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
 
     # File handler (optional)
-    if log_file:
+    if log_file and not _has_file_handler(logger, log_file):
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -43,7 +87,7 @@ def setup_logging(log_level: str = 'INFO', log_file: str = None) -> logging.Logg
             maxBytes=10485760,  # 10MB
             backupCount=5
         )
-        file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
 
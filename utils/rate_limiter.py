@@ -2,12 +2,16 @@
 Rate limiting and retry logic for respectful web scraping.
 """
 
+import asyncio
 import time
 import random
+from collections import defaultdict, deque
 from typing import Callable, Any, TypeVar
 from functools import wraps
 import logging
 
+import requests
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -32,14 +36,21 @@ class RateLimiter:
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.jitter = jitter
-        self.last_request_time = 0
+        # perf_counter() time of the last request; None until the first
+        self.last_request_time = None
+        # Own generator, so threads with their own limiters share no random state
+        self._rng = random.Random()
 
     def wait(self) -> None:
         """Wait appropriate amount before making next request."""
-        elapsed = time.time() - self.last_request_time
+        if self.last_request_time is None:
+            self.last_request_time = time.perf_counter()
+            return
+
+        elapsed = time.perf_counter() - self.last_request_time
         
         if self.jitter:
-            delay = random.uniform(self.min_delay, self.max_delay)
+            delay = self._rng.uniform(self.min_delay, self.max_delay)
         else:
             delay = self.min_delay
 
@@ -48,18 +59,58 @@ class RateLimiter:
             logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
             time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
+        self.last_request_time = time.perf_counter()
 
     def record_request(self) -> None:
         """Record that a request was made."""
-        self.last_request_time = time.time()
+        self.last_request_time = time.perf_counter()
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for asyncio code.
+    
+    Tokens refill continuously at `rate` per second up to `max_tokens`,
+    allowing short bursts while bounding the long-run request rate.
+    Unlike RateLimiter.wait(), waiting never blocks the event loop.
+    """
+
+    def __init__(self, rate: float, max_tokens: float = 1.0):
+        """
+        Initialize token bucket.
+        
+        Args:
+            rate: Tokens added per second (steady-state requests/second)
+            max_tokens: Bucket capacity (largest allowed burst)
+        """
+        self.rate = rate
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add tokens earned since the last update."""
+        now = time.monotonic()
+        self.tokens = min(self.max_tokens, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def wait_for_token(self) -> None:
+        """Wait until a token is available, then consume it."""
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            sleep_time = (1 - self.tokens) / self.rate
+            logger.debug(f"Rate limiting: waiting {sleep_time:.2f}s for token")
+            await asyncio.sleep(sleep_time)
 
 
 class RetryConfig:
     """Configuration for retry logic."""
 
     def __init__(self, max_retries: int = 3, backoff_factor: float = 2.0,
-                 retry_on_status: list = None):
+                 retry_on_status: list = None, retry_on_exception: tuple = None):
         """
         Initialize retry configuration.
         
@@ -67,10 +118,13 @@ class RetryConfig:
             max_retries: Maximum number of retry attempts
             backoff_factor: Multiplier for exponential backoff
             retry_on_status: HTTP status codes to retry on
+            retry_on_exception: Exception types worth retrying; anything
+                else is raised immediately
         """
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.retry_on_status = retry_on_status or [408, 429, 500, 502, 503, 504]
+        self.retry_on_exception = retry_on_exception or (requests.RequestException,)
 
 
 def retry_with_backoff(config: RetryConfig) -> Callable:
@@ -83,6 +137,9 @@ def retry_with_backoff(config: RetryConfig) -> Callable:
     Returns:
         Decorated function with retry logic
     """
+    # Backoff before each retry, computed once per decorated function
+    wait_times = tuple(config.backoff_factor ** attempt for attempt in range(config.max_retries))
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
@@ -91,11 +148,15 @@ def retry_with_backoff(config: RetryConfig) -> Callable:
             for attempt in range(config.max_retries + 1):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except config.retry_on_exception as e:
+                    # Client errors such as 404 will not succeed on retry
+                    response = getattr(e, 'response', None)
+                    if response is not None and response.status_code not in config.retry_on_status:
+                        raise
                     last_exception = e
                     
                     if attempt < config.max_retries:
-                        wait_time = config.backoff_factor ** attempt
+                        wait_time = wait_times[attempt]
                         logger.warning(
                             f"{func.__name__} failed (attempt {attempt + 1}/"
                             f"{config.max_retries + 1}). Retrying in {wait_time}s..."
@@ -124,40 +185,29 @@ class RequestThrottler:
             max_requests_per_minute: Max requests per domain per minute
         """
         self.max_requests_per_minute = max_requests_per_minute
-        self.request_times = {}
+        self.request_times = defaultdict(deque)
 
-    def should_throttle(self, domain: str) -> bool:
-        """Check if domain is being accessed too frequently."""
-        now = time.time()
+    def _recent_requests(self, domain: str, now: float) -> deque:
+        """Drop timestamps outside the 60-second window and return the rest."""
+        times = self.request_times[domain]
         cutoff = now - 60  # 1 minute window
+        while times and times[0] <= cutoff:
+            times.popleft()
+        return times
 
-        if domain not in self.request_times:
-            self.request_times[domain] = []
-
-        # Remove old requests outside the window
-        self.request_times[domain] = [
-            t for t in self.request_times[domain] if t > cutoff
-        ]
-
-        return len(self.request_times[domain]) >= self.max_requests_per_minute
+    def should_throttle(self, domain: str) -> bool:
+        """Check if domain is being accessed too frequently."""
+        return len(self._recent_requests(domain, time.time())) >= self.max_requests_per_minute
 
     def record_request(self, domain: str) -> None:
         """Record a request for a domain."""
-        if domain not in self.request_times:
-            self.request_times[domain] = []
-        
         self.request_times[domain].append(time.time())
 
     def get_wait_time(self, domain: str) -> float:
         """Get how long to wait before next request for domain."""
         now = time.time()
-        cutoff = now - 60
+        recent_requests = self._recent_requests(domain, now)
 
-        if domain not in self.request_times or not self.request_times[domain]:
-            return 0
-
-        recent_requests = [t for t in self.request_times[domain] if t > cutoff]
-        
         if len(recent_requests) < self.max_requests_per_minute:
             return 0
 
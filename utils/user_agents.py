@@ -4,14 +4,41 @@ Provides realistic browser headers to avoid detection as bot.
 """
 
 import random
+from types import MappingProxyType
 from typing import Dict
 
+# Only advertise Brotli when a decoder is installed for requests/aiohttp to use
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = 'br, gzip, deflate'
+    except ImportError:
+        _ACCEPT_ENCODING = 'gzip, deflate'
+
+# Browser headers sent alongside the rotating User-Agent; read-only, since
+# every request's headers are copied from it
+_BASE_HEADERS = MappingProxyType({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0',
+})
+
 
 class UserAgentRotator:
     """Manages rotation of User-Agent headers."""
 
     # Real browser user agents for realistic requests
-    USER_AGENTS = [
+    USER_AGENTS = (
         # Chrome
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -24,15 +51,17 @@ class UserAgentRotator:
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
         # Edge
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
-    ]
+    )
 
     def __init__(self):
         """Initialize User-Agent rotator."""
         self.current_agent = None
+        # Own generator, so threads with their own rotators share no random state
+        self._rng = random.Random()
 
     def get_random_user_agent(self) -> str:
         """Get a random user agent string."""
-        return random.choice(self.USER_AGENTS)
+        return self._rng.choice(self.USER_AGENTS)
 
     def get_headers(self) -> Dict[str, str]:
         """
@@ -44,19 +73,9 @@ class UserAgentRotator:
         user_agent = self.get_random_user_agent()
         self.current_agent = user_agent
 
-        return {
-            'User-Agent': user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0',
-        }
+        headers = dict(_BASE_HEADERS)
+        headers['User-Agent'] = user_agent
+        return headers
 
     def get_current_user_agent(self) -> str:
         """Get the currently active user agent."""